@@ -0,0 +1,85 @@
+"""
+Measure the memory used by a kennel of monsters.
+
+Creates a kennel of monsters, as a new game would, then loads it back
+from its save data, as loading a saved game does, and prints the memory
+allocated by Python for each kennel.
+
+Run from the root folder of the project:
+
+    SDL_VIDEODRIVER=dummy PYTHONPATH=. python scripts/bench_kennel.py
+
+Options:
+    --size: number of monsters in the kennel, 1000 by default
+    --level: level of the monsters, 20 by default
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+import pygame
+
+from tuxemon import prepare
+from tuxemon.db import db
+from tuxemon.monster import Monster
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kennel = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kennel, size, elapsed
+
+
+def report(name, kennel, size, elapsed):
+    print(
+        f"{name}: {len(kennel)} monsters, {size / 1024:.0f} KiB, "
+        f"{size / len(kennel):.0f} bytes per monster, "
+        f"{elapsed * 1000:.0f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--level", type=int, default=20)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode(prepare.SCREEN_SIZE)
+    db.load(validate=False)
+    random.seed(0)
+    slugs = sorted(
+        slug
+        for slug, monster in db.database["monster"].items()
+        if monster.moveset and monster.possible_genders
+    )
+    # warm the shared caches, which are not part of the kennel
+    for slug in slugs:
+        Monster.spawn_base(slug, args.level)
+
+    kennel, size, elapsed = measure(
+        lambda: [
+            Monster.spawn_base(slugs[i % len(slugs)], args.level)
+            for i in range(args.size)
+        ]
+    )
+    report("created", kennel, size, elapsed)
+
+    save_data = [monster.get_state() for monster in kennel]
+    del kennel
+    kennel, size, elapsed = measure(
+        lambda: [Monster(save_data=data) for data in save_data]
+    )
+    report("loaded", kennel, size, elapsed)
+
+
+if __name__ == "__main__":
+    main()
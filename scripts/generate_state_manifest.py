@@ -0,0 +1,39 @@
+"""
+Generate the manifest of the game states, tuxemon/states/manifest.py.
+
+The manifest tells in which module each state is defined, so the game
+only imports a state when it is first used. Run it again after adding,
+renaming or moving a state, from the root folder of the project:
+
+    SDL_VIDEODRIVER=dummy PYTHONPATH=. python scripts/generate_state_manifest.py
+"""
+from tuxemon.constants import paths
+from tuxemon.state import HookManager, StateManager, StateRepository
+
+HEADER = '''\
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Module of each game state, by state name.
+
+Generated by scripts/generate_state_manifest.py, do not edit.
+"""
+from __future__ import annotations
+
+STATES: dict[str, str] = {
+'''
+
+
+def main():
+    manager = StateManager("tuxemon.states", HookManager(), StateRepository())
+    lines = [
+        f'    "{name}": "{module}",\n'
+        for name, module in manager.build_manifest().items()
+    ]
+    path = paths.LIBDIR / "states" / "manifest.py"
+    path.write_text(HEADER + "".join(lines) + "}\n")
+    print(f"Wrote {len(lines)} states to {path}")
+
+
+if __name__ == "__main__":
+    main()
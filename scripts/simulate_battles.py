@@ -0,0 +1,62 @@
+"""
+Simulate many battles between two teams, without graphics.
+
+Plays seeded battles with the headless battle engine, over a pool of
+processes, and prints the win rate of each team, the draws and the
+number of turns the battles lasted.
+
+Run from the root folder of the project:
+
+    SDL_VIDEODRIVER=dummy PYTHONPATH=. python scripts/simulate_battles.py \
+        --team npc_test=bamboon:10,rockitten:9 \
+        --team npc_red=rockitten:10,tux:8
+
+Options:
+    --team: a team, as npc_slug=monster:level,monster:level; give two
+    --battles: number of battles, 1000 by default
+    --seed: seed of the first battle, 0 by default
+    --workers: number of processes, the number of CPUs by default
+    --double: two monsters per side are in play
+    --wild: a wild encounter instead of a trainer battle
+    --techniques: the monsters use techniques instead of riddles
+    --max-turns: turns after which a battle is stopped, 100 by default
+"""
+import argparse
+import logging
+import time
+
+from tuxemon.battle_simulator import BattleSpec, parse_teams, run_batch
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--team", action="append", required=True)
+    parser.add_argument("--battles", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--double", action="store_true")
+    parser.add_argument("--wild", action="store_true")
+    parser.add_argument("--techniques", action="store_true")
+    parser.add_argument("--max-turns", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    spec = BattleSpec(
+        teams=parse_teams(args.team),
+        combat_type="monster" if args.wild else "trainer",
+        battle_mode="double" if args.double else "single",
+        riddles=not args.techniques,
+        max_turns=args.max_turns,
+    )
+    start = time.perf_counter()
+    stats = run_batch(spec, args.battles, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    print(stats.summary())
+    print(
+        f"{elapsed:.1f} s, "
+        f"{elapsed * 1000 / max(stats.battles, 1):.2f} ms per battle"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from tuxemon.battle_simulator import (
+    BattleSpec,
+    BattleStats,
+    TeamSpec,
+    parse_teams,
+    run_batch,
+    simulate_battle,
+)
+from tuxemon.db import db
+from tuxemon.riddle.riddle_manager import riddle_manager
+from tuxemon.session import Session
+from tuxemon.states.combat.combat_engine import (
+    BattleEngine,
+    BattleOutcome,
+    BattleResult,
+)
+
+TEAMS = (
+    TeamSpec("npc_test", (("rockitten", 10), ("bamboon", 9))),
+    TeamSpec("npc_red", (("tux", 10),)),
+)
+
+
+class TestTeamSpec(unittest.TestCase):
+    def test_parse(self):
+        team = TeamSpec.parse("npc_test=rockitten:10,bamboon:9")
+        self.assertEqual(team, TEAMS[0])
+
+    def test_parse_without_npc(self):
+        with self.assertRaises(ValueError):
+            TeamSpec.parse("rockitten:10")
+
+    def test_parse_without_level(self):
+        with self.assertRaises(ValueError):
+            TeamSpec.parse("npc_test=rockitten")
+
+    def test_parse_teams_needs_two(self):
+        with self.assertRaises(ValueError):
+            parse_teams(["npc_test=rockitten:10"])
+
+
+class TestBattleStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = BattleStats()
+
+    def test_empty(self):
+        self.assertEqual(self.stats.battles, 0)
+        self.assertEqual(self.stats.win_rate(0), 0.0)
+
+    def test_add(self):
+        self.stats.add(BattleResult(BattleOutcome.WON, 0, 4, [0]))
+        self.stats.add(BattleResult(BattleOutcome.WON, 1, 6, [1]))
+        self.stats.add(BattleResult(BattleOutcome.TURN_LIMIT, None, 100))
+        self.stats.add(None)
+        self.assertEqual(self.stats.battles, 3)
+        self.assertEqual(self.stats.wins, [1, 1])
+        self.assertEqual(self.stats.outcomes[BattleOutcome.TURN_LIMIT], 1)
+        self.assertEqual(self.stats.errors, 1)
+        self.assertAlmostEqual(self.stats.win_rate(1), 1 / 3)
+        self.assertIn("turns: mean 36.67", self.stats.summary())
+
+
+class TestBattleEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        db.load(validate=False)
+        riddle_manager.reload_riddles()
+
+    def test_needs_two_teams(self):
+        session = Session()
+        with self.assertRaises(ValueError):
+            BattleEngine(session, [TEAMS[0].build(session)])
+
+    def test_battle_has_winner(self):
+        spec = BattleSpec(TEAMS, riddles=False)
+        result = simulate_battle(spec, 1)
+        self.assertIsNotNone(result)
+        self.assertEqual(result.outcome, BattleOutcome.WON)
+        self.assertIn(result.winner, (0, 1))
+        self.assertGreater(result.survivors[result.winner], 0)
+        self.assertEqual(result.survivors[1 - result.winner], 0)
+        self.assertGreater(result.turns, 0)
+
+    def test_turn_limit(self):
+        spec = BattleSpec(TEAMS, riddles=False, max_turns=1)
+        result = simulate_battle(spec, 1)
+        self.assertIsNotNone(result)
+        if result.outcome != BattleOutcome.WON:
+            self.assertEqual(result.outcome, BattleOutcome.TURN_LIMIT)
+            self.assertIsNone(result.winner)
+            self.assertEqual(result.turns, 1)
+
+    def test_seed_replays_battle(self):
+        spec = BattleSpec(TEAMS, battle_mode="double")
+        self.assertEqual(simulate_battle(spec, 7), simulate_battle(spec, 7))
+
+    def test_run_batch(self):
+        spec = BattleSpec(TEAMS)
+        stats = run_batch(spec, 10, seed=3, workers=1)
+        self.assertEqual(stats.battles + stats.errors, 10)
+        self.assertEqual(stats, run_batch(spec, 10, seed=3, workers=1))
@@ -15,7 +15,10 @@ class TestCollisionManager(unittest.TestCase):
 
     def setUp(self):
         self.map_manager = MagicMock(spec=MapManager)
+        self.map_manager.collision_map = {}
+        self.map_manager.surface_map = {}
         self.npc_manager = MagicMock(spec=NPCManager)
+        self.npc_manager.get_all_entities.return_value = []
         self.collision_manager = CollisionManager(
             self.map_manager, self.npc_manager
         )
@@ -123,3 +126,66 @@ class TestCollisionManager(unittest.TestCase):
             (0, 0), "label1"
         )
         self.assertEqual(properties.key, "label1")
+
+    def test_get_collision_map_includes_blocking_surface(self):
+        self.map_manager.surface_map = {(2, 2): {"water": 0.0}}
+        collision_map = self.collision_manager.get_collision_map()
+        self.assertEqual(collision_map[(2, 2)].key, "water")
+
+    def test_get_collision_map_excludes_walkable_surface(self):
+        self.map_manager.surface_map = {(2, 2): {"grass": 1.0}}
+        collision_map = self.collision_manager.get_collision_map()
+        self.assertNotIn((2, 2), collision_map)
+
+    def test_get_collision_map_collision_region_overrides_npc(self):
+        region = RegionProperties([], [], [], None, "label1")
+        self.map_manager.collision_map = {(0, 0): region}
+        npc = MagicMock(spec=Entity)
+        npc.tile_pos = (0, 0)
+        self.npc_manager.get_all_entities.return_value = [npc]
+        collision_map = self.collision_manager.get_collision_map()
+        self.assertEqual(collision_map[(0, 0)], region)
+
+    def test_get_collision_map_includes_npc_position(self):
+        npc = MagicMock(spec=Entity)
+        npc.tile_pos = (3, 4)
+        self.npc_manager.get_all_entities.return_value = [npc]
+        collision_map = self.collision_manager.get_collision_map()
+        self.assertIs(collision_map[(3, 4)].entity, npc)
+
+    def test_add_collision_position_updates_index(self):
+        self.collision_manager.get_collision_map()
+        self.collision_manager.add_collision_position("label1", (5, 5))
+        collision_map = self.collision_manager.get_collision_map()
+        self.assertEqual(collision_map[(5, 5)].key, "label1")
+
+    def test_remove_collision_updates_index(self):
+        region = RegionProperties([], [], [], None, "label1")
+        self.map_manager.collision_map = {(0, 0): region}
+        self.collision_manager.get_collision_map()
+        self.collision_manager.remove_collision((0, 0))
+        collision_map = self.collision_manager.get_collision_map()
+        self.assertNotIn((0, 0), collision_map)
+
+    def test_update_tile_property_blocks_tile(self):
+        self.map_manager.surface_map = {(1, 1): {"label1": 1.0}}
+        prepare.SURFACE_KEYS = ["label1"]
+        self.collision_manager.get_collision_map()
+        self.collision_manager.update_tile_property("label1", 0.0)
+        collision_map = self.collision_manager.get_collision_map()
+        self.assertEqual(collision_map[(1, 1)].key, "label1")
+
+    def test_version_increments_on_change(self):
+        version = self.collision_manager.version
+        self.collision_manager.add_collision_position("label1", (5, 5))
+        self.assertGreater(self.collision_manager.version, version)
+
+    def test_version_unchanged_without_change(self):
+        version = self.collision_manager.version
+        self.collision_manager.get_collision_map()
+        self.assertEqual(self.collision_manager.version, version)
+
+    def test_version_increments_on_new_map(self):
+        version = self.collision_manager.version
+        self.map_manager.collision_map = {}
+        self.assertGreater(self.collision_manager.version, version)
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tuxemon.db import DatabaseCache
+
+
+class TestDatabaseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.config_path = self.temp_dir / "db_config.yaml"
+        self.config_path.write_text("active_mods: [tuxemon]\n")
+        self.table_dir = self.temp_dir / "db" / "item"
+        self.table_dir.mkdir(parents=True)
+        self.entry = self.table_dir / "potion.json"
+        self.entry.write_text('{"slug": "potion"}')
+        self.cache_dir = self.temp_dir / "cache"
+        self.mod_dir = self.temp_dir / "mods" / "tuxemon"
+        self.sprite = self.mod_dir / "gfx" / "potion.png"
+        self.sprite.parent.mkdir(parents=True)
+        self.sprite.write_bytes(b"png")
+        self.po_file = self.mod_dir / "l18n" / "en_US" / "base.po"
+        self.po_file.parent.mkdir(parents=True)
+        self.po_file.write_text('msgid "potion"\nmsgstr "Potion"\n')
+        patcher = patch(
+            "tuxemon.db.get_mod_roots", lambda mod_name: [self.mod_dir]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def make_cache(self):
+        return DatabaseCache(
+            self.cache_dir, str(self.config_path), ["tuxemon"]
+        )
+
+    def store(self, cache):
+        fingerprint = cache.fingerprint([self.table_dir])
+        cache.put("item", fingerprint, {"potion": {}}, {}, True)
+        cache.save()
+        return fingerprint
+
+    def test_missing_snapshot(self):
+        cache = self.make_cache()
+        self.assertEqual(cache.tables, {})
+
+    def test_snapshot_is_restored(self):
+        fingerprint = self.store(self.make_cache())
+        cached = self.make_cache().get("item", fingerprint)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.preloaded, {"potion": {}})
+        self.assertTrue(cached.validated)
+
+    def test_changed_file_changes_fingerprint(self):
+        cache = self.make_cache()
+        fingerprint = cache.fingerprint([self.table_dir])
+        stat = self.entry.stat()
+        os.utime(self.entry, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertNotEqual(fingerprint, cache.fingerprint([self.table_dir]))
+
+    def test_stale_table_is_not_returned(self):
+        self.store(self.make_cache())
+        self.assertIsNone(self.make_cache().get("item", "stale"))
+
+    def test_changed_config_discards_snapshot(self):
+        self.store(self.make_cache())
+        self.config_path.write_text("active_mods: [tuxemon, other]\n")
+        self.assertEqual(self.make_cache().tables, {})
+
+    def test_deleted_resource_discards_snapshot(self):
+        self.store(self.make_cache())
+        self.sprite.unlink()
+        self.assertEqual(self.make_cache().tables, {})
+
+    def test_changed_translation_discards_snapshot(self):
+        self.store(self.make_cache())
+        self.po_file.write_text('msgid "potion"\nmsgstr "Potion!"\n')
+        stat = self.po_file.stat()
+        os.utime(self.po_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertEqual(self.make_cache().tables, {})
+
+    def test_unreadable_snapshot_is_ignored(self):
+        cache = self.make_cache()
+        cache.path.parent.mkdir(parents=True)
+        cache.path.write_bytes(b"not a pickle")
+        self.assertEqual(self.make_cache().tables, {})
+
+    def test_save_without_changes_does_not_write(self):
+        cache = self.make_cache()
+        cache.save()
+        self.assertFalse(cache.path.exists())
@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import json
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from tuxemon.db import config, load_files, read_file
+
+
+class TestLoadFiles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.table_dir = self.temp_dir / "item"
+        self.table_dir.mkdir()
+        for i in range(20):
+            self.write(f"item{i}.json", {"slug": f"item{i}"})
+        self.write("pair.json", [{"slug": "pair_a"}, {"slug": "pair_b"}])
+        (self.table_dir / "broken.json").write_text("{")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name, data):
+        with (self.table_dir / name).open("w") as fp:
+            json.dump(data, fp)
+
+    def test_read_file_invalid(self):
+        self.assertIsNone(read_file(self.table_dir / "broken.json"))
+
+    def test_load_files(self):
+        data = load_files("item", self.temp_dir, config)
+        self.assertEqual(len(data), 22)
+        self.assertEqual(
+            data["pair_b"]["paths"], [self.table_dir / "pair.json"]
+        )
+
+    def test_load_files_with_executor(self):
+        serial = load_files("item", self.temp_dir, config)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            parallel = load_files("item", self.temp_dir, config, executor)
+        self.assertEqual(list(parallel), list(serial))
+        self.assertEqual(parallel, serial)
@@ -44,3 +44,29 @@ class TestActionManager(unittest.TestCase):
         mock_load_plugins.return_value = {}
         actions = self.action_manager.get_actions()
         self.assertGreater(len(actions), 0)
+
+    def test_get_action_returns_new_instances(self):
+        first = self.action_manager.get_action("set_variable", ["a:1"])
+        second = self.action_manager.get_action("set_variable", ["a:1"])
+        self.assertIsNotNone(first)
+        self.assertIsNot(first, second)
+        first.stop()
+        self.assertFalse(second.done)
+
+    def test_compile_action_validates_once(self):
+        action = MagicMock()
+        self.action_manager.actions = {"fake": action}
+        self.action_manager.get_action("fake", ["param"])
+        self.action_manager.get_action("fake", ["param"])
+        action.assert_called_once_with("param")
+
+    def test_compile_action_keeps_invalid_result(self):
+        action = MagicMock(side_effect=TypeError("Test error"))
+        self.action_manager.actions = {"fake": action}
+        self.assertIsNone(self.action_manager.compile_action("fake", ["x"]))
+        self.assertIsNone(self.action_manager.compile_action("fake", ["x"]))
+        action.assert_called_once_with("x")
+
+    def test_compile_action_casts_parameters(self):
+        action = self.action_manager.compile_action("wait", ["2"])
+        self.assertEqual(action.seconds, 2.0)
@@ -23,3 +23,8 @@ class TestConditionManager(unittest.TestCase):
         mock_load_plugins.return_value = mock_conditions
         conditions = self.condition_manager.get_conditions()
         self.assertGreater(len(conditions), 0)
+
+    def test_get_condition_is_shared(self):
+        first = self.condition_manager.get_condition("char_at")
+        second = self.condition_manager.get_condition("char_at")
+        self.assertIs(first, second)
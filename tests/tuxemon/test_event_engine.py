@@ -4,10 +4,14 @@ import unittest
 from unittest.mock import MagicMock
 
 from tuxemon.client import LocalPygameClient
+from tuxemon.event import EventObject, MapAction, MapCondition
 from tuxemon.event.eventaction import ActionManager
-from tuxemon.event.eventcondition import ConditionManager
-from tuxemon.event.eventengine import EventEngine
+from tuxemon.event.eventcondition import ConditionManager, EventCondition
+from tuxemon.event.eventengine import EventDependencyIndex, EventEngine
+from tuxemon.event.eventindex import EventSpatialIndex
+from tuxemon.map import TuxemonMap
 from tuxemon.map_manager import MapManager
+from tuxemon.player import Player
 from tuxemon.session import Session, local_session
 
 
@@ -45,3 +49,144 @@ class TestEventEngine(unittest.TestCase):
         self.eng.session.client.map_manager.inits = []
         self.eng.start_event(event)
         self.assertIn(1, self.eng.running_events)
+
+    def test_set_current_map_compiles_events(self):
+        cond = MapCondition("char_at", ["player"], 0, 0, 1, 1, "is", None)
+        act = MapAction("wait", ["1"], None)
+        event = EventObject(1, "event", 0, 0, 1, 1, [cond], [act])
+        new_map = MagicMock(spec=TuxemonMap)
+        new_map.inits = []
+        new_map.events = [event]
+        self.eng.set_current_map(new_map)
+        self.eng.condition_manager.get_condition.assert_called_once_with(
+            "char_at"
+        )
+        self.eng.action_manager.compile_action.assert_called_once_with(
+            "wait", ["1"]
+        )
+
+
+class TestEventEngineReactive(unittest.TestCase):
+    def setUp(self):
+        self.condition = MagicMock(spec=EventCondition)
+        self.condition.name = "variable_set"
+        self.condition.test.return_value = False
+        self.condition.get_dependencies.return_value = {("variable", "door")}
+        condition_manager = MagicMock(spec=ConditionManager)
+        condition_manager.get_condition.return_value = self.condition
+        action_manager = MagicMock(spec=ActionManager)
+        self.eng = EventEngine(
+            local_session, action_manager, condition_manager
+        )
+        self.eng.reactive = True
+        self.eng.session = MagicMock(spec=Session)
+        self.eng.session.player = MagicMock(spec=Player)
+        self.eng.session.player.game_variables = {"door": "closed"}
+        self.eng.session.client = MagicMock(spec=LocalPygameClient)
+        self.eng.session.client.map_manager = MagicMock(spec=MapManager)
+        self.eng.session.client.map_manager.inits = []
+        cond = MapCondition(
+            "variable_set", ["door:open"], 0, 0, 1, 1, "is", None
+        )
+        self.event = EventObject(1, "door", 0, 0, 1, 1, [cond], [])
+        self.eng.session.client.map_manager.events = [self.event]
+
+    def test_unchanged_condition_is_tested_once(self):
+        self.eng.check_conditions()
+        self.eng.check_conditions()
+        self.assertEqual(self.condition.test.call_count, 1)
+
+    def test_condition_tested_again_after_variable_changed(self):
+        self.eng.check_conditions()
+        self.eng.session.player.game_variables["door"] = "open"
+        self.eng.check_conditions()
+        self.assertEqual(self.condition.test.call_count, 2)
+
+    def test_volatile_condition_is_tested_every_frame(self):
+        self.condition.get_dependencies.return_value = None
+        self.eng.check_conditions()
+        self.eng.check_conditions()
+        self.assertEqual(self.condition.test.call_count, 2)
+
+    def test_satisfied_event_is_started_again_without_retest(self):
+        self.condition.test.return_value = True
+        self.eng.check_conditions()
+        self.assertIn(1, self.eng.running_events)
+        self.eng.running_events.clear()
+        self.eng.check_conditions()
+        self.assertIn(1, self.eng.running_events)
+        self.assertEqual(self.condition.test.call_count, 1)
+
+    def test_new_event_list_is_indexed_again(self):
+        self.eng.check_conditions()
+        self.eng.session.client.map_manager.events = [self.event]
+        self.eng.check_conditions()
+        self.assertEqual(self.condition.test.call_count, 2)
+
+    def test_reset_drops_dependency_index(self):
+        self.eng.check_conditions()
+        self.eng.reset()
+        self.assertIsNone(self.eng.dependency_index)
+
+
+class TestEventDependencyIndex(unittest.TestCase):
+    def setUp(self):
+        self.condition = MagicMock(spec=EventCondition)
+        self.condition_manager = MagicMock(spec=ConditionManager)
+        self.condition_manager.get_condition.return_value = self.condition
+        cond = MapCondition("char_at", ["player"], 0, 0, 1, 1, "is", None)
+        self.event = EventObject(1, "event", 0, 0, 1, 1, [cond], [])
+
+    def test_event_with_undeclared_condition_is_volatile(self):
+        self.condition.get_dependencies.return_value = None
+        index = EventDependencyIndex([self.event], self.condition_manager)
+        self.assertEqual(index.volatile, {0})
+
+    def test_event_with_unknown_condition_is_volatile(self):
+        self.condition_manager.get_condition.return_value = None
+        index = EventDependencyIndex([self.event], self.condition_manager)
+        self.assertEqual(index.volatile, {0})
+
+    def test_event_with_declared_condition_is_indexed(self):
+        self.condition.get_dependencies.return_value = {("position", "player")}
+        index = EventDependencyIndex([self.event], self.condition_manager)
+        self.assertEqual(index.volatile, set())
+
+
+class TestEventEngineSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.condition = MagicMock(spec=EventCondition)
+        self.condition.name = "char_at"
+        self.condition.test.return_value = False
+        condition_manager = MagicMock(spec=ConditionManager)
+        condition_manager.get_condition.return_value = self.condition
+        action_manager = MagicMock(spec=ActionManager)
+        self.eng = EventEngine(
+            local_session, action_manager, condition_manager
+        )
+        self.eng.session = MagicMock(spec=Session)
+        self.eng.session.player = MagicMock(spec=Player)
+        self.eng.session.player.tile_pos = (0, 0)
+        self.eng.session.client = MagicMock(spec=LocalPygameClient)
+        map_manager = MagicMock(spec=MapManager)
+        map_manager.inits = []
+        cond = MapCondition("char_at", ["player"], 5, 5, 1, 1, "is", None)
+        self.event = EventObject(1, "warp", 5, 5, 1, 1, [cond], [])
+        map_manager.events = [self.event]
+        map_manager.event_index = EventSpatialIndex(map_manager.events)
+        map_manager.init_index = None
+        self.eng.session.client.map_manager = map_manager
+
+    def test_event_away_from_player_is_not_tested(self):
+        self.eng.check_conditions()
+        self.condition.test.assert_not_called()
+
+    def test_event_under_player_is_tested(self):
+        self.eng.session.player.tile_pos = (5, 5)
+        self.eng.check_conditions()
+        self.condition.test.assert_called_once()
+
+    def test_without_index_all_events_are_tested(self):
+        self.eng.session.client.map_manager.event_index = None
+        self.eng.check_conditions()
+        self.condition.test.assert_called_once()
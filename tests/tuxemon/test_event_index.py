@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from tuxemon.event import EventObject, MapCondition
+from tuxemon.event.eventindex import (
+    MAX_INDEXED_AREA,
+    EventSpatialIndex,
+    get_position_binding,
+)
+
+
+def make_event(id, conds):
+    return EventObject(id, f"event{id}", 0, 0, 1, 1, conds, [])
+
+
+def char_at(slug, x, y, width=1, height=1, operator="is"):
+    return MapCondition("char_at", [slug], x, y, width, height, operator, None)
+
+
+class TestGetPositionBinding(unittest.TestCase):
+    def test_char_at_binds_area(self):
+        event = make_event(1, [char_at("player", 2, 3, 2, 1)])
+        self.assertEqual(
+            get_position_binding(event), ("player", [(2, 3), (3, 3)])
+        )
+
+    def test_facing_tile_includes_neighbours(self):
+        cond = MapCondition(
+            "char_facing_tile", ["player"], 2, 2, 1, 1, "is", None
+        )
+        slug, tiles = get_position_binding(make_event(1, [cond]))
+        self.assertEqual(slug, "player")
+        self.assertEqual(len(tiles), 9)
+        self.assertIn((1, 1), tiles)
+        self.assertIn((3, 3), tiles)
+
+    def test_facing_labelled_tile_is_not_bound(self):
+        cond = MapCondition(
+            "char_facing_tile", ["player", "surfable"], 0, 0, 1, 1, "is", None
+        )
+        self.assertIsNone(get_position_binding(make_event(1, [cond])))
+
+    def test_negated_condition_is_not_bound(self):
+        event = make_event(1, [char_at("player", 0, 0, operator="not")])
+        self.assertIsNone(get_position_binding(event))
+
+    def test_other_conditions_are_not_bound(self):
+        cond = MapCondition(
+            "variable_set", ["door:open"], 0, 0, 1, 1, "is", None
+        )
+        self.assertIsNone(get_position_binding(make_event(1, [cond])))
+
+    def test_smallest_area_is_used(self):
+        event = make_event(
+            1, [char_at("player", 0, 0, 4, 4), char_at("npc", 9, 9)]
+        )
+        self.assertEqual(get_position_binding(event), ("npc", [(9, 9)]))
+
+    def test_huge_area_is_not_bound(self):
+        event = make_event(1, [char_at("player", 0, 0, MAX_INDEXED_AREA, 2)])
+        self.assertIsNone(get_position_binding(event))
+
+
+class TestEventSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.bound = make_event(1, [char_at("player", 5, 5)])
+        self.npc_bound = make_event(2, [char_at("npc_maple", 1, 1)])
+        self.free = make_event(3, [])
+        self.events = [self.bound, self.npc_bound, self.free]
+        self.index = EventSpatialIndex(self.events)
+
+    def test_slugs(self):
+        self.assertCountEqual(self.index.slugs, ["player", "npc_maple"])
+
+    def test_select_away(self):
+        selected = self.index.select(self.events, {"player": (0, 0)})
+        self.assertEqual(selected, [self.free])
+
+    def test_select_keeps_order(self):
+        positions = {"player": (5, 5), "npc_maple": (1, 1)}
+        selected = self.index.select(self.events, positions)
+        self.assertEqual(selected, self.events)
+
+    def test_select_keeps_unknown_events(self):
+        loaded = make_event(4, [char_at("player", 7, 7)])
+        selected = self.index.select(
+            self.events + [loaded], {"player": (0, 0)}
+        )
+        self.assertEqual(selected, [self.free, loaded])
+
+    def test_select_skips_removed_events(self):
+        selected = self.index.select([self.free], {"player": (5, 5)})
+        self.assertEqual(selected, [self.free])
+
+    def test_select_keeps_facing_labelled_tile(self):
+        cond = MapCondition(
+            "char_facing_tile", ["player", "surfable"], 0, 0, 1, 1, "is", None
+        )
+        surf = make_event(5, [cond])
+        index = EventSpatialIndex([surf])
+        self.assertEqual(index.select([surf], {"player": (20, 20)}), [surf])
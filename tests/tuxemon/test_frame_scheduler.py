@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from tuxemon.frame_scheduler import MAX_STEPS_PER_FRAME, FrameScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestFrameScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_scheduler(self, fps=10.0, fixed_timestep=False):
+        return FrameScheduler(
+            fps, fixed_timestep, clock=self.clock, sleep=self.clock.sleep
+        )
+
+    def test_tick(self):
+        scheduler = self.make_scheduler()
+        self.clock.advance(0.25)
+        self.assertAlmostEqual(scheduler.tick(), 0.25)
+        self.assertAlmostEqual(scheduler.timings.frame, 0.25)
+
+    def test_sleeps_until_deadline(self):
+        scheduler = self.make_scheduler()
+        scheduler.tick()
+        self.clock.advance(0.03)
+        scheduler.wait()
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.07)
+        self.assertAlmostEqual(self.clock.now, 0.1)
+        self.assertAlmostEqual(scheduler.timings.idle, 0.07)
+
+    def test_deadlines_do_not_drift(self):
+        scheduler = self.make_scheduler()
+        for _ in range(10):
+            scheduler.tick()
+            self.clock.advance(0.01)
+            scheduler.wait()
+        self.assertAlmostEqual(self.clock.now, 1.0)
+
+    def test_late_frame_does_not_sleep(self):
+        scheduler = self.make_scheduler()
+        scheduler.tick()
+        self.clock.advance(0.5)
+        scheduler.wait()
+        self.assertEqual(self.clock.sleeps, [])
+        self.clock.advance(0.02)
+        scheduler.wait()
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.08)
+
+    def test_time_left(self):
+        scheduler = self.make_scheduler()
+        scheduler.tick()
+        self.clock.advance(0.03)
+        self.assertAlmostEqual(scheduler.time_left(), 0.07)
+        self.clock.advance(0.1)
+        self.assertEqual(scheduler.time_left(), 0.0)
+
+    def test_unlimited_leaves_no_time(self):
+        scheduler = self.make_scheduler(fps=0)
+        self.assertEqual(scheduler.time_left(), 0.0)
+
+    def test_unlimited(self):
+        scheduler = self.make_scheduler(fps=0)
+        self.assertTrue(scheduler.unlimited)
+        scheduler.wait()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_variable_timestep(self):
+        scheduler = self.make_scheduler()
+        self.assertEqual(scheduler.steps(0.13), [0.13])
+
+    def test_fixed_timestep(self):
+        scheduler = self.make_scheduler(fixed_timestep=True)
+        self.assertEqual(scheduler.steps(0.05), [])
+        self.assertAlmostEqual(scheduler.interpolation, 0.5)
+        self.assertEqual(scheduler.steps(0.17), [0.1, 0.1])
+        self.assertAlmostEqual(scheduler.interpolation, 0.2)
+
+    def test_fixed_timestep_drops_backlog(self):
+        scheduler = self.make_scheduler(fixed_timestep=True)
+        steps = scheduler.steps(10.0)
+        self.assertEqual(len(steps), MAX_STEPS_PER_FRAME)
+        self.assertEqual(scheduler.interpolation, 0.0)
+
+    def test_record(self):
+        scheduler = self.make_scheduler()
+        scheduler.record(update=0.002, draw=0.005)
+        self.assertEqual(scheduler.timings.update, 0.002)
+        self.assertEqual(scheduler.timings.draw, 0.005)
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest.mock import MagicMock
+
+from tuxemon.db import (
+    EntryNotFoundError,
+    LazyTable,
+    ModData,
+    config,
+    loader,
+    mod_loader,
+    resolver,
+)
+
+
+class TestLazyTable(unittest.TestCase):
+    def setUp(self):
+        self.load = MagicMock(side_effect=lambda item: item["slug"].upper())
+        self.table = LazyTable(
+            "item",
+            {"potion": {"slug": "potion"}, "ether": {"slug": "ether"}},
+            self.load,
+            True,
+        )
+
+    def test_listing_does_not_load(self):
+        self.assertEqual(list(self.table), ["potion", "ether"])
+        self.assertIn("potion", self.table)
+        self.assertEqual(len(self.table), 2)
+        self.load.assert_not_called()
+
+    def test_entry_is_loaded_once(self):
+        self.assertEqual(self.table["potion"], "POTION")
+        self.assertEqual(self.table["potion"], "POTION")
+        self.load.assert_called_once_with({"slug": "potion"})
+        self.assertEqual(self.table.pending, 1)
+
+    def test_invalid_entry_is_dropped(self):
+        self.load.side_effect = lambda item: None
+        self.assertIsNone(self.table.get("potion"))
+        self.assertNotIn("potion", self.table)
+
+    def test_set_entry(self):
+        self.table["potion"] = "model"
+        self.assertEqual(self.table["potion"], "model")
+        self.load.assert_not_called()
+
+    def test_load_all(self):
+        self.table.load_all()
+        self.assertEqual(self.table.pending, 0)
+        self.assertEqual(self.load.call_count, 2)
+
+
+class TestModDataLazy(unittest.TestCase):
+    def setUp(self):
+        self.db = ModData(config, loader, resolver, mod_loader)
+        self.db.preload("element")
+        self.db.load("element", validate=False, lazy=True)
+
+    def test_lookup_loads_entry(self):
+        table = self.db.database["element"]
+        self.assertIsInstance(table, LazyTable)
+        slug = next(iter(table))
+        self.assertEqual(self.db.lookup(slug, "element").slug, slug)
+        self.assertEqual(table.pending, len(table) - 1)
+
+    def test_lookup_missing_entry(self):
+        with self.assertRaises(EntryNotFoundError):
+            self.db.lookup("not_an_element", "element")
+
+    def test_warm(self):
+        self.db.warm(["element"])
+        self.assertEqual(self.db.database["element"].pending, 0)
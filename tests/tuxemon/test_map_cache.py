@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pygame
+
+from tuxemon import prepare
+from tuxemon.map_cache import MapCache
+from tuxemon.map_loader import MapLoader
+
+
+class TestMapCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        cls.map_path = prepare.fetch("maps", "taba_town.tmx")
+        cls.txmn_map = MapLoader().load_map_data(cls.map_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source = self.temp_dir / "taba_town.yaml"
+        self.source.write_text("events: {}\n")
+        self.cache = MapCache(self.temp_dir / "maps")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_missing_map(self):
+        self.assertIsNone(self.cache.load(self.map_path))
+
+    def test_round_trip(self):
+        self.cache.save(self.txmn_map, [self.source])
+        loaded = self.cache.load(self.map_path)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.collision_map, self.txmn_map.collision_map)
+        self.assertEqual(loaded.surface_map, self.txmn_map.surface_map)
+        self.assertEqual(
+            loaded.collision_lines_map, self.txmn_map.collision_lines_map
+        )
+        self.assertEqual(loaded.maps, self.txmn_map.maps)
+        self.assertEqual(loaded.size, self.txmn_map.size)
+        self.assertEqual(
+            [event.name for event in loaded.events],
+            [event.name for event in self.txmn_map.events],
+        )
+        self.assertEqual(
+            len(loaded.data.images), len(self.txmn_map.data.images)
+        )
+
+    def test_save_leaves_no_temp_file(self):
+        self.cache.save(self.txmn_map, [self.source])
+        self.cache.save(self.txmn_map, [self.source])
+        path = self.cache.get_path(self.map_path)
+        self.assertEqual(list(path.parent.iterdir()), [path])
+
+    def test_events_get_new_ids(self):
+        self.cache.save(self.txmn_map, [self.source])
+        first = self.cache.load(self.map_path)
+        second = self.cache.load(self.map_path)
+        self.assertNotEqual(first.events[0].id, second.events[0].id)
+        self.assertEqual(
+            first.events[0]._replace(id=None),
+            second.events[0]._replace(id=None),
+        )
+
+    def test_changed_source(self):
+        self.cache.save(self.txmn_map, [self.source])
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10))
+        self.assertIsNone(self.cache.load(self.map_path))
+
+    def test_created_source(self):
+        missing = self.temp_dir / "scenario.yaml"
+        self.cache.save(self.txmn_map, [missing])
+        self.assertIsNotNone(self.cache.load(self.map_path))
+        missing.write_text("events: {}\n")
+        self.assertIsNone(self.cache.load(self.map_path))
+
+    def test_changed_scale(self):
+        self.cache.save(self.txmn_map, [self.source])
+        with patch.object(prepare, "SCALE", prepare.SCALE + 1):
+            cache = MapCache(self.temp_dir / "maps")
+        self.assertIsNone(cache.load(self.map_path))
+
+    def test_unreadable_map(self):
+        path = self.cache.get_path(self.map_path)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"garbage")
+        self.assertIsNone(self.cache.load(self.map_path))
+
+    def test_loader_uses_cache(self):
+        loader = MapLoader(self.cache)
+        loader.load_map_data(self.map_path)
+        self.assertTrue(self.cache.get_path(self.map_path).exists())
+        with patch.object(loader, "_load_map_from_disk") as load:
+            txmn_map = loader.load_map_data(self.map_path)
+        load.assert_not_called()
+        self.assertEqual(txmn_map.collision_map, self.txmn_map.collision_map)
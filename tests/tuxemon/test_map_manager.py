@@ -46,6 +46,8 @@ class TestMapManager(unittest.TestCase):
         map_data.collision_lines_map = set()
         map_data.surface_map = {}
         map_data.collision_map = {}
+        map_data.event_index = None
+        map_data.init_index = None
 
         self.map_manager.load_map(map_data)
 
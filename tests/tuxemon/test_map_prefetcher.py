@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tuxemon.event import EventObject, MapAction
+from tuxemon.map_prefetcher import MapPrefetcher, get_adjacent_maps
+
+
+def fetch(folder, name):
+    if name.startswith("missing"):
+        raise OSError(f"Cannot load file {name}")
+    return f"/{folder}/{name}"
+
+
+def make_map(filename, actions=(), **properties):
+    txmn_map = MagicMock()
+    txmn_map.filename = filename
+    txmn_map.maps = properties
+    txmn_map.events = [
+        EventObject(None, "event", 0, 0, 1, 1, [], list(actions))
+    ]
+    return txmn_map
+
+
+@patch("tuxemon.map_prefetcher.prepare.fetch", fetch)
+class TestGetAdjacentMaps(unittest.TestCase):
+    def test_teleports(self):
+        txmn_map = make_map(
+            "/maps/town.tmx",
+            [
+                MapAction("transition_teleport", ["house.tmx", "1", "2"], ""),
+                MapAction("teleport", ["player", "shop.tmx", "1", "2"], ""),
+                MapAction("delayed_teleport", ["npc", "lab.tmx", "1"], ""),
+                MapAction("play_music", ["song.ogg"], ""),
+            ],
+        )
+        self.assertEqual(
+            get_adjacent_maps(txmn_map),
+            ["/maps/house.tmx", "/maps/shop.tmx", "/maps/lab.tmx"],
+        )
+
+    def test_cardinals(self):
+        txmn_map = make_map(
+            "/maps/town.tmx", north="route1", south="-", east="a,b"
+        )
+        self.assertEqual(
+            get_adjacent_maps(txmn_map),
+            ["/maps/route1.tmx", "/maps/a.tmx", "/maps/b.tmx"],
+        )
+
+    def test_skips_missing_duplicate_and_current_maps(self):
+        txmn_map = make_map(
+            "/maps/town.tmx",
+            [
+                MapAction("teleport", ["player", "missing.tmx", "1", "2"], ""),
+                MapAction("teleport", ["player", "town.tmx", "1", "2"], ""),
+                MapAction("teleport", ["player", "house.tmx", "1", "2"], ""),
+                MapAction("teleport", ["player", "house.tmx", "3", "4"], ""),
+            ],
+            north="missing_route",
+        )
+        self.assertEqual(get_adjacent_maps(txmn_map), ["/maps/house.tmx"])
+
+
+@patch("tuxemon.map_prefetcher.prepare.fetch", fetch)
+class TestMapPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.loader = MagicMock()
+        self.loader.load_map_data.side_effect = make_map
+        self.prefetcher = MapPrefetcher(self.loader, size=2)
+
+    def tearDown(self):
+        self.prefetcher.shutdown()
+
+    def test_prefetched_map(self):
+        txmn_map = make_map("/maps/town.tmx", north="route1")
+        self.prefetcher.prefetch(txmn_map)
+        route = self.prefetcher.get("/maps/route1.tmx")
+        self.assertEqual(route.filename, "/maps/route1.tmx")
+        route.initialize_renderer.assert_not_called()
+        self.loader.load_map_data.assert_called_once_with("/maps/route1.tmx")
+
+    def test_map_is_used_once(self):
+        self.prefetcher.prefetch(make_map("/maps/town.tmx", north="route1"))
+        self.assertIsNotNone(self.prefetcher.get("/maps/route1.tmx"))
+        self.assertIsNone(self.prefetcher.get("/maps/route1.tmx"))
+
+    def test_not_prefetched(self):
+        self.assertIsNone(self.prefetcher.get("/maps/route1.tmx"))
+
+    def test_failed_load(self):
+        self.loader.load_map_data.side_effect = ValueError("broken")
+        self.prefetcher.prefetch(make_map("/maps/town.tmx", north="route1"))
+        self.assertIsNone(self.prefetcher.get("/maps/route1.tmx"))
+
+    def test_size(self):
+        release = threading.Event()
+        self.loader.load_map_data.side_effect = lambda name: release.wait(5)
+        self.prefetcher.prefetch(
+            make_map("/maps/town.tmx", north="a", south="b", east="c")
+        )
+        self.prefetcher.prefetch(make_map("/maps/a.tmx", north="d"))
+        release.set()
+        self.assertEqual(
+            list(self.prefetcher._maps), ["/maps/b.tmx", "/maps/d.tmx"]
+        )
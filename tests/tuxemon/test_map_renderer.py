@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+from tuxemon import prepare
+from tuxemon.map_view import AnimationInfo, MapRenderer
+from tuxemon.math import Vector2, Vector3
+
+
+class TestMapRendererCulling(unittest.TestCase):
+    def setUp(self):
+        for name, value in (
+            ("TILE_SIZE", (80, 80)),
+            ("SCREEN_SIZE", (1280, 720)),
+        ):
+            patcher = patch.object(prepare, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = MagicMock()
+        self.client.screen = Surface((1, 1))
+        self.client.npc_manager.npcs = {}
+        self.camera = MagicMock()
+        self.camera.position = Vector2(640, 360)
+        self.client.camera_manager.get_active_camera.return_value = self.camera
+        self.renderer = MapRenderer(self.client)
+        self.renderer._get_sprites = MagicMock(return_value=["frame"])
+        self.current_map = MagicMock()
+        self.current_map.edges = "clamped"
+        self.current_map.size = (100, 100)
+        self.tile_w, self.tile_h = prepare.TILE_SIZE
+
+    def add_npc(self, name, x, y):
+        npc = MagicMock()
+        npc.position = Vector3(x, y, 0)
+        renderer = npc.sprite_controller.get_sprite_renderer.return_value
+        renderer.rect = Rect(0, 0, self.tile_w, self.tile_h * 2)
+        self.client.npc_manager.npcs[name] = npc
+        return npc
+
+    def add_animation(self, name, x, y):
+        animation = MagicMock()
+        animation.is_finished.return_value = False
+        animation.visibility = True
+        animation.get_current_frame.return_value = Surface(prepare.TILE_SIZE)
+        self.renderer.map_animations[name] = AnimationInfo(
+            animation, (x, y), 2
+        )
+
+    def test_view_rect(self):
+        view = self.renderer.get_view_rect(self.current_map)
+        screen_w, screen_h = prepare.SCREEN_SIZE
+        self.assertEqual(view.center, (640, 360))
+        self.assertEqual(
+            view.size, (screen_w + 2 * self.tile_w, screen_h + 2 * self.tile_h)
+        )
+
+    def test_view_rect_clamped_to_map(self):
+        self.camera.position = Vector2(0, 0)
+        view = self.renderer.get_view_rect(self.current_map)
+        self.assertEqual(view.topleft, (-self.tile_w, -self.tile_h))
+
+    def test_view_rect_not_clamped(self):
+        self.current_map.edges = None
+        self.camera.position = Vector2(0, 0)
+        view = self.renderer.get_view_rect(self.current_map)
+        self.assertEqual(view.center, (0, 0))
+
+    def test_npcs_out_of_view_are_culled(self):
+        self.add_npc("near", 1, 1)
+        far = self.add_npc("far", 90, 90)
+        view = self.renderer.get_view_rect(self.current_map)
+        surfaces = self.renderer._get_npc_surfaces(3, view)
+        self.assertEqual(surfaces, ["frame"])
+        self.renderer._get_sprites.assert_called_once()
+        self.assertNotIn(far, self.renderer._get_sprites.call_args.args)
+        self.assertEqual(self.renderer.drawn_sprites, 1)
+        self.assertEqual(self.renderer.culled_sprites, 1)
+
+    def test_partly_visible_npc_is_drawn(self):
+        screen_w = prepare.SCREEN_SIZE[0]
+        self.add_npc("edge", screen_w / self.tile_w, 1)
+        view = self.renderer.get_view_rect(self.current_map)
+        self.assertEqual(len(self.renderer._get_npc_surfaces(3, view)), 1)
+
+    def test_animations_out_of_view_are_culled(self):
+        self.add_animation("near", 2, 2)
+        self.add_animation("far", 50, 2)
+        view = self.renderer.get_view_rect(self.current_map)
+        surfaces = self.renderer._get_map_animations(view)
+        self.assertEqual(len(surfaces), 1)
+        self.assertEqual(surfaces[0].position3, Vector2(2, 2))
+        self.assertEqual(self.renderer.drawn_sprites, 1)
+        self.assertEqual(self.renderer.culled_sprites, 1)
+
+    def test_finished_animations_are_not_counted(self):
+        self.add_animation("done", 2, 2)
+        animation = self.renderer.map_animations["done"].animation
+        animation.is_finished.return_value = True
+        view = self.renderer.get_view_rect(self.current_map)
+        self.assertEqual(self.renderer._get_map_animations(view), [])
+        self.assertEqual(self.renderer.drawn_sprites, 0)
+        self.assertEqual(self.renderer.culled_sprites, 0)
@@ -60,3 +60,23 @@ class TestMapTransition(unittest.TestCase):
         self.map_manager.map_size = (10, 10)
         self.map_transition._update_boundaries()
         self.boundary.update_boundaries.assert_called_once_with((10, 10))
+
+    def test_change_map_prefetched(self):
+        prefetcher = MagicMock()
+        map_data = MagicMock()
+        prefetcher.get.return_value = map_data
+        self.map_transition.prefetcher = prefetcher
+        self.map_transition.change_map("test_map")
+        self.map_loader.load_map_data.assert_not_called()
+        self.map_manager.load_map.assert_called_once_with(map_data)
+        prefetcher.prefetch.assert_called_once_with(map_data)
+
+    def test_change_map_not_prefetched(self):
+        prefetcher = MagicMock()
+        prefetcher.get.return_value = None
+        self.map_transition.prefetcher = prefetcher
+        self.map_transition.change_map("test_map")
+        self.map_loader.load_map_data.assert_called_once_with("test_map")
+        prefetcher.prefetch.assert_called_once_with(
+            self.map_loader.load_map_data.return_value
+        )
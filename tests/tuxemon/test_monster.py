@@ -1,11 +1,16 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from tuxemon import prepare
-from tuxemon.db import Modifier, db
-from tuxemon.monster import Monster
+from tuxemon.db import Modifier, MonsterModel, db
+from tuxemon.monster import (
+    BasicStats,
+    Monster,
+    MonsterTemplate,
+    TemporaryStatBoosts,
+)
 from tuxemon.prepare import MAX_LEVEL
 from tuxemon.shape import ShapeHandler
 from tuxemon.taste import Taste
@@ -168,3 +173,148 @@ class SetStats(MonsterTestBase):
         self.assertEqual(self.mon.ranged, expected_ranged)
         self.assertEqual(self.mon.speed, self.value)
         self.assertEqual(self.mon.hp, self.value)
+
+
+class TestMonsterTemplate(MonsterTestBase):
+    _dragon = MagicMock(
+        slug="dragon",
+        attributes=MagicMock(
+            armour=7, dodge=5, hp=6, melee=6, ranged=6, speed=6
+        ),
+    )
+    _fire = MagicMock(slug="fire", icon="fire_type.png", types=[])
+
+    def setUp(self):
+        MonsterTemplate.clear_cache()
+        self.agnite = self.make_model()
+        db.database["monster"] = {"agnite": self.agnite}
+        db.database["shape"] = {"dragon": self._dragon}
+        db.database["element"] = {"fire": self._fire}
+
+    def tearDown(self):
+        MonsterTemplate.clear_cache()
+
+    def make_model(self):
+        return MonsterModel(
+            slug="agnite",
+            category="false_dragon",
+            moveset=[{"level_learned": 1, "technique": "ram"}],
+            evolutions=[],
+            history=[],
+            tags=[],
+            terrains=[],
+            shape="dragon",
+            stage="basic",
+            types=["fire"],
+            possible_genders=["male", "female"],
+            txmn_id=13,
+            height=80,
+            weight=24,
+            catch_rate=100.0,
+            lower_catch_resistance=0.95,
+            upper_catch_resistance=1.25,
+        )
+
+    def test_template_is_built_once(self):
+        with patch.object(
+            MonsterTemplate, "build", wraps=MonsterTemplate.build
+        ) as build:
+            Monster.create("agnite")
+            Monster.create("agnite")
+        build.assert_called_once_with("agnite", self.agnite)
+
+    def test_monster_copies_template(self):
+        template = MonsterTemplate.get("agnite")
+        mon = Monster.create("agnite")
+        self.assertEqual(mon.slug, "agnite")
+        self.assertEqual(mon.name, template.name)
+        self.assertEqual(mon.types.get_type_slugs(), ["fire"])
+        self.assertEqual(mon.shape.slug, "dragon")
+        self.assertEqual(mon.sprite_handler.front_path, template.front_path)
+        self.assertEqual(mon.combat_call, "sound_fire_call")
+        self.assertEqual(mon.faint_call, "sound_fire_faint")
+        self.assertEqual(mon.moves.moveset, template.moveset)
+        self.assertIn(mon.gender, template.possible_genders)
+
+    def test_instances_do_not_share_state(self):
+        first = Monster.create("agnite")
+        second = Monster.create("agnite")
+        self.assertIsNot(first.evolutions, second.evolutions)
+        self.assertIsNot(first.flairs, second.flairs)
+        self.assertIsNot(first.types, second.types)
+        self.assertIsNot(first.shape, second.shape)
+
+    def test_replaced_entry(self):
+        template = MonsterTemplate.get("agnite")
+        db.database["monster"]["agnite"] = self.make_model()
+        self.assertIsNot(MonsterTemplate.get("agnite"), template)
+
+    def test_template_per_language(self):
+        template = MonsterTemplate.get("agnite")
+        with patch(
+            "tuxemon.monster.T.get_current_language", return_value="xx_XX"
+        ):
+            self.assertIsNot(MonsterTemplate.get("agnite"), template)
+        self.assertIs(MonsterTemplate.get("agnite"), template)
+
+    def test_sprite_handler_is_lazy(self):
+        mon = Monster.create("agnite")
+        self.assertIsNone(mon._sprite_handler)
+        handler = mon.sprite_handler
+        self.assertEqual(handler.slug, "agnite")
+        self.assertEqual(
+            handler.back_path, MonsterTemplate.get("agnite").back_path
+        )
+        self.assertIs(mon.sprite_handler, handler)
+
+    def test_saved_monster_does_not_load_sprites(self):
+        save_data = Monster.create("agnite").get_state()
+        with patch("tuxemon.monster.graphics.load_and_scale") as load:
+            mon = Monster(save_data=save_data)
+        load.assert_not_called()
+        self.assertIsNone(mon._sprite_handler)
+
+
+class TestMonsterSlots(MonsterTestBase):
+    def setUp(self):
+        self.mon = Monster()
+
+    def test_no_instance_dict(self):
+        for obj in (
+            self.mon,
+            self.mon.base_stats,
+            self.mon.modifiers,
+            self.mon.moves,
+            self.mon.status,
+            self.mon.held_item,
+            self.mon.plague,
+            self.mon.types,
+            self.mon.shape,
+            self.mon.sprite_handler,
+            self.mon.evolution_handler,
+        ):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.mon.unknown = 1
+
+    def test_handlers_are_lazy(self):
+        self.assertIsNone(self.mon._evolution_handler)
+        self.assertIsNone(self.mon._body)
+        self.assertIs(self.mon.evolution_handler.monster, self.mon)
+        self.assertIs(self.mon.evolution_handler, self.mon.evolution_handler)
+        self.assertIs(self.mon.body, self.mon.body)
+
+    def test_body_not_created_by_get_state(self):
+        self.mon.gender = "male"
+        self.assertNotIn("body", self.mon.get_state())
+        self.assertIsNone(self.mon._body)
+
+    def test_stats(self):
+        stats = BasicStats(armour=3, hp=4)
+        self.assertEqual(stats.sum(), 7)
+        self.assertEqual(stats, BasicStats(armour=3, hp=4))
+        modifiers = TemporaryStatBoosts.from_dict({"speed": 2, "unknown": 1})
+        self.assertEqual(modifiers.to_dict()["speed"], 2)
+        self.assertFalse(hasattr(modifiers, "__dict__"))
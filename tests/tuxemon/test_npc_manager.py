@@ -4,7 +4,9 @@ import unittest
 import uuid
 from unittest.mock import MagicMock
 
+from tuxemon.entity import Entity
 from tuxemon.npc_manager import NPCManager
+from tuxemon.session import Session
 
 
 class TestNPCManager(unittest.TestCase):
@@ -44,3 +46,85 @@ class TestNPCManager(unittest.TestCase):
         self.manager.clear_npcs()
         self.assertEqual(len(self.manager.npcs), 0)
         self.assertEqual(len(self.manager.npcs_off_map), 0)
+
+    def test_get_entity_pos_finds_npc(self) -> None:
+        self.npc1.tile_pos = (1, 2)
+        self.manager.add_npc(self.npc1)
+        self.assertEqual(self.manager.get_entity_pos((1, 2)), self.npc1)
+
+    def test_get_entity_pos_empty_tile(self) -> None:
+        self.npc1.tile_pos = (1, 2)
+        self.manager.add_npc(self.npc1)
+        self.assertIsNone(self.manager.get_entity_pos((3, 3)))
+
+    def test_get_entity_pos_after_npc_moved(self) -> None:
+        self.npc1.tile_pos = (1, 2)
+        self.manager.add_npc(self.npc1)
+        self.npc1.tile_pos = (1, 3)
+        self.manager.update_npc_position(self.npc1)
+        self.assertIsNone(self.manager.get_entity_pos((1, 2)))
+        self.assertEqual(self.manager.get_entity_pos((1, 3)), self.npc1)
+
+    def test_get_entity_pos_after_npc_removed(self) -> None:
+        self.npc1.tile_pos = (1, 2)
+        self.manager.add_npc(self.npc1)
+        self.manager.remove_npc(self.npc1.slug)
+        self.assertIsNone(self.manager.get_entity_pos((1, 2)))
+
+    def test_update_npc_position_ignores_unknown_npc(self) -> None:
+        self.npc2.tile_pos = (4, 4)
+        self.manager.update_npc_position(self.npc2)
+        self.assertIsNone(self.manager.get_entity_pos((4, 4)))
+
+    def test_get_npc_by_iid(self) -> None:
+        self.manager.add_npc(self.npc1)
+        npc = self.manager.get_npc_by_iid(self.npc1.instance_id)
+        self.assertEqual(npc, self.npc1)
+
+    def test_get_npc_by_iid_after_instance_id_changed(self) -> None:
+        self.manager.add_npc(self.npc1)
+        self.npc1.instance_id = uuid.uuid4()
+        npc = self.manager.get_npc_by_iid(self.npc1.instance_id)
+        self.assertEqual(npc, self.npc1)
+
+    def test_get_monster_by_iid(self) -> None:
+        monster = MagicMock(instance_id=uuid.uuid4())
+        self.npc1.monsters = [monster]
+        self.manager.add_npc(self.npc1)
+        found = self.manager.get_monster_by_iid(monster.instance_id)
+        self.assertEqual(found, monster)
+
+    def test_get_monster_by_iid_after_monster_released(self) -> None:
+        monster = MagicMock(instance_id=uuid.uuid4())
+        self.npc1.monsters = [monster]
+        self.manager.add_npc(self.npc1)
+        self.manager.get_monster_by_iid(monster.instance_id)
+        self.npc1.monsters = []
+        self.assertIsNone(self.manager.get_monster_by_iid(monster.instance_id))
+
+    def test_get_monster_by_iid_miss_keeps_index(self) -> None:
+        monster = MagicMock(instance_id=uuid.uuid4())
+        self.npc1.monsters = [monster]
+        self.manager.add_npc(self.npc1)
+        self.assertIsNone(self.manager.get_monster_by_iid(uuid.uuid4()))
+        self.assertEqual(self.manager._monster_index, {})
+        self.manager.get_monster_by_iid(monster.instance_id)
+        self.assertEqual(
+            self.manager._monster_index,
+            {monster.instance_id: (self.npc1, monster)},
+        )
+
+
+class TestEntityPositionIndex(unittest.TestCase):
+    def test_move_without_client(self) -> None:
+        entity = Entity(slug="npc_1", session=Session())
+        entity.tile_pos = (3, 4)
+        self.assertEqual(entity.tile_pos, (3, 4))
+
+    def test_move_updates_index(self) -> None:
+        session = Session()
+        session.set_client(MagicMock())
+        entity = Entity(slug="npc_1", session=session)
+        entity.tile_pos = (3, 4)
+        npc_manager = session.client.npc_manager
+        npc_manager.update_npc_position.assert_called_once_with(entity)
@@ -13,6 +13,7 @@ from tuxemon.movement import Pathfinder, PathfindNode, get_tile_moverate
 from tuxemon.npc import NPC
 from tuxemon.npc_manager import NPCManager
 from tuxemon.prepare import CONFIG
+from tuxemon.walkability import WalkabilityGrid
 
 
 class TestPathfinder(unittest.TestCase):
@@ -21,6 +22,7 @@ class TestPathfinder(unittest.TestCase):
         self.client.map_manager = MagicMock(spec=MapManager)
         self.client.map_manager.map_size = (10, 10)
         self.client.map_manager.collision_lines_map = {}
+        self.client.map_manager.walkability = WalkabilityGrid((10, 10))
         self.client.boundary = MagicMock(spec=BoundaryChecker)
         self.client.npc_manager = MagicMock(spec=NPCManager)
         self.client.collision_manager = MagicMock(spec=CollisionManager)
@@ -361,3 +363,86 @@ class TestPathfinder(unittest.TestCase):
         exits = self.pathfinder.get_exits(position, Direction.down)
 
         self.assertEqual(exits, [])
+
+
+class TestPathfinderAStar(unittest.TestCase):
+    def setUp(self):
+        self.map_manager = MagicMock(spec=MapManager)
+        self.map_manager.collision_lines_map = set()
+        self.map_manager.surface_map = {}
+        self.map_manager.walkability = WalkabilityGrid((3, 3))
+        self.boundary = MagicMock(spec=BoundaryChecker)
+        self.boundary.is_within_boundaries.side_effect = (
+            lambda pos: 0 <= pos[0] < 3 and 0 <= pos[1] < 3
+        )
+        self.npc_manager = MagicMock(spec=NPCManager)
+        self.collision_manager = MagicMock(spec=CollisionManager)
+        self.collision_manager.get_collision_map.return_value = {}
+        self.collision_manager.version = 1
+        self.pathfinder = Pathfinder(
+            self.npc_manager,
+            self.map_manager,
+            self.collision_manager,
+            self.boundary,
+        )
+
+    def test_pathfind_straight_line(self):
+        path = self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.assertEqual(path, [(2, 0), (1, 0)])
+
+    def test_pathfind_avoids_slow_tile(self):
+        self.map_manager.surface_map = {(1, 0): {"water": 0.1}}
+        path = self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.assertEqual(path, [(2, 0), (2, 1), (1, 1), (0, 1)])
+
+    def test_pathfind_uses_cached_path(self):
+        self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.pathfinder.pathfind_r = MagicMock()
+        path = self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.pathfinder.pathfind_r.assert_not_called()
+        self.assertEqual(path, [(2, 0), (1, 0)])
+
+    def test_pathfind_cache_invalidated_by_collision_version(self):
+        self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.collision_manager.version = 2
+        self.pathfinder.pathfind_r = MagicMock(return_value=None)
+        self.npc_manager.get_entity_pos.return_value = None
+        path = self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.pathfinder.pathfind_r.assert_called_once()
+        self.assertIsNone(path)
+
+    def test_pathfind_cache_invalidated_by_npc_moving(self):
+        npc_manager = NPCManager()
+        npc = MagicMock(slug="npc_maple", tile_pos=(1, 2))
+        npc_manager.add_npc(npc)
+        self.collision_manager.get_collision_map.side_effect = lambda: {
+            npc.tile_pos: RegionProperties([], [], [], npc, None)
+            for npc in npc_manager.get_all_entities()
+        }
+        self.pathfinder.npc_manager = npc_manager
+        path = self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.assertEqual(path, [(2, 0), (1, 0)])
+        npc.tile_pos = (1, 0)
+        npc_manager.update_npc_position(npc)
+        path = self.pathfinder.pathfind((0, 0), (2, 0), Direction.right)
+        self.assertEqual(path, [(2, 0), (2, 1), (1, 1), (0, 1)])
+
+    def test_estimate_cost_is_manhattan_distance(self):
+        cost = self.pathfinder.estimate_cost((0, 0), (2, 1))
+        self.assertEqual(cost, 3.0)
+
+    def test_estimate_cost_scaled_by_fast_surface(self):
+        self.map_manager.surface_map = {(1, 0): {"road": 2.0}}
+        cost = self.pathfinder.estimate_cost((0, 0), (2, 1))
+        self.assertEqual(cost, 1.5)
+
+    def test_get_step_cost_of_slow_tile(self):
+        self.map_manager.surface_map = {(1, 0): {"water": 0.5}}
+        self.assertEqual(self.pathfinder.get_step_cost((1, 0)), 2.0)
+
+    def test_pathfind_around_wall(self):
+        self.map_manager.walkability = WalkabilityGrid(
+            (3, 3), {((0, 0), Direction.right)}
+        )
+        path = self.pathfinder.pathfind((0, 0), (1, 0), Direction.right)
+        self.assertEqual(path, [(1, 0), (1, 1), (0, 1)])
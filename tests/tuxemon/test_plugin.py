@@ -1,19 +1,27 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import shutil
+import tempfile
 import unittest
 from collections.abc import Iterable
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from tuxemon.constants.paths import CONDITIONS_PATH
+from tuxemon.event.eventcondition import EventCondition
 from tuxemon.plugin import (
     FileSystemPluginDiscovery,
     ImportLibPluginLoader,
+    LazyPlugins,
     PluginFilter,
     PluginLoader,
     PluginManager,
+    PluginManifest,
     PluginObject,
     get_available_classes,
     load_directory,
+    load_plugins,
 )
 
 
@@ -158,3 +166,91 @@ class TestPluginManager(unittest.TestCase):
 
         self.assertTrue(filter.is_excluded("ExcludedPlugin"))
         self.assertFalse(filter.is_excluded("AllowedPlugin"))
+
+
+class TestPluginManifest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.folder = self.temp_dir / "plugins"
+        self.folder.mkdir()
+        self.plugin_file = self.folder / "plugin.py"
+        self.plugin_file.write_text("")
+        self.manifest = PluginManifest(self.temp_dir / "cache")
+        self.plugins = {"plugin": "tuxemon.plugins.plugin"}
+
+    def test_missing_manifest(self):
+        self.assertIsNone(self.manifest.load(self.folder, PluginObject))
+
+    def test_round_trip(self):
+        self.manifest.save(self.folder, PluginObject, self.plugins)
+        self.assertEqual(
+            self.manifest.load(self.folder, PluginObject), self.plugins
+        )
+
+    def test_changed_file(self):
+        self.manifest.save(self.folder, PluginObject, self.plugins)
+        stat = self.plugin_file.stat()
+        os.utime(
+            self.plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10)
+        )
+        self.assertIsNone(self.manifest.load(self.folder, PluginObject))
+
+    def test_added_file(self):
+        self.manifest.save(self.folder, PluginObject, self.plugins)
+        (self.folder / "other.py").write_text("")
+        self.assertIsNone(self.manifest.load(self.folder, PluginObject))
+
+    def test_other_interface(self):
+        self.manifest.save(self.folder, PluginObject, self.plugins)
+        self.assertIsNone(self.manifest.load(self.folder, EventCondition))
+
+    def test_unreadable_manifest(self):
+        path = self.manifest.get_path(self.folder, PluginObject)
+        path.parent.mkdir(parents=True)
+        path.write_text("garbage")
+        self.assertIsNone(self.manifest.load(self.folder, PluginObject))
+
+
+class TestLazyPlugins(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        self.manifest = PluginManifest(Path(temp_dir))
+        self.loaded = load_plugins(
+            CONDITIONS_PATH,
+            interface=EventCondition,
+            manifest=self.manifest,
+        )
+        self.conditions = load_plugins(
+            CONDITIONS_PATH,
+            interface=EventCondition,
+            manifest=self.manifest,
+        )
+
+    def test_same_plugins(self):
+        self.assertIsInstance(self.conditions, LazyPlugins)
+        self.assertEqual(sorted(self.conditions), sorted(self.loaded))
+        self.assertEqual(dict(self.conditions), dict(self.loaded))
+
+    def test_plugin_imported_when_used(self):
+        self.assertEqual(self.conditions._classes, {})
+        self.assertIn("battle_is", self.conditions)
+        self.assertEqual(self.conditions._classes, {})
+        self.assertIs(self.conditions["battle_is"], self.loaded["battle_is"])
+        self.assertEqual(list(self.conditions._classes), ["battle_is"])
+
+    def test_unknown_plugin(self):
+        self.assertNotIn("unknown", self.conditions)
+        with self.assertRaises(KeyError):
+            self.conditions["unknown"]
+
+    def test_set_and_delete(self):
+        plugin = MagicMock()
+        self.conditions["new"] = plugin
+        self.assertIs(self.conditions["new"], plugin)
+        self.assertEqual(len(self.conditions), len(self.loaded) + 1)
+        del self.conditions["battle_is"]
+        self.assertNotIn("battle_is", self.conditions)
+        with self.assertRaises(KeyError):
+            del self.conditions["battle_is"]
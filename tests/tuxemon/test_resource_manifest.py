@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+from tuxemon.db import ResourceManifest, has
+
+
+class TestResourceManifest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.mods = self.temp_dir / "mods"
+        (self.mods / "first" / "gfx").mkdir(parents=True)
+        (self.mods / "second" / "gfx").mkdir(parents=True)
+        (self.mods / "first" / "gfx" / "a.png").touch()
+        (self.mods / "second" / "gfx" / "a.png").touch()
+        (self.mods / "second" / "gfx" / "b.png").touch()
+        self.patcher = patch.multiple(
+            "tuxemon.db.paths",
+            mods_folder=self.mods,
+            system_installed_folders=[],
+            BASEDIR=self.temp_dir,
+        )
+        self.patcher.start()
+        self.manifest = ResourceManifest(["first", "second"])
+
+    def tearDown(self):
+        self.patcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_first_mod_wins(self):
+        self.assertEqual(
+            self.manifest.resolve("gfx/a.png"),
+            (self.mods / "first" / "gfx" / "a.png").as_posix(),
+        )
+
+    def test_later_mod(self):
+        self.assertEqual(
+            self.manifest.resolve("gfx/b.png"),
+            (self.mods / "second" / "gfx" / "b.png").as_posix(),
+        )
+
+    def test_missing_file(self):
+        self.assertIsNone(self.manifest.resolve("gfx/c.png"))
+
+    def test_walks_once(self):
+        with patch("tuxemon.db.os.walk", wraps=os.walk) as walk:
+            self.manifest.resolve("gfx/a.png")
+            calls = walk.call_count
+            self.manifest.resolve("gfx/b.png")
+        self.assertEqual(walk.call_count, calls)
+
+    def test_image_size_is_cached(self):
+        image = self.temp_dir / "image.png"
+        Image.new("RGB", (4, 2)).save(image)
+        self.assertEqual(self.manifest.image_size(image.as_posix()), (4, 2))
+        image.unlink()
+        self.assertEqual(self.manifest.image_size(image.as_posix()), (4, 2))
+
+
+class TestValidatorTranslation(unittest.TestCase):
+    def test_translation_is_memoized(self):
+        with patch("tuxemon.db.T.translate", return_value="x") as translate:
+            has._translations.clear()
+            self.assertTrue(has.translation("some_unlikely_msgid"))
+            self.assertTrue(has.translation("some_unlikely_msgid"))
+        translate.assert_called_once_with("some_unlikely_msgid")
+        has._translations.clear()
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import shutil
+import tempfile
+import unittest
+from base64 import b64decode, b64encode
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
+
+from pygame.image import load as load_image
+
+from tuxemon import save
+from tuxemon.save_upgrader import SAVE_VERSION
+
+
+class TestSaveHeader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.patcher = patch(
+            "tuxemon.save.prepare.SAVE_PATH", self.temp_dir / "slot"
+        )
+        self.patcher.start()
+        self.save_data = {
+            "time": "2025-01-01 12:00",
+            "version": SAVE_VERSION,
+            "npc_state": {
+                "player_name": "Red",
+                "current_map": "taba_town.tmx",
+                "monsters": [{"slug": "rockitten", "level": 5}],
+            },
+            "screenshot": b64encode(bytes(480 * 270 * 3)).decode(),
+            "screenshot_width": 480,
+            "screenshot_height": 270,
+        }
+
+    def tearDown(self):
+        self.patcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def test_save_writes_header(self):
+        save.save(self.save_data, 1)
+        self.assertTrue(save.get_header_path(1).exists())
+        header = save.load_header(1)
+        self.assertEqual(header["player_name"], "Red")
+        self.assertEqual(header["time"], "2025-01-01 12:00")
+        self.assertEqual(header["party"], [{"slug": "rockitten", "level": 5}])
+
+    def test_thumbnail(self):
+        header = save.get_save_header(self.save_data)
+        thumbnail = load_image(BytesIO(b64decode(header["thumbnail"])), "png")
+        self.assertEqual(thumbnail.get_size(), (save.THUMBNAIL_WIDTH, 135))
+        self.assertLess(
+            len(header["thumbnail"]), len(self.save_data["screenshot"])
+        )
+
+    def test_no_screenshot(self):
+        del self.save_data["screenshot"]
+        self.assertNotIn("thumbnail", save.get_save_header(self.save_data))
+
+    def test_empty_slot(self):
+        self.assertIsNone(save.load_header(2))
+
+    def test_header_does_not_load_save(self):
+        save.save(self.save_data, 1)
+        with patch("tuxemon.save.load") as load:
+            save.load_header(1)
+        load.assert_not_called()
+
+    def test_missing_header_is_rebuilt(self):
+        save.save(self.save_data, 1)
+        save.get_header_path(1).unlink()
+        with patch("tuxemon.save.load", return_value=self.save_data):
+            header = save.load_header(1)
+        self.assertEqual(header["player_name"], "Red")
+        self.assertTrue(save.get_header_path(1).exists())
+
+    def test_stale_header_is_rebuilt(self):
+        save.save(self.save_data, 1)
+        header_path = save.get_header_path(1)
+        stat = save.get_save_path(1).stat()
+        os.utime(header_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        with patch("tuxemon.save.load", return_value=self.save_data) as load:
+            save.load_header(1)
+        load.assert_called_once_with(1)
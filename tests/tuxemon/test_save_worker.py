@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from tuxemon.save_worker import SaveStatus, SaveWorker
+
+
+class TestSaveWorker(unittest.TestCase):
+    def setUp(self):
+        self.worker = SaveWorker()
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.worker.shutdown()
+
+    def blocked_write(self):
+        self.release.wait(5)
+
+    def test_idle_slot(self):
+        self.assertEqual(self.worker.get_status(1), SaveStatus.IDLE)
+        self.assertFalse(self.worker.is_saving())
+
+    def test_pending_save(self):
+        self.worker.submit(1, self.blocked_write)
+        self.assertEqual(self.worker.get_status(1), SaveStatus.SAVING)
+        self.assertTrue(self.worker.is_saving())
+        self.assertFalse(self.worker.is_saving(2))
+        self.release.set()
+        self.worker.wait(1)
+        self.assertEqual(self.worker.get_status(1), SaveStatus.DONE)
+
+    def test_failed_save(self):
+        def write():
+            raise OSError("disk full")
+
+        self.worker.submit(1, write)
+        self.worker.wait()
+        self.assertEqual(self.worker.get_status(1), SaveStatus.FAILED)
+
+    def test_saves_are_written_in_order(self):
+        written = []
+        self.worker.submit(1, lambda: written.append("first"))
+        self.worker.submit(1, lambda: written.append("second"))
+        self.worker.wait()
+        self.assertEqual(written, ["first", "second"])
+
+    def test_callback_runs_on_update(self):
+        callback = MagicMock()
+        self.worker.submit(1, self.blocked_write, callback)
+        self.worker.update()
+        callback.assert_not_called()
+        self.release.set()
+        self.worker.wait()
+        self.worker.update()
+        callback.assert_called_once_with(None)
+        self.worker.update()
+        callback.assert_called_once()
+
+    def test_callback_receives_error(self):
+        error = OSError("disk full")
+
+        def write():
+            raise error
+
+        callback = MagicMock()
+        self.worker.submit(1, write, callback)
+        self.worker.shutdown()
+        callback.assert_called_once_with(error)
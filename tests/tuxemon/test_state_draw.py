@@ -4,9 +4,15 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 import pygame
+from pygame.rect import Rect
+from pygame.sprite import Group
+from pygame.surface import Surface
 
 from tuxemon import prepare
+from tuxemon.map_view import MapRenderer
+from tuxemon.math import Vector3
 from tuxemon.state_draw import EventDebugDrawer, Renderer, StateDrawer
+from tuxemon.states.world.worldstate import WorldState
 
 
 class TestRenderer(unittest.TestCase):
@@ -138,6 +144,221 @@ class TestStateDrawer(unittest.TestCase):
         self.state2.draw.assert_called_once_with(self.surface)
 
 
+class TestStateDrawerDirtyRects(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = Surface((100, 100))
+        self.state_manager = MagicMock()
+        self.config = MagicMock()
+        self.config.dirty_rects = True
+        self.state_drawer = StateDrawer(
+            self.surface, self.state_manager, self.config
+        )
+        self.world = MagicMock(
+            transparent=False, force_draw=False, cache_backdrop=False
+        )
+        self.world.rect = Rect(0, 0, 100, 100)
+        self.menu = MagicMock(
+            transparent=False, force_draw=False, cache_backdrop=False
+        )
+        self.menu.rect = Rect(10, 10, 20, 20)
+        self.state_manager.active_states = [self.menu, self.world]
+
+    def test_first_frame_is_full(self):
+        self.world.get_dirty_rects.return_value = []
+        self.menu.get_dirty_rects.return_value = []
+        self.assertIsNone(self.state_drawer.draw())
+        self.world.draw.assert_called_once_with(self.surface)
+        self.menu.draw.assert_called_once_with(self.surface)
+
+    def test_unchanged_frame_is_not_drawn(self):
+        self.state_drawer.draw()
+        self.world.get_dirty_rects.return_value = []
+        self.menu.get_dirty_rects.return_value = []
+        self.assertEqual(self.state_drawer.draw(), [])
+        self.assertEqual(self.world.draw.call_count, 1)
+
+    def test_changed_area_is_drawn(self):
+        self.state_drawer.draw()
+        self.world.get_dirty_rects.return_value = []
+        self.menu.get_dirty_rects.return_value = [
+            Rect(10, 10, 5, 5),
+            Rect(20, 20, 5, 5),
+        ]
+        clips = []
+        self.world.draw.side_effect = lambda surface: clips.append(
+            surface.get_clip()
+        )
+        self.assertEqual(self.state_drawer.draw(), [Rect(10, 10, 15, 15)])
+        self.assertEqual(clips, [Rect(10, 10, 15, 15)])
+        self.assertEqual(self.menu.draw.call_count, 2)
+        self.assertEqual(self.surface.get_clip(), Rect(0, 0, 100, 100))
+
+    def test_unknown_change_is_full(self):
+        self.state_drawer.draw()
+        self.world.get_dirty_rects.return_value = None
+        self.menu.get_dirty_rects.return_value = []
+        self.assertIsNone(self.state_drawer.draw())
+
+    def test_new_state_is_full(self):
+        self.state_drawer.draw()
+        self.world.get_dirty_rects.return_value = []
+        self.menu.get_dirty_rects.return_value = []
+        self.state_manager.active_states = [self.world]
+        self.assertIsNone(self.state_drawer.draw())
+
+    def test_invalidate(self):
+        self.state_drawer.draw()
+        self.world.get_dirty_rects.return_value = []
+        self.menu.get_dirty_rects.return_value = []
+        self.state_drawer.invalidate()
+        self.assertIsNone(self.state_drawer.draw())
+
+    def test_disabled(self):
+        self.state_drawer.dirty_rects = False
+        self.state_drawer.draw()
+        self.world.get_dirty_rects.return_value = []
+        self.menu.get_dirty_rects.return_value = []
+        self.assertIsNone(self.state_drawer.draw())
+        self.world.get_dirty_rects.assert_not_called()
+
+
+class TestStateDrawerBackdrop(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = Surface((100, 100))
+        self.state_manager = MagicMock()
+        self.config = MagicMock()
+        self.config.dirty_rects = False
+        self.state_drawer = StateDrawer(
+            self.surface, self.state_manager, self.config
+        )
+        self.world = MagicMock(
+            transparent=False, force_draw=False, cache_backdrop=True
+        )
+        self.world.rect = Rect(0, 0, 100, 100)
+        self.world.get_backdrop_key.return_value = 0
+        self.world.draw.side_effect = lambda surface: surface.fill((255, 0, 0))
+        self.menu = MagicMock(
+            transparent=True, force_draw=False, cache_backdrop=False
+        )
+        self.menu.rect = Rect(10, 10, 20, 20)
+        self.state_manager.active_states = [self.menu, self.world]
+
+    def test_paused_state_is_drawn_once(self):
+        self.state_drawer.draw()
+        self.state_drawer.draw()
+        self.world.draw.assert_called_once_with(self.surface)
+        self.assertEqual(self.menu.draw.call_count, 2)
+        self.assertEqual(self.surface.get_at((0, 0)), (255, 0, 0))
+
+    def test_key_change_draws_again(self):
+        self.state_drawer.draw()
+        self.world.get_backdrop_key.return_value = 1
+        self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 2)
+
+    def test_changing_state_is_not_cached(self):
+        for key in range(4):
+            self.world.get_backdrop_key.return_value = key
+            self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 4)
+        self.assertIsNone(self.state_drawer._backdrop)
+
+    def test_state_cached_again_when_still(self):
+        for key in (0, 1, 2, 2, 2, 2):
+            self.world.get_backdrop_key.return_value = key
+            self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 4)
+        self.assertIsNotNone(self.state_drawer._backdrop)
+
+    def test_busy_state_is_not_cached(self):
+        self.world.get_backdrop_key.return_value = None
+        self.state_drawer.draw()
+        self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 2)
+
+    def test_running_state_is_not_cached(self):
+        self.state_manager.active_states = [self.world]
+        self.state_drawer.draw()
+        self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 2)
+        self.world.get_backdrop_key.assert_not_called()
+
+    def test_resumed_state_is_drawn(self):
+        self.state_drawer.draw()
+        self.state_manager.active_states = [self.world]
+        self.state_drawer.draw()
+        self.state_manager.active_states = [self.menu, self.world]
+        self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 3)
+
+
+class TestWorldBackdrop(unittest.TestCase):
+
+    def setUp(self):
+        for name, value in (
+            ("TILE_SIZE", (16, 16)),
+            ("SCREEN_SIZE", (100, 100)),
+        ):
+            patcher = patch.object(prepare, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.surface = Surface((100, 100))
+        self.state_manager = MagicMock()
+        self.config = MagicMock()
+        self.config.dirty_rects = False
+        self.state_drawer = StateDrawer(
+            self.surface, self.state_manager, self.config
+        )
+        client = MagicMock()
+        client.screen = Surface((1, 1))
+        camera = client.camera_manager.get_active_camera.return_value
+        camera.position = (0, 0)
+        self.current_map = MagicMock(animated_tiles=[], tiles_revision=0)
+        self.current_map.edges = "clamped"
+        self.current_map.size = (100, 100)
+        self.current_map.renderer.get_center_offset.return_value = (0, 0)
+        client.map_manager.current_map = self.current_map
+        self.npc = MagicMock()
+        self.npc.position = Vector3(1, 1, 0)
+        renderer = self.npc.sprite_controller.get_sprite_renderer.return_value
+        renderer.rect = Rect(0, 0, 16, 16)
+        renderer.get_frame.return_value = Surface((16, 16))
+        client.npc_manager.npcs = {"npc": self.npc}
+
+        # the world state, without loading a map
+        self.world = WorldState.__new__(WorldState)
+        self.world.animations = Group()
+        self.world.backdrop_revision = 0
+        self.world.client = client
+        self.world.transition_manager = MagicMock(in_transition=False)
+        self.world.map_renderer = MapRenderer(client)
+        self.world.draw = MagicMock()
+        self.dialog = MagicMock(
+            transparent=True, force_draw=False, cache_backdrop=False
+        )
+        self.dialog.rect = Rect(10, 10, 20, 20)
+        self.state_manager.active_states = [self.dialog, self.world]
+
+    def test_still_world_is_drawn_once(self):
+        self.state_drawer.draw()
+        self.state_drawer.draw()
+        self.world.draw.assert_called_once_with(self.surface)
+
+    def test_npc_moving_under_dialog_is_drawn(self):
+        self.state_drawer.draw()
+        self.npc.position = Vector3(2, 1, 0)
+        self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 2)
+
+    def test_animated_tiles_are_drawn(self):
+        self.current_map.animated_tiles = ["water"]
+        self.state_drawer.draw()
+        self.state_drawer.draw()
+        self.assertEqual(self.world.draw.call_count, 2)
+
+
 class TestEventDebugDrawer(unittest.TestCase):
 
     @classmethod
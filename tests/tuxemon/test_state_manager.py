@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from tuxemon.menu.input import InputMenu
 from tuxemon.state import HookManager, State, StateManager, StateRepository
+from tuxemon.states.manifest import STATES
+from tuxemon.states.sink import SinkState
 from tuxemon.states.world.worldstate import WorldState
 
 
@@ -318,3 +320,62 @@ class TestStateManagerResumeCallCount(unittest.TestCase):
         self.state_manager.push_state(self.input_menu)
         self.state_manager.pop_state()
         self.world_state.resume.assert_called()
+
+
+class TestLazyStateDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.sm = StateManager(
+            "tuxemon.states", HookManager(), StateRepository()
+        )
+        self.sm.auto_state_discovery(lazy=True)
+
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(self.sm.build_manifest(), STATES)
+
+    def test_no_state_is_loaded(self):
+        self.assertEqual(self.sm.query_all_states(), {})
+
+    def test_state_is_loaded_when_used(self):
+        state = self.sm._get_state_class("SinkState")
+        self.assertIs(state, SinkState)
+        self.assertEqual(self.sm.query_all_states(), {"SinkState": SinkState})
+
+    @patch.object(StateManager, "auto_state_discovery")
+    def test_out_of_date_manifest(self, discovery):
+        self.sm._manifest = {"Unknown": "tuxemon.states.sink"}
+        with self.assertRaises(ValueError):
+            self.sm._get_state_class("Unknown")
+        discovery.assert_called_once_with()
+
+    @patch.object(StateManager, "auto_state_discovery")
+    def test_state_not_in_manifest(self, discovery):
+        with self.assertRaises(ValueError):
+            self.sm._get_state_class("Unknown")
+        discovery.assert_called_once_with()
+
+    def test_package_without_manifest(self):
+        sm = StateManager("head.tail", HookManager(), StateRepository())
+        self.assertIsNone(sm.load_manifest())
+
+    @patch("tuxemon.state.import_module")
+    def test_warm_up(self, import_module):
+        self.sm._manifest = {"A": "states.a", "B": "states.b"}
+        self.sm.warm_up()
+        import_module.assert_not_called()
+        self.sm.warm_up_step(lambda: 1.0)
+        import_module.assert_has_calls([call("states.a"), call("states.b")])
+
+    @patch("tuxemon.state.import_module")
+    def test_warm_up_step_without_time_left(self, import_module):
+        self.sm._manifest = {"A": "states.a", "B": "states.b"}
+        self.sm.warm_up()
+        self.sm.warm_up_step(lambda: 0.0)
+        import_module.assert_not_called()
+
+    @patch("tuxemon.state.import_module")
+    def test_warm_up_step_stops_when_frame_is_due(self, import_module):
+        self.sm._manifest = {"A": "states.a", "B": "states.b"}
+        self.sm.warm_up()
+        time_left = iter([0.01, 0.0])
+        self.sm.warm_up_step(lambda: next(time_left))
+        import_module.assert_called_once_with("states.a")
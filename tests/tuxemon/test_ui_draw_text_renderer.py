@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
+from unittest.mock import patch
 
 import pygame
 from pygame.surface import Surface
 
-from tuxemon.ui.draw import TextRenderer
+from tuxemon.ui.draw import TextRenderer, clear_text_cache
 
 
 class TestTextRenderer(unittest.TestCase):
@@ -70,3 +71,83 @@ class TestTextRenderer(unittest.TestCase):
             surface.get_flags() & pygame.SRCALPHA, pygame.SRCALPHA
         )
         self.assertEqual(surface.get_alpha(), 255)
+
+    def test_shadow_text_returns_copy(self):
+        first = self.text_renderer.shadow_text("Hello, World!")
+        second = self.text_renderer.shadow_text("Hello, World!")
+        self.assertIsNot(first, second)
+        self.assertEqual(first.get_size(), second.get_size())
+
+    def test_cached_shadow_text(self):
+        clear_text_cache()
+        first = self.text_renderer.cached_shadow_text("Hello, World!")
+        second = self.text_renderer.cached_shadow_text("Hello, World!")
+        self.assertIs(first, second)
+        other = self.text_renderer.cached_shadow_text(
+            "Hello, World!", fg=(0, 0, 255)
+        )
+        self.assertIsNot(first, other)
+
+    def test_cached_shadow_text_is_bounded(self):
+        clear_text_cache()
+        with patch("tuxemon.ui.draw.TEXT_CACHE_SIZE", 2):
+            first = self.text_renderer.cached_shadow_text("a")
+            self.text_renderer.cached_shadow_text("b")
+            self.text_renderer.cached_shadow_text("c")
+            again = self.text_renderer.cached_shadow_text("a")
+        self.assertIsNot(first, again)
+
+    def test_cached_shadow_text_shared_by_default_fonts(self):
+        clear_text_cache()
+        renderer = TextRenderer((255, 255, 255))
+        self.assertIsNot(renderer.font, self.text_renderer.font)
+        self.assertIs(
+            renderer.cached_shadow_text("Hello, World!"),
+            self.text_renderer.cached_shadow_text("Hello, World!"),
+        )
+
+
+class TestGlyphAtlas(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        clear_text_cache()
+        self.text_renderer = TextRenderer((255, 255, 255))
+        self.atlas = self.text_renderer.get_atlas()
+
+    def test_atlas_is_shared(self):
+        renderer = TextRenderer((0, 0, 0), font=self.text_renderer.font)
+        self.assertIs(
+            renderer.get_atlas(fg=(255, 255, 255)),
+            self.atlas,
+        )
+        self.assertIsNot(renderer.get_atlas(), self.atlas)
+
+    def test_atlas_is_shared_by_default_fonts(self):
+        renderer = TextRenderer((255, 255, 255))
+        self.assertIs(renderer.get_atlas(), self.atlas)
+
+    def test_glyph_is_rendered_once(self):
+        with patch.object(
+            self.text_renderer,
+            "render_shadow_text",
+            wraps=self.text_renderer.render_shadow_text,
+        ) as render:
+            self.assertIs(self.atlas.glyph("a"), self.atlas.glyph("a"))
+        render.assert_called_once()
+
+    def test_positions(self):
+        font = self.text_renderer.font
+        line = "Hello, World!"
+        positions = self.atlas.positions(line)
+        self.assertEqual(positions[0], 0)
+        self.assertEqual(len(positions), len(line))
+        self.assertEqual(positions, sorted(positions))
+        self.assertLess(positions[-1], font.size(line)[0])
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from tuxemon.db import Direction
+from tuxemon.walkability import ALL_DIRECTIONS, WalkabilityGrid
+
+
+class TestWalkabilityGrid(unittest.TestCase):
+    def test_inner_tile_can_exit_in_all_directions(self):
+        grid = WalkabilityGrid((3, 3))
+        self.assertEqual(grid.get_exit_mask((1, 1)), ALL_DIRECTIONS)
+
+    def test_corner_tile_cannot_exit_past_map_edges(self):
+        grid = WalkabilityGrid((3, 3))
+        self.assertFalse(grid.can_exit((0, 0), Direction.up))
+        self.assertFalse(grid.can_exit((0, 0), Direction.left))
+        self.assertTrue(grid.can_exit((0, 0), Direction.down))
+        self.assertTrue(grid.can_exit((0, 0), Direction.right))
+
+    def test_opposite_corner_cannot_exit_past_map_edges(self):
+        grid = WalkabilityGrid((3, 3))
+        self.assertFalse(grid.can_exit((2, 2), Direction.down))
+        self.assertFalse(grid.can_exit((2, 2), Direction.right))
+
+    def test_wall_blocks_direction(self):
+        grid = WalkabilityGrid((3, 3), {((1, 1), Direction.up)})
+        self.assertFalse(grid.can_exit((1, 1), Direction.up))
+        self.assertTrue(grid.can_exit((1, 1), Direction.down))
+
+    def test_wall_outside_map_is_ignored(self):
+        grid = WalkabilityGrid((3, 3), {((5, 5), Direction.up)})
+        self.assertEqual(grid.get_exit_mask((1, 1)), ALL_DIRECTIONS)
+
+    def test_tile_outside_map_has_no_exits(self):
+        grid = WalkabilityGrid((3, 3))
+        self.assertEqual(grid.get_exit_mask((-1, 0)), 0)
+        self.assertEqual(grid.get_neighbors((3, 0)), [])
+
+    def test_get_neighbors_of_corner_tile(self):
+        grid = WalkabilityGrid((3, 3))
+        neighbors = grid.get_neighbors((0, 0))
+        self.assertEqual(
+            neighbors, [(Direction.down, (0, 1)), (Direction.right, (1, 0))]
+        )
+
+    def test_get_neighbors_skips_walls(self):
+        grid = WalkabilityGrid((3, 3), {((1, 1), Direction.left)})
+        neighbors = [tile for _, tile in grid.get_neighbors((1, 1))]
+        self.assertNotIn((0, 1), neighbors)
+        self.assertEqual(len(neighbors), 3)
+
+    def test_empty_map(self):
+        grid = WalkabilityGrid((0, 0))
+        self.assertEqual(grid.get_neighbors((0, 0)), [])
@@ -436,10 +436,18 @@ class AIManager:
         self.combat = combat
         self.active_ais: dict[Monster, AI] = {}
 
-    def process_ai_turn(self, monster: Monster, character: NPC) -> None:
+    def process_ai_turn(
+        self, monster: Monster, character: NPC, riddles: bool = True
+    ) -> None:
         """
         Processes a single AI monster's turn.
         Retrieves or creates the AI instance and tells it to take its turn.
+
+        Parameters:
+            monster: The monster taking its turn.
+            character: The owner of the monster.
+            riddles: Whether the monster answers a riddle, as in the game,
+                or chooses one of its techniques.
         """
         if monster not in self.active_ais:
             logger.debug(f"New AI instance for monster: {monster}")
@@ -449,7 +457,10 @@ class AIManager:
 
         ai_instance = self.active_ais[monster]
         logger.debug(f"AI turn for monster: {monster}")
-        ai_instance.take_turn()
+        if riddles:
+            ai_instance.take_turn()
+        else:
+            ai_instance.take_technique_turn()
 
     def remove_ai(self, monster: Monster) -> None:
         """Removes the AI instance associated with the given monster."""
@@ -504,6 +515,13 @@ class AI:
         # Use riddle-based combat instead of traditional techniques
         self.riddle_ai.take_riddle_turn()
 
+    def take_technique_turn(self) -> None:
+        """
+        Causes this AI monster to choose one of its techniques, or an item,
+        with the decision strategy of the battle.
+        """
+        self.decision_strategy.make_decision(self)
+
     def get_available_moves(self) -> list[tuple[Technique, Monster]]:
         """
         Use TechniqueTracker to get valid moves.
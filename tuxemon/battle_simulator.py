@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Batch runner for the headless battle engine.
+
+Plays many seeded battles between the same two teams, over a pool of
+processes, and sums their results up: win rates, draws and the number
+of turns the battles lasted. The battles are rebuilt from scratch for
+each seed, so a seed always replays the same battle.
+
+See scripts/simulate_battles.py for the command line.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import random
+import statistics
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Literal, Optional
+
+from tuxemon.db import db
+from tuxemon.monster import Monster
+from tuxemon.npc import NPC
+from tuxemon.player import Player
+from tuxemon.riddle.riddle_manager import riddle_manager
+from tuxemon.session import Session
+from tuxemon.states.combat.combat_engine import (
+    BattleEngine,
+    BattleOutcome,
+    BattleResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TeamSpec:
+    npc_slug: str
+    monsters: tuple[tuple[str, int], ...]
+
+    @classmethod
+    def parse(cls, text: str) -> TeamSpec:
+        """
+        Parse a team written as ``npc_slug=monster:level,monster:level``.
+
+        Parameters:
+            text: The team.
+
+        Returns:
+            The specification of the team.
+        """
+        npc_slug, sep, party = text.partition("=")
+        if not sep or not npc_slug or not party:
+            raise ValueError(f"Invalid team '{text}', expected npc=mon:lvl")
+        monsters = []
+        for entry in party.split(","):
+            slug, _, level = entry.partition(":")
+            if not slug or not level.isdigit():
+                raise ValueError(f"Invalid monster '{entry}' in '{text}'")
+            monsters.append((slug, int(level)))
+        return cls(npc_slug, tuple(monsters))
+
+    def build(self, session: Session) -> NPC:
+        """
+        Create the character and its party.
+
+        Parameters:
+            session: Session of the battle.
+
+        Returns:
+            The character, ready to fight.
+        """
+        npc = NPC(self.npc_slug, session=session)
+        for slug, level in self.monsters:
+            monster = Monster.spawn_base(slug, level)
+            npc.party.add_monster(monster, len(npc.monsters))
+        return npc
+
+
+@dataclass(frozen=True)
+class BattleSpec:
+    teams: tuple[TeamSpec, TeamSpec]
+    combat_type: Literal["monster", "trainer"] = "trainer"
+    battle_mode: Literal["single", "double"] = "single"
+    riddles: bool = True
+    max_turns: int = 100
+
+
+@dataclass
+class BattleStats:
+    wins: list[int] = field(default_factory=lambda: [0, 0])
+    outcomes: Counter[BattleOutcome] = field(default_factory=Counter)
+    turns: list[int] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def battles(self) -> int:
+        return len(self.turns)
+
+    def add(self, result: Optional[BattleResult]) -> None:
+        """Count the result of a battle, ``None`` if it failed."""
+        if result is None:
+            self.errors += 1
+            return
+        self.outcomes[result.outcome] += 1
+        self.turns.append(result.turns)
+        if result.winner is not None:
+            self.wins[result.winner] += 1
+
+    def win_rate(self, team: int) -> float:
+        """Share of the battles won by the team."""
+        return self.wins[team] / self.battles if self.battles else 0.0
+
+    def summary(self) -> str:
+        """The statistics, one per line."""
+        lines = [f"battles: {self.battles}"]
+        for team, wins in enumerate(self.wins):
+            lines.append(
+                f"team {team + 1} wins: {wins} ({self.win_rate(team):.1%})"
+            )
+        for outcome in BattleOutcome:
+            if outcome != BattleOutcome.WON:
+                lines.append(f"{outcome.value}: {self.outcomes[outcome]}")
+        lines.append(f"errors: {self.errors}")
+        if self.turns:
+            lines.append(
+                f"turns: mean {statistics.mean(self.turns):.2f}, "
+                f"median {statistics.median(self.turns):g}, "
+                f"min {min(self.turns)}, max {max(self.turns)}"
+            )
+        return "\n".join(lines)
+
+
+def load_database() -> None:
+    """Load the database once per process, without validating assets."""
+    if not any(db.database.values()):
+        db.load(validate=False)
+        # the riddles were looked up when the riddle AI was imported
+        riddle_manager.reload_riddles()
+
+
+def simulate_battle(spec: BattleSpec, seed: int) -> Optional[BattleResult]:
+    """
+    Play one battle.
+
+    Some effects need a map or a client, and some techniques have broken
+    data: a battle running into one is logged and skipped, so that it
+    doesn't take the whole batch down.
+
+    Parameters:
+        spec: The battle to play.
+        seed: Seed of the random draws, from the parties to the last hit.
+
+    Returns:
+        The result of the battle, ``None`` if it failed.
+    """
+    random.seed(seed)
+    session = Session()
+    # effects read the game variables (hour, weather...) of the player
+    Player.create(session)
+    teams = [team.build(session) for team in spec.teams]
+    engine = BattleEngine(
+        session,
+        teams,
+        combat_type=spec.combat_type,
+        battle_mode=spec.battle_mode,
+        riddles=spec.riddles,
+        max_turns=spec.max_turns,
+    )
+    try:
+        return engine.run()
+    except Exception as exc:
+        logger.error(f"Battle with seed {seed} failed: {exc!r}")
+        return None
+
+
+def run_batch(
+    spec: BattleSpec,
+    battles: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> BattleStats:
+    """
+    Play many battles and sum their results up.
+
+    Parameters:
+        spec: The battle to play.
+        battles: Number of battles, with the seeds following ``seed``.
+        seed: Seed of the first battle.
+        workers: Number of processes. Defaults to the number of CPUs, 1
+            plays the battles in this process.
+
+    Returns:
+        The statistics of the battles.
+    """
+    seeds = range(seed, seed + battles)
+    play = partial(simulate_battle, spec)
+    stats = BattleStats()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        load_database()
+        for result in map(play, seeds):
+            stats.add(result)
+        return stats
+
+    chunksize = max(1, battles // (workers * 8))
+    with ProcessPoolExecutor(workers, initializer=load_database) as pool:
+        for result in pool.map(play, seeds, chunksize=chunksize):
+            stats.add(result)
+    return stats
+
+
+def parse_teams(texts: Sequence[str]) -> tuple[TeamSpec, TeamSpec]:
+    """
+    Parse the two teams of a battle.
+
+    Parameters:
+        texts: The teams, see ``TeamSpec.parse``.
+
+    Returns:
+        The specifications of the teams.
+    """
+    if len(texts) != 2:
+        raise ValueError(f"A battle needs two teams, {len(texts)} were given")
+    return TeamSpec.parse(texts[0]), TeamSpec.parse(texts[1])
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import time
 from collections.abc import Mapping, Sequence
 from enum import Enum
 from pathlib import Path
@@ -11,6 +10,7 @@ from threading import Thread
 from typing import Any, Optional, TypeVar, Union, overload
 
 import pygame
+from pygame.rect import Rect
 from pygame.surface import Surface
 
 from tuxemon.audio import MusicPlayerState, SoundManager
@@ -19,13 +19,17 @@ from tuxemon.camera import CameraManager
 from tuxemon.cli.processor import CommandProcessor
 from tuxemon.collision_manager import CollisionManager
 from tuxemon.config import TuxemonConfig
+from tuxemon.constants.paths import CACHE_DIR
 from tuxemon.event.eventaction import ActionManager
 from tuxemon.event.eventcondition import ConditionManager
 from tuxemon.event.eventengine import EventEngine
 from tuxemon.event.eventmanager import EventManager
 from tuxemon.event.eventpersist import EventPersist
+from tuxemon.frame_scheduler import FrameScheduler
+from tuxemon.map_cache import MapCache
 from tuxemon.map_loader import MapLoader
 from tuxemon.map_manager import MapManager
+from tuxemon.map_prefetcher import MapPrefetcher
 from tuxemon.map_transition import MapTransition
 from tuxemon.movement import MovementManager, Pathfinder
 from tuxemon.networking import NetworkManager
@@ -34,6 +38,7 @@ from tuxemon.park_tracker import ParkSession
 from tuxemon.platform.events import PlayerInput
 from tuxemon.platform.input_manager import InputManager
 from tuxemon.rumble import RumbleManager
+from tuxemon.save_worker import saver
 from tuxemon.session import local_session
 from tuxemon.state import HookManager, State, StateManager, StateRepository
 from tuxemon.state_draw import EventDebugDrawer, Renderer, StateDrawer
@@ -93,7 +98,7 @@ class LocalPygameClient:
             repository=self.state_repository,
             on_state_change=self.on_state_change,
         )
-        self.state_manager.auto_state_discovery()
+        self.state_manager.auto_state_discovery(lazy=config.lazy_states)
         self.screen = screen
         self.state = ClientState.RUNNING
         self.current_time = 0.0
@@ -104,6 +109,9 @@ class LocalPygameClient:
         # movie creation
         self.frame_number = 0
         self.save_to_disk = False
+        self.frame_scheduler = FrameScheduler(
+            self.config.fps, self.config.fixed_timestep
+        )
 
         # Initialize drawers
         self.state_drawer = StateDrawer(
@@ -138,7 +146,9 @@ class LocalPygameClient:
             self.event_manager, self.input_manager
         )
         self.npc_manager = NPCManager()
-        self.map_loader = MapLoader()
+        self.map_loader = MapLoader(
+            MapCache(CACHE_DIR / "maps") if config.map_cache else None
+        )
         self.map_manager = MapManager()
         self.collision_manager = CollisionManager(
             self.map_manager, self.npc_manager
@@ -150,12 +160,18 @@ class LocalPygameClient:
             self.collision_manager,
             self.boundary,
         )
+        self.map_prefetcher = (
+            MapPrefetcher(MapLoader(self.map_loader.cache))
+            if config.prefetch_maps
+            else None
+        )
         self.map_transition = MapTransition(
             self.map_loader,
             self.npc_manager,
             self.map_manager,
             self.boundary,
             self.event_engine,
+            self.map_prefetcher,
         )
         self.camera_manager = CameraManager()
 
@@ -207,26 +223,37 @@ class LocalPygameClient:
         draw = self.draw
         screen = self.screen
         flip = pygame.display.update
-        clock = time.time
-        frame_length = 1.0 / self.config.fps
-        time_since_draw = 0.0
-        last_update = clock()
+        scheduler = self.frame_scheduler
+        clock = scheduler.clock
 
         while self.state != ClientState.DONE:
             if self.state == ClientState.RUNNING:
-                clock_tick = clock() - last_update
-                last_update = clock()
-                time_since_draw += clock_tick
-                update(clock_tick)
-                if time_since_draw >= frame_length:
-                    time_since_draw -= frame_length
-                    draw()
-                    if self.input_manager.controller_overlay:
-                        self.input_manager.controller_overlay.draw(screen)
+                clock_tick = scheduler.tick()
+                update_start = clock()
+                for time_delta in scheduler.steps(clock_tick):
+                    update(time_delta)
+                draw_start = clock()
+                dirty = draw()
+                if self.input_manager.controller_overlay:
+                    self.input_manager.controller_overlay.draw(screen)
+                    self.state_drawer.invalidate()
+                    dirty = None
+                if dirty is None:
                     flip()
+                elif dirty:
+                    flip(dirty)
+                if self.frame_number == 1 and self.config.warm_up_states:
+                    # the first frame is shown, import the other states
+                    # in the idle time of the next frames
+                    self.state_manager.warm_up()
+                scheduler.record(
+                    update=draw_start - update_start,
+                    draw=clock() - draw_start,
+                )
+                self.state_manager.warm_up_step(scheduler.time_left)
                 if self.config.show_fps:
-                    self.renderer.update_fps(clock_tick)
-                time.sleep(0.01)
+                    self.renderer.update_fps(clock_tick, scheduler.timings)
+                scheduler.wait()
             elif self.state == ClientState.EXITING:
                 self.perform_cleanup()
                 self.state = ClientState.DONE
@@ -258,6 +285,9 @@ class LocalPygameClient:
 
         self.event_engine.update(time_delta)
 
+        # report the saves written in the background
+        saver.update()
+
         if self.event_data:
             logger.debug("Event Data:" + str(self.event_data))
 
@@ -271,6 +301,9 @@ class LocalPygameClient:
     def perform_cleanup(self) -> None:
         """Handles necessary cleanup before shutting down."""
         self.current_music.stop()
+        saver.shutdown()
+        if self.map_prefetcher is not None:
+            self.map_prefetcher.shutdown()
         local_session.reset()
         logger.info("Performing cleanup before exiting...")
 
@@ -285,9 +318,15 @@ class LocalPygameClient:
         if self.state_manager.current_state is None:
             self.state = ClientState.EXITING
 
-    def draw(self) -> None:
-        """Centralized draw logic."""
-        self.renderer.draw(
+    def draw(self) -> Optional[list[Rect]]:
+        """
+        Centralized draw logic.
+
+        Returns:
+            The areas of the screen that changed, or ``None`` if the whole
+            screen was drawn.
+        """
+        dirty = self.renderer.draw(
             frame_number=self.frame_number,
             save_to_disk=self.save_to_disk,
             collision_map=self.config.collision_map,
@@ -295,6 +334,7 @@ class LocalPygameClient:
             partial_events=self.event_engine.partial_events,
         )
         self.frame_number += 1
+        return dirty
 
     def get_map_name(self) -> str:
         """
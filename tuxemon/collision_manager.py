@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from collections.abc import Mapping, MutableMapping, Sequence
-from typing import TYPE_CHECKING, Any, DefaultDict, Optional, Union
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from tuxemon import prepare
 from tuxemon.db import Direction
@@ -27,9 +26,52 @@ CollisionMap = Mapping[
 ]
 
 
+class CollisionView(Mapping[tuple[int, int], Optional[RegionProperties]]):
+    """
+    Read-only view layering NPC positions under the collision index.
+
+    Tiles present in the index (collision map and blocking surfaces) take
+    precedence over NPC entries, mirroring the order in which the full
+    collision dictionary used to be assembled.
+    """
+
+    def __init__(
+        self,
+        index: Mapping[tuple[int, int], Optional[RegionProperties]],
+        npcs: Mapping[tuple[int, int], RegionProperties],
+    ) -> None:
+        self._index = index
+        self._npcs = npcs
+
+    def __getitem__(
+        self, coords: tuple[int, int]
+    ) -> Optional[RegionProperties]:
+        if coords in self._index:
+            return self._index[coords]
+        return self._npcs[coords]
+
+    def __contains__(self, coords: object) -> bool:
+        return coords in self._index or coords in self._npcs
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        yield from self._index
+        for coords in self._npcs:
+            if coords not in self._index:
+                yield coords
+
+    def __len__(self) -> int:
+        extra = sum(1 for coords in self._npcs if coords not in self._index)
+        return len(self._index) + extra
+
+
 class CollisionManager:
     """
     Manages collision data and performs collision checks within the game world.
+
+    Static collision data (the map's collision regions and the tiles blocked
+    by a surface with a moverate of zero) is kept in a persistent index that
+    is updated in place by the methods of this class. Every change bumps
+    ``version`` so callers can cache results derived from the collision data.
     """
 
     def __init__(
@@ -37,6 +79,75 @@ class CollisionManager:
     ) -> None:
         self._map_manager = map_manager
         self._npc_manager = npc_manager
+        self._index: dict[tuple[int, int], Optional[RegionProperties]] = {}
+        self._collision_source: Optional[
+            MutableMapping[tuple[int, int], Optional[RegionProperties]]
+        ] = None
+        self._surface_source: Optional[
+            MutableMapping[tuple[int, int], dict[str, float]]
+        ] = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented every time the collision index changes.
+        """
+        self._ensure_index()
+        return self._version
+
+    def invalidate(self) -> None:
+        """
+        Forces a full rebuild of the collision index on next access.
+
+        Only needed when the collision or surface maps of the map manager
+        have been modified without going through this class.
+        """
+        self._collision_source = None
+        self._surface_source = None
+
+    def _ensure_index(self) -> None:
+        """Rebuilds the index if the map manager switched to a new map."""
+        if (
+            self._collision_source is self._map_manager.collision_map
+            and self._surface_source is self._map_manager.surface_map
+        ):
+            return
+        self._collision_source = self._map_manager.collision_map
+        self._surface_source = self._map_manager.surface_map
+        self._index = {}
+        for coords in self._surface_source:
+            self._index_tile(coords)
+        for coords, region in self._collision_source.items():
+            self._index[coords] = region
+        self._version += 1
+
+    def _index_tile(self, coords: tuple[int, int]) -> None:
+        """Recomputes the index entry of a single tile."""
+        if coords in self._map_manager.collision_map:
+            self._index[coords] = self._map_manager.collision_map[coords]
+            return
+        label = self._blocking_surface(coords)
+        if label is None:
+            self._index.pop(coords, None)
+        else:
+            self._index[coords] = RegionProperties([], [], [], None, label)
+
+    def _refresh_tiles(self, coords: Sequence[tuple[int, int]]) -> None:
+        """Updates the index entries of the given tiles."""
+        self._ensure_index()
+        for coord in coords:
+            self._index_tile(coord)
+        self._version += 1
+
+    def _blocking_surface(self, coords: tuple[int, int]) -> Optional[str]:
+        """Returns the last surface label with a moverate of zero, if any."""
+        blocking = None
+        surface = self._map_manager.surface_map.get(coords, {})
+        for label, value in surface.items():
+            if float(value) == 0:
+                blocking = label
+        return blocking
 
     def get_all_tile_properties(
         self,
@@ -75,12 +186,17 @@ class CollisionManager:
         if label not in prepare.SURFACE_KEYS:
             return
 
+        modified = []
         for coord in self.get_all_tile_properties(
             self._map_manager.surface_map, label
         ):
             props = self._map_manager.surface_map.get(coord)
             if props and props.get(label) != moverate:
                 props[label] = moverate
+                modified.append(coord)
+
+        if modified:
+            self._refresh_tiles(modified)
 
     def all_tiles_modified(self, label: str, moverate: float) -> bool:
         """
@@ -152,6 +268,7 @@ class CollisionManager:
         )
 
         self._map_manager.collision_map[coords] = prop
+        self._refresh_tiles([coords])
 
     def remove_collision(self, tile_pos: tuple[int, int]) -> None:
         """
@@ -176,6 +293,7 @@ class CollisionManager:
         else:
             # Remove region
             del self._map_manager.collision_map[tile_pos]
+        self._refresh_tiles([tile_pos])
 
     def add_collision_label(self, label: str) -> None:
         coords = self.check_collision_zones(
@@ -191,6 +309,7 @@ class CollisionManager:
         if coords:
             for coord in coords:
                 self._map_manager.collision_map[coord] = properties
+            self._refresh_tiles(coords)
 
     def add_collision_position(
         self, label: str, position: tuple[int, int]
@@ -203,6 +322,7 @@ class CollisionManager:
             entity=None,
         )
         self._map_manager.collision_map[position] = properties
+        self._refresh_tiles([position])
 
     def remove_collision_label(self, label: str) -> None:
         properties = RegionProperties(
@@ -218,44 +338,26 @@ class CollisionManager:
         if coords:
             for coord in coords:
                 self._map_manager.collision_map[coord] = properties
+            self._refresh_tiles(coords)
 
     def get_collision_map(self) -> CollisionMap:
         """
-        Return dictionary for collision testing.
+        Return mapping for collision testing.
 
-        Returns a dictionary where keys are (x, y) tile tuples
-        and the values are tiles or NPCs.
-
-        # NOTE:
-        This will not respect map changes to collisions
-        after the map has been loaded!
+        Returns a mapping where keys are (x, y) tile tuples
+        and the values are tiles or NPCs. The static part is served
+        from the collision index, only the NPC positions are gathered
+        on each call.
 
         Returns:
-            A dictionary of collision tiles.
+            A mapping of collision tiles.
         """
-        collision_dict: DefaultDict[
-            tuple[int, int], Optional[RegionProperties]
-        ] = defaultdict(lambda: RegionProperties([], [], [], None, None))
-
-        # Get all the NPCs' tile positions
-        for npc in self._npc_manager.get_all_entities():
-            collision_dict[npc.tile_pos] = self._get_region_properties(
-                npc.tile_pos, npc
-            )
-
-        # Add surface map entries to the collision dictionary
-        for coords, surface in self._map_manager.surface_map.items():
-            for label, value in surface.items():
-                if float(value) == 0:
-                    collision_dict[coords] = self._get_region_properties(
-                        coords, label
-                    )
-
-        collision_dict.update(
-            {k: v for k, v in self._map_manager.collision_map.items()}
-        )
-
-        return dict(collision_dict)
+        self._ensure_index()
+        npcs = {
+            npc.tile_pos: RegionProperties([], [], [], npc, None)
+            for npc in self._npc_manager.get_all_entities()
+        }
+        return CollisionView(self._index, npcs)
 
     def _get_region_properties(
         self, coords: tuple[int, int], entity_or_label: Union[NPC, str]
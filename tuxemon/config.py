@@ -69,6 +69,8 @@ class TuxemonConfig:
         self.splash: bool = display["splash"]
         self.fullscreen: bool = display["fullscreen"]
         self.fps: float = display["fps"]
+        self.fixed_timestep: bool = display["fixed_timestep"]
+        self.dirty_rects: bool = display["dirty_rects"]
         self.vsync: bool = display["vsync"]
         self.show_fps: bool = display["show_fps"]
         self.scaling: bool = display["scaling"]
@@ -85,6 +87,15 @@ class TuxemonConfig:
         self.recompile_translations: bool = game["recompile_translations"]
         self.skip_titlescreen: bool = game["skip_titlescreen"]
         self.compress_save: Optional[str] = game["compress_save"] or None
+        self.background_save: bool = game["background_save"]
+        self.reactive_events: bool = game["reactive_events"]
+        self.db_cache: bool = game["db_cache"]
+        self.lazy_db: bool = game["lazy_db"]
+        self.db_preload_workers: int = game["db_preload_workers"]
+        self.map_cache: bool = game["map_cache"]
+        self.prefetch_maps: bool = game["prefetch_maps"]
+        self.lazy_states: bool = game["lazy_states"]
+        self.warm_up_states: bool = game["warm_up_states"]
 
         # [gameplay]
         gameplay = self.config["gameplay"]
@@ -286,6 +297,8 @@ def generate_default_config() -> dict[str, Any]:
             "splash": True,
             "fullscreen": False,
             "fps": 60.0,
+            "fixed_timestep": False,
+            "dirty_rects": False,
             "vsync": True,
             "show_fps": False,
             "scaling": True,
@@ -304,6 +317,15 @@ def generate_default_config() -> dict[str, Any]:
             "recompile_translations": True,
             "skip_titlescreen": False,
             "compress_save": None,
+            "background_save": True,
+            "reactive_events": False,
+            "db_cache": True,
+            "lazy_db": False,
+            "db_preload_workers": 4,
+            "map_cache": True,
+            "prefetch_maps": False,
+            "lazy_states": True,
+            "warm_up_states": True,
             "locale": "en_US",
             "translation_mode": "none",
             "font_file": "PressStart2P.ttf",
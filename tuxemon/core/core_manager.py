@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import importlib
 import logging
-from collections.abc import Sequence
+from collections.abc import MutableMapping, Sequence
 from pathlib import Path
 
 from tuxemon import plugin
@@ -20,16 +20,28 @@ class CoreManager:
     def __init__(
         self, interface: type[PluginObject], path: Path, category: str
     ) -> None:
-        self.classes: dict[str, type[PluginObject]] = {}
+        self.classes: MutableMapping[str, type[PluginObject]] = {}
         self.load_plugins(interface, path, category)
 
     def load_plugins(
         self, interface: type[PluginObject], path: Path, category: str
     ) -> None:
-        """Load all available plugins using the existing plugin system."""
-        self.classes.update(
-            plugin.load_plugins(path, category, interface=interface)
+        """
+        Load all available plugins using the existing plugin system.
+
+        The plugins are listed from the plugin manifest, and each one is
+        imported when it is first used.
+        """
+        classes = plugin.load_plugins(
+            path,
+            category,
+            interface=interface,
+            manifest=plugin.PLUGIN_MANIFEST,
         )
+        if self.classes:
+            self.classes.update(classes)
+        else:
+            self.classes = classes
 
     def load_plugin(self, name: str) -> None:
         """Dynamically load a specific plugin by name."""
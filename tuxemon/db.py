@@ -3,10 +3,23 @@
 from __future__ import annotations
 
 import difflib
+import hashlib
 import json
 import logging
+import os
+import pickle
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections import defaultdict
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from enum import Enum
 from importlib import import_module
@@ -15,6 +28,7 @@ from typing import (
     Annotated,
     Any,
     ClassVar,
+    ContextManager,
     Literal,
     Optional,
     TypeVar,
@@ -34,7 +48,8 @@ from pydantic import (
 )
 
 from tuxemon import prepare
-from tuxemon.constants.paths import mods_folder
+from tuxemon.constants import paths
+from tuxemon.constants.paths import CACHE_DIR, mods_folder
 from tuxemon.formula import config_monster
 from tuxemon.locale import T
 from tuxemon.surfanim import FlipAxes
@@ -1971,6 +1986,243 @@ class ModelLoader:
         raise RuntimeError(f"Failed to load item for table '{table}'.")
 
 
+@dataclass
+class CachedTable:
+    fingerprint: str
+    preloaded: dict[str, Any]
+    models: dict[str, DataModel]
+    validated: bool
+
+
+class DatabaseCache:
+    """
+    On-disk snapshot of the preloaded and validated database tables.
+
+    There is one snapshot file for each set of active mods. Every table is
+    stored with a fingerprint of its source files (name, size and
+    modification time), so only the tables whose files changed need to be
+    parsed and validated again. A change to the database configuration,
+    to this module, to the locale or to the resource and translation
+    files the validation checks discards the whole snapshot.
+
+    Parameters:
+        cache_dir: Directory where the snapshots are written.
+        config_path: Path of the database configuration file.
+        active_mods: The active mods, in load order.
+    """
+
+    version = 1
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        config_path: str,
+        active_mods: Sequence[str],
+    ) -> None:
+        mods_key = hashlib.sha1(",".join(active_mods).encode()).hexdigest()
+        self.path = cache_dir / f"db_{mods_key[:16]}.pickle"
+        self.base = self._get_base_fingerprint(config_path, active_mods)
+        self.tables: dict[str, CachedTable] = {}
+        self._dirty = False
+        self._read()
+
+    def _get_base_fingerprint(
+        self, config_path: str, active_mods: Sequence[str]
+    ) -> str:
+        digest = hashlib.sha1(str(self.version).encode())
+        with open(config_path, "rb") as fp:
+            digest.update(fp.read())
+        module = Path(__file__).stat()
+        digest.update(f"{module.st_size}:{module.st_mtime_ns}".encode())
+        digest.update(prepare.CONFIG.locale.slug.encode())
+        self._update_resources_fingerprint(digest, active_mods)
+        return digest.hexdigest()
+
+    def _update_resources_fingerprint(
+        self, digest: Any, active_mods: Sequence[str]
+    ) -> None:
+        # the validators check that resource files and translations exist:
+        # a file added, removed or renamed changes the time of its
+        # directory, and the translations are read from the .po files
+        walked: set[Path] = set()
+        for mod_name in active_mods:
+            for root in get_mod_roots(mod_name):
+                if not root.is_dir() or root.resolve() in walked:
+                    continue
+                walked.add(root.resolve())
+                for dirpath, _, filenames in os.walk(root, followlinks=True):
+                    stat = os.stat(dirpath)
+                    digest.update(f"{dirpath}:{stat.st_mtime_ns}".encode())
+                    for filename in filenames:
+                        if filename.endswith(".po"):
+                            stat = os.stat(os.path.join(dirpath, filename))
+                            digest.update(
+                                f"{filename}:{stat.st_size}:"
+                                f"{stat.st_mtime_ns}".encode()
+                            )
+
+    def _read(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with self.path.open("rb") as fp:
+                base, tables = pickle.load(fp)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable db cache '{self.path}': {e}")
+            return
+        if base == self.base:
+            self.tables = tables
+        else:
+            logger.info("Database configuration changed, db cache discarded.")
+
+    def fingerprint(self, directories: Sequence[Path]) -> str:
+        """
+        Computes the fingerprint of the files of a table.
+
+        Parameters:
+            directories: Directories the table is loaded from, in order.
+
+        Returns:
+            A digest of the names, sizes and modification times.
+        """
+        digest = hashlib.sha1()
+        for directory in directories:
+            digest.update(directory.as_posix().encode())
+            if not directory.is_dir():
+                continue
+            for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+                stat = entry.stat()
+                digest.update(
+                    f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+                )
+        return digest.hexdigest()
+
+    def get(self, table: str, fingerprint: str) -> Optional[CachedTable]:
+        """
+        Returns the cached table, if its files did not change.
+
+        Parameters:
+            table: Name of the table.
+            fingerprint: Current fingerprint of the table files.
+
+        Returns:
+            The cached table, or ``None``.
+        """
+        cached = self.tables.get(table)
+        if cached is None or cached.fingerprint != fingerprint:
+            return None
+        return cached
+
+    def put(
+        self,
+        table: str,
+        fingerprint: str,
+        preloaded: dict[str, Any],
+        models: dict[str, DataModel],
+        validated: bool,
+    ) -> None:
+        """
+        Stores a loaded table, to be written by ``save``.
+
+        Parameters:
+            table: Name of the table.
+            fingerprint: Fingerprint of the table files.
+            preloaded: The raw entries of the table.
+            models: The loaded models of the table.
+            validated: Whether the models were validated.
+        """
+        self.tables[table] = CachedTable(
+            fingerprint, dict(preloaded), dict(models), validated
+        )
+        self._dirty = True
+
+    def save(self) -> None:
+        """Writes the snapshot, if a table was stored since the last save."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with temp_path.open("wb") as fp:
+                pickle.dump(
+                    (self.base, self.tables),
+                    fp,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Could not write db cache '{self.path}': {e}")
+
+
+class LazyTable(MutableMapping[str, DataModel]):
+    """
+    Database table whose entries are loaded the first time they are read.
+
+    Until then, the raw preloaded entry is kept. Listing the slugs, or
+    checking whether a slug exists, does not load anything, so most of a
+    large table is never validated when a session only touches a few
+    entries.
+
+    Parameters:
+        table: Name of the table.
+        preloaded: The raw entries of the table.
+        load: Callable turning a raw entry into a model, or ``None`` if
+            the entry is invalid.
+        validated: Whether ``load`` validates the entries.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        preloaded: Mapping[str, Any],
+        load: Callable[[Mapping[str, Any]], Optional[DataModel]],
+        validated: bool,
+    ) -> None:
+        self.table = table
+        self.validated = validated
+        self._load = load
+        self._entries: dict[str, Any] = dict(preloaded)
+        self._pending = set(self._entries)
+
+    @property
+    def pending(self) -> int:
+        """Number of entries not loaded yet."""
+        return len(self._pending)
+
+    def __getitem__(self, slug: str) -> DataModel:
+        if slug in self._pending:
+            model = self._load(self._entries[slug])
+            self._pending.discard(slug)
+            if model is None:
+                del self._entries[slug]
+            else:
+                self._entries[slug] = model
+        return cast(DataModel, self._entries[slug])
+
+    def __setitem__(self, slug: str, model: DataModel) -> None:
+        self._pending.discard(slug)
+        self._entries[slug] = model
+
+    def __delitem__(self, slug: str) -> None:
+        self._pending.discard(slug)
+        del self._entries[slug]
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load_all(self) -> None:
+        """Loads all the pending entries."""
+        for slug in list(self._pending):
+            self.get(slug)
+
+
 class ModData:
 
     def __init__(
@@ -1979,12 +2231,19 @@ class ModData:
         loader: ModelLoader,
         resolver: DependencyResolver,
         mod_loader: ModMetadataLoader,
+        cache: Optional[DatabaseCache] = None,
+        preload_workers: int = 0,
     ) -> None:
         self.config = config
         self.resolver = resolver
         self.loader = loader
+        self.cache = cache
+        self.preload_workers = preload_workers
         self.preloaded: dict[str, dict[str, Any]] = {}
-        self.database: dict[str, dict[str, DataModel]] = {}
+        self.database: dict[str, MutableMapping[str, DataModel]] = {}
+        # table => fingerprint of its files, and tables restored from cache
+        self.fingerprints: dict[str, str] = {}
+        self.cached_tables: dict[str, CachedTable] = {}
         self.mod_metadata = mod_loader.load_metadata()
         if self.config.mod_tables:
             for mod, tables in self.config.mod_tables.items():
@@ -2031,18 +2290,70 @@ class ModData:
                     f"Final ordered mods for loading: {ordered_mods_for_loading}"
                 )
 
-                for mod_to_load in ordered_mods_for_loading:
-                    if mod_to_load in self.config.mod_tables:
+                if self.cache is not None:
+                    self._restore_cached_tables(ordered_mods_for_loading)
+
+                # the files of a table are read concurrently, while the
+                # tables are still merged in mod load order
+                with self._create_preload_executor() as executor:
+                    for mod_to_load in ordered_mods_for_loading:
+                        if mod_to_load not in self.config.mod_tables:
+                            continue
                         logger.info(f"Loading mod: {mod_to_load}")
                         for table in self.config.mod_tables[mod_to_load]:
-                            self._preload_table(table, mod_to_load)
+                            if table not in self.cached_tables:
+                                self._preload_table(
+                                    table, mod_to_load, executor
+                                )
             else:
                 logger.warning("No mod tables specified in config.")
         else:
             self._preload_table(directory, None)
 
+    def _create_preload_executor(self) -> ContextManager[Optional[Executor]]:
+        """
+        Creates the pool used to read the files of the tables.
+
+        Threads are used rather than processes: the preload runs while
+        this module is imported, which spawned workers would do again.
+        Reading files releases the GIL, and free-threaded builds also
+        parse in parallel. Without several workers and cores the files
+        are read serially, which is faster.
+        """
+        workers = self.preload_workers
+        if workers > 1 and (os.cpu_count() or 1) > 1:
+            return ThreadPoolExecutor(max_workers=workers)
+        return nullcontext()
+
+    def _restore_cached_tables(self, mods: Sequence[str]) -> None:
+        """Restores the tables whose files did not change from the cache."""
+        assert self.cache is not None
+        directories: defaultdict[str, list[Path]] = defaultdict(list)
+        for mod in mods:
+            path = (
+                Path(self.config.mod_base_path)
+                / mod
+                / self.config.mod_db_subfolder
+            )
+            for table in self.config.mod_tables.get(mod, []):
+                directories[table].append(path / table)
+
+        for table, table_directories in directories.items():
+            fingerprint = self.cache.fingerprint(table_directories)
+            self.fingerprints[table] = fingerprint
+            cached = self.cache.get(table, fingerprint)
+            if cached is not None:
+                self.preloaded[table] = cached.preloaded
+                self.cached_tables[table] = cached
+        logger.info(
+            f"Restored {len(self.cached_tables)} tables from the db cache."
+        )
+
     def _preload_table(
-        self, table: str, mod_directory: Optional[str] = None
+        self,
+        table: str,
+        mod_directory: Optional[str] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
         """Preloads table data from mod directories."""
         active_mods = [
@@ -2082,7 +2393,7 @@ class ModData:
                 continue
 
             if db_path.exists():
-                data_loader = load_files(table, path, self.config)
+                data_loader = load_files(table, path, self.config, executor)
                 self.preloaded.setdefault(table, {}).update(data_loader)
             else:
                 logger.warning(f"Database directory '{db_path}' not found.")
@@ -2091,6 +2402,7 @@ class ModData:
         self,
         directory: str = "all",
         validate: bool = True,
+        lazy: bool = False,
     ) -> None:
         """
         Loads all data from JSON files located under our data path.
@@ -2099,28 +2411,99 @@ class ModData:
                 to "all".
             validate: Whether or not we should raise an exception if validation
                 fails
+            lazy: Whether the entries are only loaded when they are first
+                looked up. Validation errors are then raised by the lookup.
+                See ``warm``.
         """
         if directory == "all":
             if self.config.mod_tables:
                 for mod, tables in self.config.mod_tables.items():
                     if mod in self.config.active_mods:
                         for table in tables:
-                            self._load_models_from_preloaded(table, validate)
+                            self._load_table(table, validate, lazy)
+                if self.cache is not None:
+                    self.cache.save()
             else:
                 logger.debug("No mod tables specified in config.")
+        elif lazy:
+            self._load_lazy_table(directory, validate)
         else:
             self._load_models_from_preloaded(directory, validate)
 
+    def warm(self, tables: Optional[Iterable[str]] = None) -> None:
+        """
+        Loads the pending entries of lazily loaded tables.
+
+        Meant for loading screens, so that later lookups do not validate
+        entries in the middle of the game.
+
+        Parameters:
+            tables: The tables to load. Defaults to all the tables.
+        """
+        for table in list(self.database) if tables is None else tables:
+            entries = self.database.get(table)
+            if not isinstance(entries, LazyTable) or not entries.pending:
+                continue
+            entries.load_all()
+            self._store_in_cache(table, entries.validated)
+        if self.cache is not None:
+            self.cache.save()
+
+    def _load_table(self, table: str, validate: bool, lazy: bool) -> None:
+        """Loads a table, from the cache when its files did not change."""
+        cached = self.cached_tables.get(table)
+        if cached is not None and (cached.validated or not validate):
+            self.database.setdefault(table, {}).update(cached.models)
+            return
+
+        if lazy:
+            self._load_lazy_table(table, validate)
+        else:
+            self._load_models_from_preloaded(table, validate)
+            self._store_in_cache(table, validate)
+
+    def _store_in_cache(self, table: str, validated: bool) -> None:
+        """Stores a fully loaded table in the cache."""
+        fingerprint = self.fingerprints.get(table)
+        if self.cache is not None and fingerprint is not None:
+            self.cache.put(
+                table,
+                fingerprint,
+                self.preloaded[table],
+                dict(self.database[table]),
+                validated,
+            )
+            self.cached_tables[table] = self.cache.tables[table]
+
+    def _load_lazy_table(self, table: str, validate: bool) -> None:
+        """Replaces a table by one loading its entries on first access."""
+        if isinstance(self.database.get(table), LazyTable):
+            return
+        entries = LazyTable(
+            table,
+            self.preloaded[table],
+            lambda item: self._load_preloaded_item(item, table, validate),
+            validate,
+        )
+        for slug, model in self.database.get(table, {}).items():
+            entries.setdefault(slug, model)
+        self.database[table] = entries
+
     def _load_models_from_preloaded(self, table: str, validate: bool) -> None:
         """Loads models from preloaded data into the main database."""
         for item in self.preloaded[table].values():
-            if "paths" in item:
-                del item["paths"]
-
-            model = self._validate_and_load(item, table, validate)
+            model = self._load_preloaded_item(item, table, validate)
             if model:
                 self.database[table][model.slug] = model
 
+    def _load_preloaded_item(
+        self, item: dict[str, Any], table: str, validate: bool
+    ) -> Optional[DataModel]:
+        """Loads a preloaded entry, without the paths it was read from."""
+        if "paths" in item:
+            del item["paths"]
+        return self._validate_and_load(item, table, validate)
+
     def _validate_and_load(
         self, item: Mapping[str, Any], table: str, validate: bool
     ) -> Optional[DataModel]:
@@ -2173,9 +2556,10 @@ class ModData:
         table_entry = self.database.get(table)
         if not table_entry:
             raise ValueError(f"{table} table wasn't loaded")
-        if slug not in table_entry:
+        model = table_entry.get(slug)
+        if model is None:
             self.log_missing_entry_and_raise(table, slug)
-        return table_entry[slug]
+        return cast(DataModel, model)
 
     def log_missing_entry_and_raise(self, table: str, slug: str) -> None:
         """Logs a missing entry and raises EntryNotFoundError."""
@@ -2220,6 +2604,8 @@ class ModData:
         if table in self.database:
             logger.info(f"Resetting database entries for table '{table}'.")
             self.database[table] = {}
+        self.cached_tables.pop(table, None)
+        self.fingerprints.pop(table, None)
 
         try:
             if table in self.config.mod_tables:
@@ -2276,35 +2662,74 @@ class ModData:
 
 
 def load_files(
-    directory: str, path: Path, config: DatabaseConfig
+    directory: str,
+    path: Path,
+    config: DatabaseConfig,
+    executor: Optional[Executor] = None,
 ) -> dict[str, Any]:
+    """
+    Reads and parses the files of a table directory.
+
+    Parameters:
+        directory: The table directory.
+        path: The db folder of the mod.
+        config: The database configuration.
+        executor: Pool reading and parsing the files concurrently. The
+            entries are still merged in directory order.
+
+    Returns:
+        The raw entries, by slug.
+    """
     preloaded_data: dict[str, Any] = {}
     extensions = config.file_extensions
     directory_path = path / directory
-    for entry in directory_path.iterdir():
-        if entry.is_file() and any(entry.suffix == ext for ext in extensions):
-            try:
-                with entry.open() as fp:
-                    item = (
-                        json.load(fp)
-                        if entry.suffix == ".json"
-                        else yaml.safe_load(fp)
-                    )
-
-                if isinstance(item, list):
-                    for sub_item in item:
-                        load_dict(sub_item, entry, preloaded_data)
-                else:
-                    load_dict(item, entry, preloaded_data)
-            except (
-                json.JSONDecodeError,
-                yaml.YAMLError,
-                FileNotFoundError,
-            ) as e:
-                logger.error(f"Error loading file '{entry}': {e}")
+    entries = [
+        entry
+        for entry in directory_path.iterdir()
+        if entry.is_file() and any(entry.suffix == ext for ext in extensions)
+    ]
+    items = (
+        map(read_file, entries)
+        if executor is None
+        else executor.map(read_file, entries)
+    )
+    for entry, item in zip(entries, items):
+        if item is None:
+            continue
+        if isinstance(item, list):
+            for sub_item in item:
+                load_dict(sub_item, entry, preloaded_data)
+        else:
+            load_dict(item, entry, preloaded_data)
     return preloaded_data
 
 
+def read_file(entry: Path) -> Any:
+    """
+    Parses a JSON or YAML database file.
+
+    Parameters:
+        entry: The file.
+
+    Returns:
+        The parsed content, or ``None`` if the file cannot be read.
+    """
+    try:
+        with entry.open() as fp:
+            return (
+                json.load(fp)
+                if entry.suffix == ".json"
+                else yaml.safe_load(fp)
+            )
+    except (
+        json.JSONDecodeError,
+        yaml.YAMLError,
+        FileNotFoundError,
+    ) as e:
+        logger.error(f"Error loading file '{entry}': {e}")
+        return None
+
+
 def load_dict(
     item: Mapping[str, Any],
     path: Path,
@@ -2337,6 +2762,102 @@ def load_config(config_path: str) -> DatabaseConfig:
         raise ValueError(f"Invalid YAML in '{config_path}': {e}")
 
 
+def get_mod_roots(mod_name: str) -> list[Path]:
+    """
+    Returns the directories a mod may be installed in.
+
+    Parameters:
+        mod_name: The name of the mod.
+
+    Returns:
+        The directories, in the order ``prepare.fetch`` searches them.
+    """
+    return [
+        paths.mods_folder / mod_name,
+        *(
+            root_path / "mods" / mod_name
+            for root_path in paths.system_installed_folders
+        ),
+        paths.BASEDIR / "mods" / mod_name,
+    ]
+
+
+class ResourceManifest:
+    """
+    Index of the resource files of the active mods.
+
+    The mod directories are walked once, the first time a file is looked
+    up, in the same order as ``prepare.fetch`` searches them. Checking a
+    file is then a dict lookup instead of several ``stat`` calls, and the
+    size of each image is only read once.
+
+    Parameters:
+        mods: The mods to index, in search order.
+    """
+
+    def __init__(self, mods: Sequence[str]) -> None:
+        self.mods = mods
+        self._files: Optional[dict[str, str]] = None
+        self._sizes: dict[str, tuple[int, int]] = {}
+
+    def _build(self) -> dict[str, str]:
+        files: dict[str, str] = {}
+        walked: set[Path] = set()
+        for mod_name in self.mods:
+            for root in get_mod_roots(mod_name):
+                if not root.is_dir() or root.resolve() in walked:
+                    continue
+                walked.add(root.resolve())
+                for dirpath, _, filenames in os.walk(root, followlinks=True):
+                    directory = Path(dirpath)
+                    relative = directory.relative_to(root)
+                    for filename in filenames:
+                        files.setdefault(
+                            (relative / filename).as_posix(),
+                            (directory / filename).as_posix(),
+                        )
+        logger.debug(f"Indexed {len(files)} resource files.")
+        return files
+
+    def resolve(self, file: str) -> Optional[str]:
+        """
+        Finds the path of a resource file.
+
+        Parameters:
+            file: The file path relative to a mod directory.
+
+        Returns:
+            The path of the file, or ``None`` if it is not indexed.
+        """
+        if self._files is None:
+            self._files = self._build()
+        return self._files.get(Path(file).as_posix())
+
+    def image_size(self, path: str) -> tuple[int, int]:
+        """
+        Returns the size of an image, reading it only once.
+
+        Parameters:
+            path: Path of the image.
+
+        Returns:
+            The width and height of the image.
+        """
+        try:
+            return self._sizes[path]
+        except KeyError:
+            pass
+        with Image.open(path) as sprite:
+            size = sprite.size
+        self._sizes[path] = size
+        return size
+
+    def clear(self) -> None:
+        """Forgets the indexed files and image sizes."""
+        self._files = None
+        self._sizes.clear()
+
+
 class Validator:
     """
     Helper class for validating resources exist.
@@ -2344,6 +2865,9 @@ class Validator:
 
     def __init__(self, database: ModData) -> None:
         self.db = database
+        self.resources = ResourceManifest(prepare.CONFIG.mods)
+        self._translations: dict[str, bool] = {}
+        self._translator: Optional[object] = None
         self.db.preload()
 
     def translation(self, msgid: str) -> bool:
@@ -2357,7 +2881,17 @@ class Validator:
         Returns:
             True if translation exists
         """
-        return T.translate(msgid) != msgid
+        # the results are only valid for the translator that gave them
+        translator = T.current_translator
+        if translator is not self._translator:
+            self._translations.clear()
+            self._translator = translator
+        try:
+            return self._translations[msgid]
+        except KeyError:
+            exists = T.translate(msgid) != msgid
+            self._translations[msgid] = exists
+            return exists
 
     def file(self, file: str) -> bool:
         """
@@ -2369,6 +2903,8 @@ class Validator:
         Returns:
             True if file exists
         """
+        if self.resources.resolve(file) is not None:
+            return True
         try:
             path = Path(prepare.fetch(file))
             return path.exists()
@@ -2386,21 +2922,19 @@ class Validator:
         Returns:
             True if file respects
         """
-        path = prepare.fetch(file)
-        with Image.open(path) as sprite:
-            native = prepare.NATIVE_RESOLUTION
-            if size == native:
-                if not (
-                    sprite.size[0] <= size[0] and sprite.size[1] <= size[1]
-                ):
-                    raise ValueError(
-                        f"{file} has size {sprite.size}, but must be less than or equal to {native}"
-                    )
-            else:
-                if sprite.size != size:
-                    raise ValueError(
-                        f"{file} has size {sprite.size}, but must be {size}"
-                    )
+        path = self.resources.resolve(file) or prepare.fetch(file)
+        sprite_size = self.resources.image_size(path)
+        native = prepare.NATIVE_RESOLUTION
+        if size == native:
+            if not (sprite_size[0] <= size[0] and sprite_size[1] <= size[1]):
+                raise ValueError(
+                    f"{file} has size {sprite_size}, but must be less than or equal to {native}"
+                )
+        else:
+            if sprite_size != size:
+                raise ValueError(
+                    f"{file} has size {sprite_size}, but must be {size}"
+                )
         return True
 
     def db_entry(self, table: str, slug: str) -> bool:
@@ -2426,7 +2960,20 @@ model_map = load_model_map(config.model_map)
 loader = ModelLoader(model_map)
 resolver = DependencyResolver(config.mod_dependencies)
 mod_loader = ModMetadataLoader(config.active_mods, config.mod_base_path)
+# Snapshot of the loaded tables, to skip parsing and validation at start
+cache = (
+    DatabaseCache(CACHE_DIR / "db", path, config.active_mods)
+    if prepare.CONFIG.db_cache
+    else None
+)
 # Global database container
-db = ModData(config, loader, resolver, mod_loader)
+db = ModData(
+    config,
+    loader,
+    resolver,
+    mod_loader,
+    cache,
+    prepare.CONFIG.db_preload_workers,
+)
 # Validator container
 has = Validator(db)
@@ -107,6 +107,7 @@ class Element:
 
 
 class ElementTypesHandler:
+    __slots__ = ("_current_types", "_default_types")
 
     def __init__(self, initial_types: Optional[Sequence[str]] = None):
         pre_types = (
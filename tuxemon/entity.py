@@ -14,7 +14,9 @@ from tuxemon.prepare import CONFIG
 from tuxemon.tools import vector2_to_tile_pos
 
 if TYPE_CHECKING:
+    from tuxemon.client import LocalPygameClient
     from tuxemon.session import Session
+    from tuxemon.states.world.worldstate import WorldState
 
 
 SaveDict = TypeVar("SaveDict", bound=Mapping[str, Any])
@@ -159,16 +161,25 @@ class Entity(Generic[SaveDict]):
         session: Session,
     ) -> None:
         self.slug = slug
-        self.client = session.client
-        self.world = session.world
+        self._session = session
         self.instance_id = uuid.uuid4()
         self.body = Body(position=Point3(0, 0, 0))
         self.mover = Mover(self.body, moverate=CONFIG.player_walkrate)
-        self.tile_pos: tuple[int, int] = (0, 0)
+        self._tile_pos: tuple[int, int] = (0, 0)
         self.update_location: bool = False
         self.isplayer: bool = False
         self.ignore_collisions: bool = False
 
+    @property
+    def client(self) -> LocalPygameClient:
+        """The client of the entity, only needed once it is on a map."""
+        return self._session.client
+
+    @property
+    def world(self) -> WorldState:
+        """The world of the entity, only needed once it is on a map."""
+        return self._session.world
+
     # === PHYSICS START =======================================================
     def stop_moving(self) -> None:
         """Completely stop all movement."""
@@ -242,6 +253,19 @@ class Entity(Generic[SaveDict]):
 
     # === PHYSICS END =========================================================
 
+    @property
+    def tile_pos(self) -> tuple[int, int]:
+        """Return the tile currently occupied by the entity."""
+        return self._tile_pos
+
+    @tile_pos.setter
+    def tile_pos(self, tile_pos: tuple[int, int]) -> None:
+        if tile_pos != self._tile_pos:
+            self._tile_pos = tile_pos
+            # entities of a session without client are on no map
+            if self._session.has_client():
+                self.client.npc_manager.update_npc_position(self)
+
     @property
     def position(self) -> Point3:
         """Return the current position of the entity."""
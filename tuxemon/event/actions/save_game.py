@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import Optional, final
 
-from tuxemon import save
+from tuxemon import prepare, save
 from tuxemon.event.eventaction import EventAction
 from tuxemon.locale import T
 from tuxemon.session import Session
@@ -51,10 +51,17 @@ class SaveGameAction(EventAction):
         logger.info("Saving!")
         try:
             save_data = save.get_save_data(session)
-            save.save(
-                save_data,
-                index,
-            )
+            if prepare.CONFIG.background_save:
+                save.save_in_background(
+                    save_data,
+                    index,
+                    lambda error: self.on_saved(session, error),
+                )
+            else:
+                save.save(
+                    save_data,
+                    index,
+                )
             save.slot_number = slot
         except Exception as e:
             raise
@@ -62,7 +69,24 @@ class SaveGameAction(EventAction):
             logger.error(e)
             open_dialog(session.client, [T.translate("save_failure")])
         else:
-            if self.index is not None:
-                open_dialog(session.client, [T.translate("save_success")])
-            else:
-                logger.info(T.translate("save_success"))
+            if not prepare.CONFIG.background_save:
+                self.on_saved(session, None)
+
+    def on_saved(
+        self, session: Session, error: Optional[BaseException]
+    ) -> None:
+        """
+        Reports the outcome of the save.
+
+        Parameters:
+            session: Object containing the session information.
+            error: The error that prevented the save, if any.
+        """
+        if error is not None:
+            logger.error("Unable to save game!!")
+            logger.error(error)
+            open_dialog(session.client, [T.translate("save_failure")])
+        elif self.index is not None:
+            open_dialog(session.client, [T.translate("save_success")])
+        else:
+            logger.info(T.translate("save_success"))
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition, collide, get_npc
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 
 logger = logging.getLogger(__name__)
@@ -35,3 +36,8 @@ class CharAtCondition(EventCondition):
             logger.error(f"{condition.parameters[0]} not found")
             return False
         return collide(condition, character.tile_pos)
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {("position", condition.parameters[0])}
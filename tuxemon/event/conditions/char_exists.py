@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition, get_npc
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 
 
@@ -28,3 +29,8 @@ class CharExistsCondition(EventCondition):
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         return get_npc(session, condition.parameters[0]) is not None
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {("position", condition.parameters[0])}
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition, get_npc
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 
 logger = logging.getLogger(__name__)
@@ -38,3 +39,8 @@ class CharFacingCondition(EventCondition):
         facing = condition.parameters[1]
 
         return character.facing == facing
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {("facing", condition.parameters[0])}
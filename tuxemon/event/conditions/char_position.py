@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition, get_npc
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 
 logger = logging.getLogger(__name__)
@@ -40,3 +41,8 @@ class CharPositionCondition(EventCondition):
         tile_pos_y = int(condition.parameters[2])
         tile_pos = (tile_pos_x, tile_pos_y)
         return character.tile_pos == tile_pos
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {("position", condition.parameters[0])}
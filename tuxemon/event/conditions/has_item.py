@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition, get_npc
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 from tuxemon.tools import compare
 
@@ -54,3 +55,8 @@ class HasItemCondition(EventCondition):
                 return op(itm.quantity, operator, qty)
             else:
                 return True
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {("items", condition.parameters[0])}
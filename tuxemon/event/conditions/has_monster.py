@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition, get_npc
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 
 logger = logging.getLogger(__name__)
@@ -39,3 +40,8 @@ class HasMonsterCondition(EventCondition):
         if character.party.find_monster(_monster):
             return True
         return False
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {("party", condition.parameters[0])}
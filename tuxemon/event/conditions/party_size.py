@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition, get_npc
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 from tuxemon.tools import compare
 
@@ -40,3 +41,8 @@ class PartySizeCondition(EventCondition):
             logger.error(f"{_character} not found")
             return False
         return compare(_operator, len(character.monsters), int(_value))
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {("party", condition.parameters[0])}
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 from tuxemon.tools import compare, number_or_variable
 
@@ -37,3 +38,11 @@ class VariableIsCondition(EventCondition):
         operation = condition.parameters[1]
         operand2 = number_or_variable(variables, condition.parameters[2])
         return compare(operation, operand1, operand2)
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {
+            ("variable", condition.parameters[0]),
+            ("variable", condition.parameters[2]),
+        }
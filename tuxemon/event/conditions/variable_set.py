@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 from tuxemon.event import MapCondition
-from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventcondition import EventCondition, StateKey
 from tuxemon.session import Session
 
 
@@ -42,3 +43,11 @@ class VariableSetCondition(EventCondition):
             for part in condition.parameters
             for key, _, value in [part.partition(":")]
         )
+
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        return {
+            ("variable", part.partition(":")[0])
+            for part in condition.parameters
+        }
@@ -4,18 +4,24 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Sequence
+from copy import copy
 from dataclasses import dataclass, field
 from types import TracebackType
 from typing import Any, ClassVar, Optional
 
 from tuxemon.constants.paths import ACTIONS_PATH
-from tuxemon.plugin import load_plugins
+from tuxemon.plugin import PLUGIN_MANIFEST, load_plugins
 from tuxemon.session import Session
 from tuxemon.tools import cast_dataclass_parameters
 
 logger = logging.getLogger(__name__)
 
+# number of compiled actions kept by the ActionManager
+ACTION_CACHE_SIZE = 1024
+ActionKey = tuple[str, tuple[Any, ...]]
+
 
 class ActionContextManager:
     def __init__(self, action: EventAction, session: Session) -> None:
@@ -267,6 +273,10 @@ class ActionManager:
             ACTIONS_PATH,
             "actions",
             interface=EventAction,  # type: ignore[type-abstract]
+            manifest=PLUGIN_MANIFEST,
+        )
+        self._compiled: OrderedDict[ActionKey, Optional[EventAction]] = (
+            OrderedDict()
         )
 
     def get_action(
@@ -277,7 +287,8 @@ class ActionManager:
         """
         Get an action that is loaded into the engine.
 
-        A new instance will be returned each time.
+        A new instance will be returned each time. It is copied from the
+        compiled action, so the parameters are only validated once.
 
         Return ``None`` if action is not loaded.
 
@@ -289,8 +300,56 @@ class ActionManager:
             New instance of the action with the appropriate parameters if
             that action is loaded. ``None`` otherwise.
         """
+        action = self.compile_action(name, parameters)
+        if action is None:
+            return None
+        return copy(action)
+
+    def compile_action(
+        self,
+        name: str,
+        parameters: Optional[Sequence[Any]] = None,
+    ) -> Optional[EventAction]:
+        """
+        Get the compiled action for a name and parameters.
+
+        The action is instantiated, and its parameters validated, the
+        first time it is requested. The compiled action is a template: it
+        must be copied before being started.
+
+        Parameters:
+            name: Name of the action.
+            parameters: List of parameters that the action accepts.
+
+        Returns:
+            The compiled action, or ``None`` if the action is not loaded
+            or its parameters are invalid.
+        """
         parameters = parameters or []
+        try:
+            key = (name, tuple(parameters))
+            hash(key)
+        except TypeError:
+            # parameters built at runtime may not be hashable
+            return self._create_action(name, parameters)
 
+        try:
+            self._compiled.move_to_end(key)
+            return self._compiled[key]
+        except KeyError:
+            pass
+
+        action = self._create_action(name, parameters)
+        self._compiled[key] = action
+        if len(self._compiled) > ACTION_CACHE_SIZE:
+            self._compiled.popitem(last=False)
+        return action
+
+    def _create_action(
+        self,
+        name: str,
+        parameters: Sequence[Any],
+    ) -> Optional[EventAction]:
         try:
             action = self.actions[name]
 
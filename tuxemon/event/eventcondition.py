@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Optional
 
 from tuxemon.constants.paths import CONDITIONS_PATH
-from tuxemon.event import MapCondition
-from tuxemon.plugin import load_plugins
+from tuxemon.event import MapCondition, get_npc
+from tuxemon.plugin import PLUGIN_MANIFEST, load_plugins
 from tuxemon.session import Session
 
 logger = logging.getLogger(__name__)
 
+# A piece of session state read by a condition, e.g. ("variable", "name")
+# or ("position", "player"). See STATE_READERS for the available kinds.
+StateKey = tuple[str, str]
+
 
 @dataclass
 class EventCondition:
@@ -31,24 +36,92 @@ class EventCondition:
         """
         return True
 
+    def get_dependencies(
+        self, condition: MapCondition
+    ) -> Optional[set[StateKey]]:
+        """
+        Return the session state read by ``test`` for this condition.
+
+        The reactive event engine only tests a condition again when one of
+        its dependencies changed. Conditions which return ``None`` have
+        unknown dependencies (or side effects) and are tested every frame.
+
+        Parameters:
+            condition: Condition defined in the map.
+
+        Returns:
+            Keys of the session state read by the condition, or ``None``.
+        """
+        return None
+
     @property
     def done(self) -> bool:
         return True
 
 
+def _read_npc_state(
+    reader: Callable[[Any], Hashable],
+) -> Callable[[Session, str], Hashable]:
+    def read(session: Session, slug: str) -> Hashable:
+        npc = get_npc(session, slug)
+        return None if npc is None else reader(npc)
+
+    return read
+
+
+STATE_READERS: dict[str, Callable[[Session, str], Hashable]] = {
+    "variable": lambda session, name: session.player.game_variables.get(name),
+    "position": _read_npc_state(lambda npc: npc.tile_pos),
+    "facing": _read_npc_state(lambda npc: npc.facing),
+    "party": _read_npc_state(
+        lambda npc: tuple(monster.slug for monster in npc.monsters)
+    ),
+    "items": _read_npc_state(
+        lambda npc: tuple(
+            (item.slug, item.quantity) for item in npc.items.get_items()
+        )
+    ),
+}
+
+
+def read_state(session: Session, key: StateKey) -> Hashable:
+    """
+    Return a snapshot of the session state behind a dependency key.
+
+    Two snapshots compare equal as long as the state did not change.
+    Characters missing from the map read as ``None``.
+
+    Parameters:
+        session: Object containing the session information.
+        key: The state to read.
+
+    Returns:
+        Comparable snapshot of the state.
+    """
+    kind, name = key
+    try:
+        reader = STATE_READERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown condition state: {kind}")
+    return reader(session, name)
+
+
 class ConditionManager:
     def __init__(self) -> None:
         self.conditions = load_plugins(
             CONDITIONS_PATH,
             "conditions",
             interface=EventCondition,
+            manifest=PLUGIN_MANIFEST,
         )
+        self._instances: dict[str, EventCondition] = {}
 
     def get_condition(self, name: str) -> Optional[EventCondition]:
         """
         Get a condition that is loaded into the engine.
 
-        A new instance will be returned each time.
+        Conditions are stateless, so a single shared instance is created
+        for each condition and returned on every call.
 
         Return ``None`` if condition is not loaded.
 
@@ -56,14 +129,20 @@ class ConditionManager:
             name: Name of the condition.
 
         Returns:
-            New instance of the condition if that condition is loaded.
+            Instance of the condition if that condition is loaded.
             ``None`` otherwise.
         """
         try:
-            return self.conditions[name]()
+            return self._instances[name]
+        except KeyError:
+            pass
+        try:
+            condition = self.conditions[name]()
         except KeyError:
             logger.warning(f'EventCondition "{name}" not implemented')
             return None
+        self._instances[name] = condition
+        return condition
 
     def get_conditions(self) -> list[type[EventCondition]]:
         """Return list of EventConditions."""
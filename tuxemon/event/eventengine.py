@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator, Iterable, Sequence
+from collections import defaultdict
+from collections.abc import Generator, Hashable, Iterable, Sequence
 from contextlib import contextmanager
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from tuxemon import prepare
+from tuxemon.event import get_npc
+from tuxemon.event.eventcondition import read_state
 
 if TYPE_CHECKING:
     from tuxemon.event import EventObject, MapAction, MapCondition
     from tuxemon.event.eventaction import ActionManager, EventAction
-    from tuxemon.event.eventcondition import ConditionManager
+    from tuxemon.event.eventcondition import ConditionManager, StateKey
+    from tuxemon.event.eventindex import EventSpatialIndex
     from tuxemon.map import TuxemonMap
     from tuxemon.session import Session
 
@@ -89,6 +93,69 @@ class RunningEvent:
         self.cancelled = True
 
 
+class EventDependencyIndex:
+    """
+    Index of map events by the session state read by their conditions.
+
+    Used by the reactive mode of the event engine. Events whose conditions
+    all declare their dependencies are indexed by them and keep the result
+    of their last evaluation until one of the dependencies changes. Events
+    with at least one undeclared condition are volatile and are evaluated
+    every frame, as in the default mode.
+
+    Parameters:
+        events: Events of the map, in processing order.
+        condition_manager: Used to look up the condition plugins.
+    """
+
+    def __init__(
+        self,
+        events: Sequence[EventObject],
+        condition_manager: ConditionManager,
+    ) -> None:
+        self.events = events
+        self.volatile: set[int] = set()
+        self.results: dict[int, bool] = {}
+        self._by_key: defaultdict[StateKey, set[int]] = defaultdict(set)
+        self._snapshot: dict[StateKey, Hashable] = {}
+
+        for position, event in enumerate(events):
+            dependencies: Optional[set[StateKey]] = set()
+            for cond in event.conds:
+                condition = condition_manager.get_condition(cond.type)
+                found = condition.get_dependencies(cond) if condition else None
+                if found is None:
+                    dependencies = None
+                    break
+                dependencies |= found
+            if dependencies is None:
+                self.volatile.add(position)
+            else:
+                for key in dependencies:
+                    self._by_key[key].add(position)
+        self._dirty = set(range(len(events))) - self.volatile
+
+    def collect(self, session: Session) -> tuple[list[int], set[int]]:
+        """
+        Find the events to process this frame.
+
+        Parameters:
+            session: Object containing the session information.
+
+        Returns:
+            The positions of the events to process, in map order, and the
+            positions of the indexed events that must be evaluated again.
+        """
+        for key, positions in self._by_key.items():
+            value = read_state(session, key)
+            if key not in self._snapshot or self._snapshot[key] != value:
+                self._snapshot[key] = value
+                self._dirty |= positions
+        dirty, self._dirty = self._dirty, set()
+        satisfied = {pos for pos, result in self.results.items() if result}
+        return sorted(self.volatile | dirty | satisfied), dirty
+
+
 class EventEngine:
     """
     A class for the event engine. The event engine checks to see if a group of
@@ -122,6 +189,10 @@ class EventEngine:
         self.wait = 0.0
         self.button = None
 
+        # reactive mode: only re-check conditions whose inputs changed
+        self.reactive = prepare.CONFIG.reactive_events
+        self.dependency_index: Optional[EventDependencyIndex] = None
+
         # debug
         self.partial_events: list[Sequence[tuple[bool, MapCondition]]] = list()
 
@@ -129,10 +200,31 @@ class EventEngine:
         """Updates the current map."""
         if self.current_map != new_map:
             self.current_map = new_map
+            if new_map is not None:
+                self.compile_events(new_map.inits)
+                self.compile_events(new_map.events)
+
+    def compile_events(self, events: Iterable[EventObject]) -> None:
+        """
+        Resolve the conditions and actions of events ahead of time.
+
+        Conditions are shared instances and actions are validated once
+        and then copied, so doing it when the map is loaded avoids the
+        work when the events are first checked and started.
+
+        Parameters:
+            events: Events to compile.
+        """
+        for event in events:
+            for cond in event.conds:
+                self.condition_manager.get_condition(cond.type)
+            for act in event.acts:
+                self.action_manager.compile_action(act.type, act.parameters)
 
     def reset(self) -> None:
         """Clear out running events.  Use when changing maps."""
         self.running_events = dict()
+        self.dependency_index = None
         self.set_current_map(None)
         self.timer = 0.0
         self.wait = 0.0
@@ -260,6 +352,35 @@ class EventEngine:
         for event in events:
             self.process_map_event(event)
 
+    def process_reactive_events(self, events: Sequence[EventObject]) -> None:
+        """
+        Process events, re-checking only those whose inputs changed.
+
+        Events are still started in map order, and satisfied events are
+        started again every frame just like in the default mode; only the
+        condition tests are skipped.
+
+        Parameters:
+            events: Sequence of events to process.
+        """
+        index = self.dependency_index
+        if index is None or index.events is not events:
+            index = EventDependencyIndex(events, self.condition_manager)
+            self.dependency_index = index
+
+        positions, dirty = index.collect(self.session)
+        for position in positions:
+            event = events[position]
+            if position in index.volatile:
+                self.process_map_event(event)
+                continue
+            if position in dirty:
+                index.results[position] = all(
+                    self.check_condition(cond) for cond in event.conds
+                )
+            if index.results[position]:
+                self.start_event(event)
+
     def update(self, dt: float) -> None:
         """
         Check all the MapEvents and start their actions if conditions are met.
@@ -281,11 +402,47 @@ class EventEngine:
         # do the "init" events.  this will be done just once
         # TODO: make event engine generic, so can be used in global scope,
         # not just maps
-        if self.session.client.map_manager.inits:
-            self.process_map_events(self.session.client.map_manager.inits)
+        map_manager = self.session.client.map_manager
+        if map_manager.inits:
+            self.process_map_events(
+                self.select_events(map_manager.inits, map_manager.init_index)
+            )
 
         # process any other events
-        self.process_map_events(self.session.client.map_manager.events)
+        events = map_manager.events
+        if self.reactive and not prepare.CONFIG.collision_map:
+            self.process_reactive_events(events)
+        else:
+            self.process_map_events(
+                self.select_events(events, map_manager.event_index)
+            )
+
+    def select_events(
+        self,
+        events: Sequence[EventObject],
+        index: Optional[EventSpatialIndex],
+    ) -> Sequence[EventObject]:
+        """
+        Skips the events bound to a tile no character stands on.
+
+        All the events are kept in debug mode, so their conditions are
+        still drawn.
+
+        Parameters:
+            events: Events of the map.
+            index: Spatial index of the events, if any.
+
+        Returns:
+            The events worth checking, in map order.
+        """
+        if index is None or prepare.CONFIG.collision_map:
+            return events
+        positions = {}
+        for slug in index.slugs:
+            character = get_npc(self.session, slug)
+            if character is not None:
+                positions[slug] = character.tile_pos
+        return index.select(events, positions)
 
     def cancel_event(self, event_id: int) -> None:
         """Cancels the event with the given ID."""
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import Optional
+
+from tuxemon.event import EventObject, MapCondition
+
+logger = logging.getLogger(__name__)
+
+# condition => margin (in tiles) around the condition area in which the
+# character must stand for the condition to be satisfied; only the
+# character parameter may be given, e.g. with a label char_facing_tile
+# matches the tiles of the whole map
+POSITION_CONDITIONS: Mapping[str, int] = {
+    "char_at": 0,
+    "char_facing_tile": 1,
+}
+
+# events covering more tiles than this are not worth indexing
+MAX_INDEXED_AREA = 1024
+
+
+class EventSpatialIndex:
+    """
+    Tile-bucketed index of the events bound to a character position.
+
+    An event is bound to a position when one of its conditions can only
+    be satisfied while a given character stands on (or next to) the event
+    area, e.g. ``is char_at player``. Such events are bucketed by the tiles
+    of that area, so only the events under the characters need to be
+    checked. All the other events are position independent and are always
+    checked.
+
+    Parameters:
+        events: Events to index.
+    """
+
+    def __init__(self, events: Sequence[EventObject]) -> None:
+        self.events = events
+        self._bound: set[int] = set()
+        self._buckets: defaultdict[
+            str, defaultdict[tuple[int, int], set[int]]
+        ] = defaultdict(lambda: defaultdict(set))
+
+        for event in events:
+            binding = get_position_binding(event)
+            if binding is None:
+                continue
+            slug, tiles = binding
+            self._bound.add(id(event))
+            for tile in tiles:
+                self._buckets[slug][tile].add(id(event))
+
+        logger.debug(
+            f"{len(self._bound)} of {len(events)} events bound to a position"
+        )
+
+    @property
+    def slugs(self) -> Sequence[str]:
+        """Characters whose position is needed to query the index."""
+        return list(self._buckets)
+
+    def select(
+        self,
+        events: Sequence[EventObject],
+        positions: Mapping[str, tuple[int, int]],
+    ) -> list[EventObject]:
+        """
+        Filters the events which may be satisfied at the given positions.
+
+        Events unknown to the index (e.g. loaded after the map) are kept,
+        as well as the position independent ones. The order of the events
+        is preserved.
+
+        Parameters:
+            events: Events to filter, usually the current events of the map.
+            positions: Tile position of the characters, by slug.
+
+        Returns:
+            The events to check.
+        """
+        if not self._bound:
+            return list(events)
+        hits: set[int] = set()
+        for slug, tile in positions.items():
+            buckets = self._buckets.get(slug)
+            if buckets is not None:
+                hits.update(buckets.get(tile, ()))
+        return [
+            event
+            for event in events
+            if id(event) not in self._bound or id(event) in hits
+        ]
+
+
+def get_position_binding(
+    event: EventObject,
+) -> Optional[tuple[str, list[tuple[int, int]]]]:
+    """
+    Finds the smallest area in which a character must be for the event.
+
+    Parameters:
+        event: The event to inspect.
+
+    Returns:
+        The slug of the character and the tiles it must stand on, or
+        ``None`` if the event does not depend on a character position.
+    """
+    best: Optional[tuple[str, list[tuple[int, int]]]] = None
+    for cond in event.conds:
+        margin = POSITION_CONDITIONS.get(cond.type)
+        if margin is None or cond.operator != "is":
+            continue
+        if len(cond.parameters) != 1:
+            continue
+        tiles = get_condition_tiles(cond, margin)
+        if not tiles or len(tiles) > MAX_INDEXED_AREA:
+            continue
+        if best is None or len(tiles) < len(best[1]):
+            best = (cond.parameters[0], tiles)
+    return best
+
+
+def get_condition_tiles(
+    condition: MapCondition, margin: int
+) -> list[tuple[int, int]]:
+    """
+    Returns the tiles of the condition area, grown by a margin.
+
+    Parameters:
+        condition: The condition whose area is used.
+        margin: Number of tiles added on every side of the area.
+
+    Returns:
+        The tiles of the area.
+    """
+    return [
+        (x, y)
+        for x in range(
+            condition.x - margin, condition.x + condition.width + margin
+        )
+        for y in range(
+            condition.y - margin, condition.y + condition.height + margin
+        )
+    ]
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 
 class Evolution:
+    __slots__ = ("monster",)
+
     def __init__(self, monster: Monster):
         self.monster = monster
 
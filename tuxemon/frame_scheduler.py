@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# most fixed steps run in a single frame before the game slows down
+MAX_STEPS_PER_FRAME = 5
+
+
+@dataclass
+class FrameTimings:
+    """Time spent in each part of the last frame, in seconds."""
+
+    frame: float = 0.0
+    update: float = 0.0
+    draw: float = 0.0
+    idle: float = 0.0
+    steps: int = 0
+
+
+class FrameScheduler:
+    """
+    Paces the main loop to a target frame rate.
+
+    The scheduler uses a monotonic high resolution clock and sleeps until
+    the deadline of the next frame, instead of a fixed amount of time, so
+    the frame rate does not depend on how long the frame took.
+
+    When ``fps`` is zero or negative the frame rate is unlimited, which is
+    useful to measure how much headroom the game has.
+
+    With a fixed timestep, the game is updated by steps of exactly one frame
+    and ``interpolation`` gives how far the clock is between the last step
+    and the next one, as a fraction of a step.
+
+    Parameters:
+        fps: The target frames per second.
+        fixed_timestep: Whether to update the game by fixed steps.
+        clock: Function returning the current time in seconds.
+        sleep: Function sleeping for a number of seconds.
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        fixed_timestep: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.frame_length = 1.0 / fps if fps > 0 else 0.0
+        self.fixed_timestep = fixed_timestep and not self.unlimited
+        self.interpolation = 0.0
+        self.timings = FrameTimings()
+        self.clock = clock
+        self.sleep = sleep
+        self._accumulator = 0.0
+        self._last_tick = clock()
+        self._deadline = self._last_tick + self.frame_length
+
+    @property
+    def unlimited(self) -> bool:
+        return self.frame_length == 0.0
+
+    def tick(self) -> float:
+        """
+        Starts a new frame.
+
+        Returns:
+            The time elapsed since the start of the previous frame.
+        """
+        now = self.clock()
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        self.timings.frame = elapsed
+        return elapsed
+
+    def steps(self, elapsed: float) -> list[float]:
+        """
+        Splits the elapsed time into the updates to run this frame.
+
+        Parameters:
+            elapsed: The time elapsed since the previous frame.
+
+        Returns:
+            The time delta of each update.
+        """
+        if not self.fixed_timestep:
+            self.timings.steps = 1
+            return [elapsed]
+
+        self._accumulator += elapsed
+        count = int(self._accumulator // self.frame_length)
+        if count > MAX_STEPS_PER_FRAME:
+            # too far behind to catch up, drop the backlog
+            count = MAX_STEPS_PER_FRAME
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= count * self.frame_length
+        self.interpolation = self._accumulator / self.frame_length
+        self.timings.steps = count
+        return [self.frame_length] * count
+
+    def record(self, update: float, draw: float) -> None:
+        """
+        Records the time spent updating and drawing the current frame.
+
+        Parameters:
+            update: The time spent updating the game.
+            draw: The time spent drawing the game.
+        """
+        self.timings.update = update
+        self.timings.draw = draw
+
+    def time_left(self) -> float:
+        """
+        Returns the time left before the next frame is due.
+
+        An unlimited frame rate leaves no time.
+        """
+        if self.unlimited:
+            return 0.0
+        return max(0.0, self._deadline - self.clock())
+
+    def wait(self) -> None:
+        """Sleeps until the next frame is due."""
+        if self.unlimited:
+            self.timings.idle = 0.0
+            return
+
+        now = self.clock()
+        remaining = self._deadline - now
+        if remaining > 0:
+            self.sleep(remaining)
+            self._deadline += self.frame_length
+        else:
+            # the frame ran late, schedule the next one from now
+            self._deadline = now + self.frame_length
+        self.timings.idle = max(0.0, remaining)
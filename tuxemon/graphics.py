@@ -9,7 +9,10 @@ have a home in any specific place.
 from __future__ import annotations
 
 import logging
+import os
 import re
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Protocol, Union
@@ -37,6 +40,13 @@ logger = logging.getLogger(__name__)
 
 ColorLike = Union[Color, tuple[int, int, int], tuple[int, int, int, int]]
 
+# most scaled tileset images kept in memory
+TILESET_CACHE_SIZE = 16
+# (filename, modification time, scale) => scaled tileset image
+_tileset_cache: OrderedDict[tuple[str, int, int], Surface] = OrderedDict()
+# maps can be loaded from a background thread
+_tileset_lock = threading.Lock()
+
 
 class LoaderProtocol(Protocol):
     def __call__(
@@ -330,6 +340,40 @@ def convert_alpha_to_colorkey(
     return image
 
 
+def load_scaled_tileset(filename: str) -> Surface:
+    """
+    Loads a tileset image, scaled to the game scale.
+
+    The scaled images of the last tilesets used are kept in memory, so
+    the maps sharing a tileset do not scale it again.
+
+    Parameters:
+        filename: Path of the image.
+
+    Returns:
+        The scaled image. It is shared and must not be modified.
+    """
+    key = (filename, os.stat(filename).st_mtime_ns, prepare.SCALE)
+    with _tileset_lock:
+        image = _tileset_cache.get(key)
+        if image is not None:
+            _tileset_cache.move_to_end(key)
+            return image
+
+    # load the tileset image
+    image = load(filename)
+
+    # scale the tileset image to match game scale
+    scaled_size = scale_sequence(image.get_size())
+    image = scale(image, scaled_size)
+
+    with _tileset_lock:
+        _tileset_cache[key] = image
+        if len(_tileset_cache) > TILESET_CACHE_SIZE:
+            _tileset_cache.popitem(last=False)
+    return image
+
+
 def scaled_image_loader(
     filename: str,
     colorkey: Optional[str],
@@ -352,13 +396,7 @@ def scaled_image_loader(
         The loader to use.
     """
     colorkey_color = Color(f"#{colorkey}") if colorkey else None
-
-    # load the tileset image
-    image = load(filename)
-
-    # scale the tileset image to match game scale
-    scaled_size = scale_sequence(image.get_size())
-    image = scale(image, scaled_size)
+    image = load_scaled_tileset(filename)
 
     def load_image(
         rect: Optional[tuple[int, int, int, int]] = None,
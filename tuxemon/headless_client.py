@@ -59,7 +59,7 @@ class HeadlessClient:
             repository=self.state_repository,
             on_state_change=self.on_state_change,
         )
-        self.state_manager.auto_state_discovery()
+        self.state_manager.auto_state_discovery(lazy=config.lazy_states)
         self.state = ClientState.RUNNING
         self.current_time = 0.0
 
@@ -17,6 +17,7 @@ from tuxemon.camera import project
 from tuxemon.compat.rect import ReadOnlyRect
 from tuxemon.db import Direction, Orientation
 from tuxemon.event import EventObject
+from tuxemon.event.eventindex import EventSpatialIndex
 from tuxemon.graphics import scaled_image_loader
 from tuxemon.locale import T
 from tuxemon.math import Vector2, Vector3
@@ -703,7 +704,11 @@ class TuxemonMap:
         self.area = tiled_map.width * tiled_map.height
         self.inits = inits
         self.events = events
+        self.index_events()
         self.renderer: Optional[pyscroll.BufferedRenderer] = None
+        # whether some tiles are animated, and how many times they changed
+        self.animated_tiles = False
+        self.tiles_revision = 0
         self.edges = maps.get("edges")
         self.data = tiled_map
         self.sprite_layer = 2
@@ -734,6 +739,15 @@ class TuxemonMap:
         else:
             return " - ".join(T.translate(c) for c in cardinals)
 
+    def index_events(self) -> None:
+        """
+        Index the position-bound events and inits by tile.
+
+        Must be called again when the events are replaced.
+        """
+        self.event_index = EventSpatialIndex(self.events)
+        self.init_index = EventSpatialIndex(self.inits)
+
     def initialize_renderer(self) -> None:
         """
         Initialize the renderer for the map and sprites.
@@ -742,6 +756,7 @@ class TuxemonMap:
             Renderer for the map.
         """
         visual_data = pyscroll.data.TiledMapData(self.data)
+        self.animated_tiles = any(True for _ in visual_data.get_animations())
         # Behaviour at the edges.
         clamp = self.edges == "clamped"
         self.renderer = pyscroll.BufferedRenderer(
@@ -765,3 +780,4 @@ class TuxemonMap:
         )
         self.renderer.data.tmx.images = data.images
         self.renderer.redraw_tiles(self.renderer._buffer)
+        self.tiles_revision += 1
@@ -0,0 +1,234 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+import pickle
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import pytmx
+
+from tuxemon import prepare
+from tuxemon.db import Direction
+from tuxemon.event import EventObject
+from tuxemon.map import RegionProperties, TuxemonMap
+
+logger = logging.getLogger(__name__)
+
+# name, size and modification time of a source file, None if missing
+SourceStamp = tuple[str, Optional[tuple[int, int]]]
+
+
+@dataclass
+class CompiledMap:
+    sources: list[SourceStamp]
+    data: pytmx.TiledMap
+    events: list[EventObject]
+    inits: list[EventObject]
+    surface_map: dict[tuple[int, int], dict[str, float]]
+    collision_map: dict[tuple[int, int], Optional[RegionProperties]]
+    collision_lines_map: set[tuple[tuple[int, int], Direction]]
+
+
+def _new_element(cls: type[Any]) -> Any:
+    return cls.__new__(cls)
+
+
+def _set_element_state(element: Any, state: dict[str, Any]) -> None:
+    element.__dict__.update(state)
+
+
+class _MapPickler(pickle.Pickler):
+    """
+    Pickler for the pytmx objects.
+
+    The pytmx objects look up unknown attributes in their properties,
+    which the default pickle protocol trips on, so their attributes are
+    restored directly. The tile images are not stored: they are loaded
+    again, at the game scale, when the map is read.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if not isinstance(obj, pytmx.TiledElement):
+            return NotImplemented
+        state = dict(obj.__dict__)
+        if isinstance(obj, pytmx.TiledMap):
+            state["images"] = []
+        items = iter(obj) if isinstance(obj, list) else None
+        return (
+            _new_element,
+            (type(obj),),
+            state,
+            items,
+            None,
+            _set_element_state,
+        )
+
+
+def get_source_stamp(path: Path) -> SourceStamp:
+    """
+    Returns what identifies the version of a source file.
+
+    Parameters:
+        path: Path of the file.
+
+    Returns:
+        The path, with the size and the modification time of the file.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return path.as_posix(), None
+    return path.as_posix(), (stat.st_size, stat.st_mtime_ns)
+
+
+def get_map_sources(
+    txmn_map: TuxemonMap, yaml_files: Sequence[Path]
+) -> list[Path]:
+    """
+    Returns the files a map is compiled from.
+
+    Parameters:
+        txmn_map: The loaded map.
+        yaml_files: The event files merged into the map.
+
+    Returns:
+        The TMX file, its tilesets and the event files.
+    """
+    tmx_path = Path(txmn_map.filename)
+    tilesets = [
+        tmx_path.parent / tileset.source
+        for tileset in txmn_map.data.tilesets
+        if tileset.source
+    ]
+    return [tmx_path, *tilesets, *yaml_files]
+
+
+class MapCache:
+    """
+    On-disk cache of the compiled maps.
+
+    A compiled map holds the parsed TMX data, without its images, and what
+    is extracted from it and from its event files: the collision, surface
+    and collision line maps and the events. Each compiled map is stored
+    with the size and modification time of its source files, and is only
+    used while none of them changed. A change of the game scale or of the
+    loader discards the whole cache.
+
+    Parameters:
+        cache_dir: Directory where the compiled maps are written.
+    """
+
+    version = 1
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.base = self._get_base_fingerprint()
+
+    def _get_base_fingerprint(self) -> str:
+        digest = hashlib.sha1(str(self.version).encode())
+        digest.update(repr((prepare.TILE_SIZE, prepare.SCALE)).encode())
+        digest.update(repr(pytmx.__version__).encode())
+        for module in ("map_loader.py", "map_cache.py", "map.py"):
+            stat = (Path(__file__).parent / module).stat()
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
+    def get_path(self, filename: str) -> Path:
+        """
+        Returns the path of the compiled version of a map.
+
+        Parameters:
+            filename: Path of the TMX file.
+
+        Returns:
+            The path of the compiled map.
+        """
+        name = Path(filename).resolve().as_posix()
+        key = hashlib.sha1(name.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{Path(filename).stem}_{key}.pickle"
+
+    def load(self, filename: str) -> Optional[TuxemonMap]:
+        """
+        Loads a map from its compiled version, if it is up to date.
+
+        Parameters:
+            filename: Path of the TMX file.
+
+        Returns:
+            The loaded map, or ``None``.
+        """
+        path = self.get_path(filename)
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as fp:
+                base, compiled = pickle.load(fp)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable compiled map '{path}': {e}")
+            return None
+        if base != self.base or not isinstance(compiled, CompiledMap):
+            return None
+        for name, stamp in compiled.sources:
+            if get_source_stamp(Path(name)) != (name, stamp):
+                logger.debug(f"Compiled map '{path}' is out of date.")
+                return None
+
+        data = compiled.data
+        data.reload_images()
+        # events are identified by a new id each time the map is loaded
+        events = [
+            event._replace(id=uuid.uuid4().int) for event in compiled.events
+        ]
+        inits = [
+            event._replace(id=uuid.uuid4().int) for event in compiled.inits
+        ]
+        return TuxemonMap(
+            events,
+            inits,
+            compiled.surface_map,
+            compiled.collision_map,
+            compiled.collision_lines_map,
+            data,
+            data.properties,
+            filename,
+        )
+
+    def save(self, txmn_map: TuxemonMap, sources: Sequence[Path]) -> None:
+        """
+        Writes the compiled version of a map.
+
+        Parameters:
+            txmn_map: The loaded map, before it is rendered.
+            sources: The files the map was loaded from.
+        """
+        path = self.get_path(txmn_map.filename)
+        compiled = CompiledMap(
+            [get_source_stamp(source) for source in sources],
+            txmn_map.data,
+            list(txmn_map.events),
+            list(txmn_map.inits),
+            dict(txmn_map.surface_map),
+            dict(txmn_map.collision_map),
+            set(txmn_map.collision_lines_map),
+        )
+        # the map may be saved by the prefetching thread at the same time
+        temp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            buffer = io.BytesIO()
+            _MapPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(
+                (self.base, compiled)
+            )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(buffer.getvalue())
+            os.replace(temp_path, path)
+        except (OSError, pickle.PicklingError, AttributeError, TypeError) as e:
+            logger.warning(f"Could not write compiled map '{path}': {e}")
+            temp_path.unlink(missing_ok=True)
@@ -28,6 +28,7 @@ from tuxemon.map import (
     snap_rect,
     tiles_inside_rect,
 )
+from tuxemon.map_cache import MapCache, get_map_sources
 from tuxemon.script.parser import (
     parse_action_string,
     parse_behav_string,
@@ -114,22 +115,34 @@ class EventLoader:
 
 
 class MapLoader:
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional[MapCache] = None) -> None:
         self.event_loader = EventLoader()
+        self.cache = cache
 
     def load_map_data(self, path: str) -> TuxemonMap:
         """
         Loads map data from a TMX file and associated YAML event files.
 
+        When a cache is set, the map is loaded from its compiled version
+        if its files did not change, and compiled otherwise.
+
         Parameters:
             path: The path to the TMX map file.
 
         Returns:
             A TuxemonMap object containing the loaded map data and events.
         """
+        if self.cache is not None:
+            txmn_map = self.cache.load(path)
+            if txmn_map is not None:
+                logger.debug(f"Load compiled map '{path}'.")
+                return txmn_map
+
         logger.debug(f"Load map '{path}'.")
         txmn_map = self._load_map_from_disk(path)
-        self._process_and_merge_events(txmn_map, path)
+        yaml_files = self._process_and_merge_events(txmn_map, path)
+        if self.cache is not None:
+            self.cache.save(txmn_map, get_map_sources(txmn_map, yaml_files))
         return txmn_map
 
     def _load_map_from_disk(self, path: str) -> TuxemonMap:
@@ -205,6 +218,7 @@ class MapLoader:
         txmn_map.collision_map.update(yaml_collision)
         txmn_map.events = list(txmn_map.events) + events["event"]
         txmn_map.inits = list(txmn_map.inits) + events["init"]
+        txmn_map.index_events()
 
         # Debugging after merging
         logger.debug(f"Total TMX events after merge: {len(txmn_map.events)}")
@@ -212,13 +226,16 @@ class MapLoader:
 
     def _process_and_merge_events(
         self, txmn_map: TuxemonMap, path: str
-    ) -> None:
+    ) -> list[Path]:
         """
         Processes and merges events from YAML files into the map.
 
         Parameters:
             txmn_map: The TuxemonMap object to update.
             path: The path to the TMX map file for deriving YAML paths.
+
+        Returns:
+            The YAML files the events were looked up in.
         """
         yaml_files = [Path(path).with_suffix(".yaml")]
         if txmn_map.scenario:
@@ -227,6 +244,7 @@ class MapLoader:
 
         yaml_collision, events = self._process_events(yaml_files)
         self._merge_events(txmn_map, yaml_collision, events)
+        return yaml_files
 
 
 class YAMLEventLoader:
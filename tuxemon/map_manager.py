@@ -11,9 +11,11 @@ import yaml
 
 from tuxemon.constants import paths
 from tuxemon.db import Direction
+from tuxemon.walkability import WalkabilityGrid
 
 if TYPE_CHECKING:
     from tuxemon.event import EventObject
+    from tuxemon.event.eventindex import EventSpatialIndex
     from tuxemon.map import RegionProperties, TuxemonMap
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,8 @@ class MapManager:
         """Manages map loading and properties while ensuring event resets."""
         self.events: Sequence[EventObject] = []
         self.inits: list[EventObject] = []
+        self.event_index: Optional[EventSpatialIndex] = None
+        self.init_index: Optional[EventSpatialIndex] = None
         self.current_map: Optional[TuxemonMap] = None
         self.maps: dict[str, Any] = {}
         self.map_slug = ""
@@ -62,12 +66,15 @@ class MapManager:
         self.collision_map: MutableMapping[
             tuple[int, int], Optional[RegionProperties]
         ] = {}
+        self.walkability = WalkabilityGrid(self.map_size)
 
     def load_map(self, map_data: TuxemonMap) -> None:
         """Loads a new map, updates properties, and resets relevant events."""
         self.current_map = map_data
         self.events = map_data.events
         self.inits = list(map_data.inits)
+        self.event_index = map_data.event_index
+        self.init_index = map_data.init_index
         self.maps = map_data.maps
         self.map_slug = map_data.slug
         self.map_name = map_data.name
@@ -77,6 +84,9 @@ class MapManager:
         self.collision_lines_map = map_data.collision_lines_map
         self.collision_map = map_data.collision_map
         self.surface_map = map_data.surface_map
+        self.walkability = WalkabilityGrid(
+            self.map_size, self.collision_lines_map
+        )
 
         valid_map_types = {mt.name for mt in MAP_TYPES}
         if map_data.map_type in valid_map_types:
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from tuxemon import prepare
+
+if TYPE_CHECKING:
+    from tuxemon.map import TuxemonMap
+    from tuxemon.map_loader import MapLoader
+
+logger = logging.getLogger(__name__)
+
+# most maps loaded ahead of time
+MAP_PREFETCH_SIZE = 4
+# action => index of the map name in its parameters
+TELEPORT_ACTIONS = {
+    "teleport": 1,
+    "transition_teleport": 0,
+    "delayed_teleport": 1,
+}
+CARDINALS = ("north", "south", "east", "west")
+
+
+def get_adjacent_maps(txmn_map: TuxemonMap) -> list[str]:
+    """
+    Returns the maps the player can go to from a map.
+
+    These are the maps teleported to by the events of the map, then the
+    maps named by its cardinal directions, when a map file has that name.
+
+    Parameters:
+        txmn_map: The map.
+
+    Returns:
+        The paths of the adjacent maps, without duplicates.
+    """
+    names: list[str] = []
+    for event in txmn_map.events:
+        for action in event.acts:
+            index = TELEPORT_ACTIONS.get(action.type)
+            if index is not None and len(action.parameters) > index:
+                names.append(str(action.parameters[index]).strip())
+    for cardinal in CARDINALS:
+        for slug in str(txmn_map.maps.get(cardinal, "")).split(","):
+            if slug.strip() and slug.strip() != "-":
+                names.append(f"{slug.strip()}.tmx")
+
+    paths: list[str] = []
+    for name in names:
+        try:
+            path = prepare.fetch("maps", name)
+        except OSError:
+            continue
+        if path != txmn_map.filename and path not in paths:
+            paths.append(path)
+    return paths
+
+
+class MapPrefetcher:
+    """
+    Loads the maps adjacent to the current map on a background thread.
+
+    The loaded maps are kept until they are used or until more recent maps
+    replace them, so going to an adjacent map does not wait for its files
+    to be read. Their renderer is only built when they are drawn, on the
+    main thread.
+
+    Parameters:
+        map_loader: The loader of the maps, only used by the worker
+            thread: its event loader is not shared with the main thread.
+        size: The most maps kept loaded.
+    """
+
+    def __init__(
+        self, map_loader: MapLoader, size: int = MAP_PREFETCH_SIZE
+    ) -> None:
+        self.map_loader = map_loader
+        self.size = size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._maps: OrderedDict[str, Future[TuxemonMap]] = OrderedDict()
+
+    def _load(self, filename: str) -> TuxemonMap:
+        return self.map_loader.load_map_data(filename)
+
+    def prefetch(self, txmn_map: TuxemonMap) -> None:
+        """
+        Starts loading the maps adjacent to a map.
+
+        Parameters:
+            txmn_map: The current map.
+        """
+        for filename in get_adjacent_maps(txmn_map)[: self.size]:
+            if filename in self._maps:
+                self._maps.move_to_end(filename)
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="map"
+                )
+            logger.debug(f"Prefetch map '{filename}'.")
+            self._maps[filename] = self._executor.submit(self._load, filename)
+            while len(self._maps) > self.size:
+                _, future = self._maps.popitem(last=False)
+                future.cancel()
+
+    def get(self, filename: str) -> Optional[TuxemonMap]:
+        """
+        Takes a prefetched map.
+
+        If the map is still being loaded, waits for it. The map is removed
+        from the prefetched maps, since a map is only used once.
+
+        Parameters:
+            filename: Path of the map.
+
+        Returns:
+            The map, or ``None`` if it was not prefetched or failed to load.
+        """
+        future = self._maps.pop(filename, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Prefetching map '{filename}' failed: {e}")
+            return None
+
+    def clear(self) -> None:
+        """Drops the prefetched maps."""
+        for future in self._maps.values():
+            future.cancel()
+        self._maps.clear()
+
+    def shutdown(self) -> None:
+        """Drops the prefetched maps and stops the worker thread."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
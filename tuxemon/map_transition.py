@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from tuxemon.boundary import BoundaryChecker
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from tuxemon.map import TuxemonMap
     from tuxemon.map_loader import MapLoader
     from tuxemon.map_manager import MapManager
+    from tuxemon.map_prefetcher import MapPrefetcher
     from tuxemon.npc_manager import NPCManager
 
 logger = logging.getLogger(__name__)
@@ -26,8 +27,10 @@ class MapTransition:
         map_manager: MapManager,
         boundary: BoundaryChecker,
         event_engine: EventEngine,
+        prefetcher: Optional[MapPrefetcher] = None,
     ) -> None:
         self.map_loader = map_loader
+        self.prefetcher = prefetcher
         self.map_manager = map_manager
         self.npc_manager = npc_manager
         self.boundary = boundary
@@ -37,16 +40,25 @@ class MapTransition:
         """
         Loads the new map and updates relevant game components.
 
+        The map is taken from the prefetched maps when it was loaded ahead
+        of time, then the maps adjacent to it are prefetched.
+
         Parameters:
             map_name: The name of the new map.
         """
-        logger.debug(f"Loading map '{map_name}' using Client's MapLoader.")
-        map_data = self.map_loader.load_map_data(map_name)
+        map_data = None
+        if self.prefetcher is not None:
+            map_data = self.prefetcher.get(map_name)
+        if map_data is None:
+            logger.debug(f"Loading map '{map_name}' using Client's MapLoader.")
+            map_data = self.map_loader.load_map_data(map_name)
 
         self._reset_events(map_data)
         self._update_map_state(map_data)
         self._clear_npcs()
         self._update_boundaries()
+        if self.prefetcher is not None:
+            self.prefetcher.prefetch(map_data)
 
     def _reset_events(self, map_data: TuxemonMap) -> None:
         """Resets and updates event engine for the new map."""
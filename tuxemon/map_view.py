@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from enum import Enum
 from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import pygame
 from pygame.draw import line
@@ -299,6 +299,9 @@ class MapRenderer:
         self.map_animations: dict[str, AnimationInfo] = {}
         self.debug_renderer = DebugRenderer(client)
         self.bubble_manager = BubbleManager()
+        # sprites framed and skipped by the viewport culling, last frame
+        self.drawn_sprites = 0
+        self.culled_sprites = 0
 
     def draw(self, surface: Surface, current_map: TuxemonMap) -> None:
         """Draws the map, sprites, and animations onto the given surface."""
@@ -311,6 +314,40 @@ class MapRenderer:
         if prepare.CONFIG.collision_map:
             self.debug_renderer.draw_debug(current_map, surface)
 
+    def get_signature(self, current_map: TuxemonMap) -> Optional[Any]:
+        """
+        Returns what the drawn frame depends on.
+
+        Two frames with equal signatures are drawn identically, which lets
+        the frame be kept on screen instead of drawing it again.
+
+        Parameters:
+            current_map: The map being drawn.
+
+        Returns:
+            The signature of the frame, or ``None`` if it cannot be known,
+            e.g. when some tiles are animated.
+        """
+        if current_map.renderer is None or current_map.animated_tiles:
+            return None
+        position = self.camera.position if self.camera else Vector2(0, 0)
+        surfaces = tuple(
+            (surface, tuple(rect), layer)
+            for surface, rect, layer in self._get_and_position_surfaces(
+                current_map
+            )
+        )
+        return (
+            current_map,
+            current_map.tiles_revision,
+            tuple(position),
+            surfaces,
+            self.layer_color,
+            self.cinema_x_ratio,
+            self.cinema_y_ratio,
+            prepare.CONFIG.collision_map,
+        )
+
     def update(self, time_delta: float) -> None:
         """Update the map animations."""
         self.camera_manager.update(time_delta)
@@ -330,8 +367,11 @@ class MapRenderer:
         self, current_map: TuxemonMap
     ) -> list[tuple[Surface, Rect, int]]:
         """Retrieves and positions surfaces for rendering."""
-        npc_surfaces = self._get_npc_surfaces(current_map.sprite_layer)
-        map_animations = self._get_map_animations()
+        self.drawn_sprites = 0
+        self.culled_sprites = 0
+        view = self.get_view_rect(current_map)
+        npc_surfaces = self._get_npc_surfaces(current_map.sprite_layer, view)
+        map_animations = self._get_map_animations(view)
         surfaces = npc_surfaces + map_animations
         screen_surfaces = self._position_surfaces(current_map, surfaces)
         screen_surfaces.extend(
@@ -362,24 +402,74 @@ class MapRenderer:
         if self.cinema_y_ratio is not None:
             apply_bars("vertical", self.cinema_y_ratio, surface)
 
-    def _get_npc_surfaces(self, current_map: int) -> list[WorldSurfaces]:
-        """Retrieves surfaces for NPCs."""
-        return [
-            surf
-            for npc in self.client.npc_manager.npcs.values()
-            for surf in self._get_sprites(npc, current_map)
-        ]
-
-    def _get_map_animations(self) -> list[WorldSurfaces]:
-        """Retrieves surfaces for map animations."""
-        return [
-            WorldSurfaces(
-                anim.get_current_frame(), Vector2(data.position), data.layer
-            )
-            for data in self.map_animations.values()
-            for anim in [data.animation]
-            if not anim.is_finished() and anim.visibility
-        ]
+    def get_view_rect(self, current_map: TuxemonMap) -> Rect:
+        """
+        Returns the part of the map seen by the camera.
+
+        The view is centered on the active camera and, like the map
+        renderer does, kept inside the map when its edges are clamped.
+        A margin of one tile is kept around the screen, so sprites moving
+        in from the edges are never culled while partly visible.
+
+        Parameters:
+            current_map: The map being drawn.
+
+        Returns:
+            The view, in map pixel coordinates.
+        """
+        position = self.camera.position if self.camera else Vector2(0, 0)
+        view = Rect((0, 0), prepare.SCREEN_SIZE)
+        view.center = round(position[0]), round(position[1])
+        if current_map.edges == "clamped":
+            view.clamp_ip(Rect((0, 0), project(current_map.size)))
+        return view.inflate(prepare.TILE_SIZE[0] * 2, prepare.TILE_SIZE[1] * 2)
+
+    def _is_visible(
+        self, view: Rect, position: Vector2, size: tuple[int, int]
+    ) -> bool:
+        """
+        Checks whether a sprite is in view, and counts it.
+
+        Parameters:
+            view: The view, in map pixel coordinates.
+            position: The tile position of the sprite.
+            size: The size of the sprite.
+
+        Returns:
+            Whether the sprite is in view.
+        """
+        rect = Rect(project(position), size)
+        if size[1] > prepare.TILE_SIZE[1]:
+            rect.y -= size[1] // 2
+        if view.colliderect(rect):
+            self.drawn_sprites += 1
+            return True
+        self.culled_sprites += 1
+        return False
+
+    def _get_npc_surfaces(
+        self, current_map: int, view: Rect
+    ) -> list[WorldSurfaces]:
+        """Retrieves surfaces for NPCs in view."""
+        surfaces = []
+        for npc in self.client.npc_manager.npcs.values():
+            size = npc.sprite_controller.get_sprite_renderer().rect.size
+            if self._is_visible(view, proj(npc.position), size):
+                surfaces.extend(self._get_sprites(npc, current_map))
+        return surfaces
+
+    def _get_map_animations(self, view: Rect) -> list[WorldSurfaces]:
+        """Retrieves surfaces for map animations in view."""
+        surfaces = []
+        for data in self.map_animations.values():
+            anim = data.animation
+            if anim.is_finished() or not anim.visibility:
+                continue
+            frame = anim.get_current_frame()
+            position = Vector2(data.position)
+            if self._is_visible(view, position, frame.get_size()):
+                surfaces.append(WorldSurfaces(frame, position, data.layer))
+        return surfaces
 
     def _position_surfaces(
         self, current_map: TuxemonMap, surfaces: list[WorldSurfaces]
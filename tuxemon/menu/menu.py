@@ -28,6 +28,7 @@ from tuxemon.platform.events import PlayerInput
 from tuxemon.prepare import CONFIG
 from tuxemon.sprite import (
     RelativeGroup,
+    Sprite,
     SpriteGroup,
     VisualSpriteList,
 )
@@ -356,6 +357,9 @@ class Menu(Generic[T], State):
         self._show_contents = False
         self._needs_refresh = False
         self._anchors: dict[str, Union[int, tuple[int, int]]] = {}
+        # what was last drawn, and where, with dirty rectangles
+        self._drawn_signature: Optional[Any] = None
+        self._drawn_area = Rect(0, 0, 0, 0)
         self.__dict__.update(kwargs)
 
         # holds sprites representing menu items
@@ -710,6 +714,38 @@ class Menu(Generic[T], State):
 
         self.sprites.draw(surface)
 
+        if prepare.CONFIG.dirty_rects:
+            self._drawn_signature = self._get_draw_signature()
+            self._drawn_area = self._get_draw_area()
+
+    def _get_draw_signature(self) -> Any:
+        sprites: list[Sprite] = list(self.sprites)
+        if self._show_contents:
+            sprites.extend(self.menu_items)
+            sprites.extend(self.menu_sprites)
+        return (
+            tuple(self.rect),
+            self.transparent,
+            self._show_contents,
+            tuple((sprite.image, tuple(sprite.rect)) for sprite in sprites),
+        )
+
+    def _get_draw_area(self) -> Rect:
+        # the menu items are drawn relative to the menu, inside of it
+        return self.rect.unionall([sprite.rect for sprite in self.sprites])
+
+    def get_dirty_rects(self) -> Optional[list[Rect]]:
+        # menus drawing more than their sprites cannot tell what changed
+        if type(self).draw is not Menu.draw:
+            return None
+        if self._drawn_signature is None or self.animations:
+            return None
+        if self._needs_refresh:
+            return None
+        if self._get_draw_signature() == self._drawn_signature:
+            return []
+        return [self._drawn_area, self._get_draw_area()]
+
     def set_font(
         self,
         size: int = 5,
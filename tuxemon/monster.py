@@ -5,8 +5,8 @@ from __future__ import annotations
 import logging
 import random
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass, fields
-from typing import TYPE_CHECKING, Any, Optional
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 from uuid import UUID, uuid4
 
 from tuxemon import formula, graphics, prepare, tools
@@ -66,6 +66,7 @@ SIMPLE_PERSISTANCE_ATTRIBUTES = (
 )
 
 
+@tools.add_slots
 @dataclass
 class BasicStats:
     """The fundamental statistical attributes of a monster."""
@@ -86,6 +87,8 @@ class BasicStats:
 class TemporaryStatBoosts(BasicStats):
     """Temporary additive boosts to a monster's base stats."""
 
+    __slots__ = ()
+
     def to_dict(self) -> dict[str, int]:
         return {
             field.name: getattr(self, field.name) for field in fields(self)
@@ -105,14 +108,202 @@ class Flair:
         self.name = name
 
 
+@dataclass(frozen=True)
+class MonsterTemplate:
+    """
+    What all the monsters of a species share.
+
+    The template is built once per species and language from the database,
+    with the translated strings and the resolved sprite paths, so creating
+    a monster only rolls its own values.
+    """
+
+    slug: str
+    name: str
+    description: str
+    cat: str
+    category: str
+    shape: str
+    stage: EvolutionStage
+    tags: Sequence[str]
+    types: Sequence[str]
+    randomly: bool
+    txmn_id: int
+    height: float
+    weight: float
+    possible_genders: Sequence[GenderType]
+    catch_rate: float
+    upper_catch_resistance: float
+    lower_catch_resistance: float
+    moveset: Sequence[MonsterMovesetItemModel]
+    evolutions: Sequence[MonsterEvolutionItemModel]
+    history: Sequence[MonsterHistoryItemModel]
+    flairs: Mapping[str, Flair]
+    front_path: str
+    back_path: str
+    menu1_path: str
+    menu2_path: str
+    combat_call: str
+    faint_call: str
+    model: MonsterModel = field(repr=False, compare=False)
+
+    _templates: ClassVar[dict[tuple[str, str], MonsterTemplate]] = {}
+
+    @classmethod
+    def get(cls, slug: str) -> MonsterTemplate:
+        """
+        Returns the template of a species, building it if needed.
+
+        The template is built again when the database entry of the species
+        was replaced, e.g. when the database is reloaded.
+
+        Parameters:
+            slug: Slug of the monster.
+
+        Returns:
+            The template of the species, in the current language.
+        """
+        results = MonsterModel.lookup(slug, db)
+        key = (slug, T.get_current_language())
+        template = cls._templates.get(key)
+        if template is None or template.model is not results:
+            template = cls._templates[key] = cls.build(slug, results)
+        return template
+
+    @classmethod
+    def build(cls, slug: str, results: MonsterModel) -> MonsterTemplate:
+        """
+        Builds the template of a species from its database entry.
+
+        Parameters:
+            slug: Slug of the monster.
+            results: Database entry of the monster.
+
+        Returns:
+            The template of the species.
+        """
+        # Look up the monster's sprite image paths
+        sprites = results.sprites or MonsterSpritesModel(
+            front=f"gfx/sprites/battle/{slug}-front",
+            back=f"gfx/sprites/battle/{slug}-back",
+            menu1=f"gfx/sprites/battle/{slug}-menu01",
+            menu2=f"gfx/sprites/battle/{slug}-menu02",
+        )
+        loader = SpriteLoader()
+
+        # get sound slugs for this monster, defaulting to a generic type-based sound
+        if results.sounds:
+            combat_call = results.sounds.combat_call
+            faint_call = results.sounds.faint_call
+        else:
+            primary = ElementTypesHandler(results.types).primary.slug
+            combat_call = f"sound_{primary}_call"
+            faint_call = f"sound_{primary}_faint"
+
+        return cls(
+            slug=results.slug,
+            name=T.translate(results.slug),
+            description=T.translate(f"{results.slug}_description"),
+            cat=results.category,
+            category=T.translate(f"cat_{results.category}"),
+            shape=results.shape,
+            stage=results.stage,
+            tags=results.tags,
+            types=tuple(results.types),
+            randomly=results.randomly,
+            txmn_id=results.txmn_id,
+            height=results.height,
+            weight=results.weight,
+            possible_genders=tuple(results.possible_genders),
+            catch_rate=results.catch_rate,
+            upper_catch_resistance=results.upper_catch_resistance,
+            lower_catch_resistance=results.lower_catch_resistance,
+            moveset=results.moveset or [],
+            evolutions=tuple(results.evolutions or []),
+            history=tuple(results.history or []),
+            flairs=FlairApplier.create(results.flairs),
+            front_path=loader.resolve_path(sprites.front),
+            back_path=loader.resolve_path(sprites.back),
+            menu1_path=loader.resolve_path(sprites.menu1),
+            menu2_path=loader.resolve_path(sprites.menu2),
+            combat_call=combat_call,
+            faint_call=faint_call,
+            model=results,
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clears the template cache."""
+        cls._templates.clear()
+
+
 class Monster:
     """
     Tuxemon monster.
 
     A class for a Tuxemon monster object. This class acts as a skeleton for
     a Tuxemon, fetching its details from a database.
+
+    Kennels and rosters hold many monsters, so the attributes are kept in
+    slots, and the handlers that are seldom used (sprites, evolution and
+    fusion body) are only created when they are first accessed.
     """
 
+    __slots__ = (
+        "_body",
+        "_evolution_handler",
+        "_sprite_handler",
+        "_template",
+        "acquisition",
+        "base_stats",
+        "bond",
+        "capture",
+        "capture_device",
+        "cat",
+        "catch_rate",
+        "category",
+        "combat_call",
+        "current_hp",
+        "description",
+        "evolutions",
+        "experience_modifier",
+        "faint_call",
+        "flairs",
+        "gender",
+        "got_experience",
+        "height",
+        "held_item",
+        "history",
+        "instance_id",
+        "level",
+        "levelling_up",
+        "lower_catch_resistance",
+        "modifiers",
+        "money_modifier",
+        "moves",
+        "name",
+        "out_of_range",
+        "owner",
+        "plague",
+        "possible_genders",
+        "randomly",
+        "shape",
+        "slug",
+        "stage",
+        "state",
+        "status",
+        "steps",
+        "tags",
+        "taste_cold",
+        "taste_warm",
+        "total_experience",
+        "txmn_id",
+        "types",
+        "upper_catch_resistance",
+        "weight",
+        "wild",
+    )
+
     def __init__(self, save_data: Optional[Mapping[str, Any]] = None) -> None:
         save_data = save_data or {}
 
@@ -133,7 +324,7 @@ class Monster:
 
         self.moves = MonsterMovesHandler()
         self.evolutions: list[MonsterEvolutionItemModel] = []
-        self.evolution_handler = Evolution(self)
+        self._evolution_handler: Optional[Evolution] = None
         self.history: list[MonsterHistoryItemModel] = []
         self.stage: EvolutionStage = EvolutionStage.standalone
         self.flairs: dict[str, Flair] = {}
@@ -184,10 +375,11 @@ class Monster:
 
         # A fusion body object that contains the monster's face and body
         # sprites, as well as _color scheme.
-        self.body = Body()
+        self._body: Optional[Body] = None
 
         # Set up our sprites.
-        self.sprite_handler = MonsterSpriteHandler()
+        self._template: Optional[MonsterTemplate] = None
+        self._sprite_handler: Optional[MonsterSpriteHandler] = None
 
         self.set_state(save_data)
         self.set_stats()
@@ -244,75 +436,95 @@ class Monster:
     def is_fainted(self) -> bool:
         return self.current_hp <= 0
 
+    @property
+    def evolution_handler(self) -> Evolution:
+        if self._evolution_handler is None:
+            self._evolution_handler = Evolution(self)
+        return self._evolution_handler
+
+    @evolution_handler.setter
+    def evolution_handler(self, handler: Evolution) -> None:
+        self._evolution_handler = handler
+
+    @property
+    def body(self) -> Body:
+        if self._body is None:
+            self._body = Body()
+        return self._body
+
+    @body.setter
+    def body(self, body: Body) -> None:
+        self._body = body
+
+    @property
+    def sprite_handler(self) -> MonsterSpriteHandler:
+        """The sprites of the species, loaded when they are first used."""
+        if self._sprite_handler is None:
+            template = self._template
+            if template is None:
+                self._sprite_handler = MonsterSpriteHandler()
+            else:
+                self._sprite_handler = MonsterSpriteHandler(
+                    slug=template.slug,
+                    front_path=template.front_path,
+                    back_path=template.back_path,
+                    menu1_path=template.menu1_path,
+                    menu2_path=template.menu2_path,
+                    flairs=self.flairs,
+                )
+        return self._sprite_handler
+
+    @sprite_handler.setter
+    def sprite_handler(self, handler: MonsterSpriteHandler) -> None:
+        self._sprite_handler = handler
+
     def load(self, slug: str) -> None:
         """
         Loads and sets this monster's attributes from the monster.db database.
 
-        The monster is looked up in the database by name.
+        The monster is looked up in the database by name, once per species:
+        the shared values come from the template of the species.
 
         Parameters:
             slug: Slug to lookup.
         """
-        results = MonsterModel.lookup(slug, db)
+        template = MonsterTemplate.get(slug)
         self.level = random.randint(2, 5)
-        self.slug = results.slug
-        self.name = T.translate(results.slug)
-        self.description = T.translate(f"{results.slug}_description")
-        self.cat = results.category
-        self.category = T.translate(f"cat_{self.cat}")
-        self.shape = ShapeHandler(results.shape)
-        self.stage = results.stage
-        self.tags = results.tags
+        self.slug = template.slug
+        self.name = template.name
+        self.description = template.description
+        self.cat = template.cat
+        self.category = template.category
+        self.shape = ShapeHandler(template.shape)
+        self.stage = template.stage
+        self.tags = template.tags
         self.taste_cold, self.taste_warm = Taste.generate(
             self.taste_cold, self.taste_warm
         )
 
-        self.types = ElementTypesHandler(results.types)
+        self.types = ElementTypesHandler(template.types)
 
-        self.randomly = results.randomly
+        self.randomly = template.randomly
 
-        self.txmn_id = results.txmn_id
+        self.txmn_id = template.txmn_id
         self.set_capture(self.capture)
-        self.height = formula.set_height(self, results.height)
-        self.weight = formula.set_weight(self, results.weight)
-        self.gender = random.choice(list(results.possible_genders))
-        self.catch_rate = results.catch_rate
-        self.upper_catch_resistance = results.upper_catch_resistance
-        self.lower_catch_resistance = results.lower_catch_resistance
+        self.height = formula.set_height(self, template.height)
+        self.weight = formula.set_weight(self, template.weight)
+        self.gender = random.choice(template.possible_genders)
+        self.catch_rate = template.catch_rate
+        self.upper_catch_resistance = template.upper_catch_resistance
+        self.lower_catch_resistance = template.lower_catch_resistance
 
-        self.moves.set_moveset(results.moveset or [])
-        self.evolutions.extend(results.evolutions or [])
-        self.history.extend(results.history or [])
+        self.moves.set_moveset(template.moveset)
+        self.evolutions.extend(template.evolutions)
+        self.history.extend(template.history)
 
-        # Look up the monster's sprite image paths
-        sprites = results.sprites or MonsterSpritesModel(
-            front=f"gfx/sprites/battle/{slug}-front",
-            back=f"gfx/sprites/battle/{slug}-back",
-            menu1=f"gfx/sprites/battle/{slug}-menu01",
-            menu2=f"gfx/sprites/battle/{slug}-menu02",
-        )
-        self.flairs = FlairApplier.create(results.flairs)
-        loader = SpriteLoader()
-        self.sprite_handler = MonsterSpriteHandler(
-            slug=slug,
-            front_path=loader.resolve_path(sprites.front),
-            back_path=loader.resolve_path(sprites.back),
-            menu1_path=loader.resolve_path(sprites.menu1),
-            menu2_path=loader.resolve_path(sprites.menu2),
-            flairs=self.flairs,
-        )
+        self.flairs = dict(template.flairs)
+        self._template = template
+        self._sprite_handler = None
 
-        # get sound slugs for this monster, defaulting to a generic type-based sound
-        self.combat_call = (
-            results.sounds.combat_call
-            if results.sounds
-            else f"sound_{self.types.primary.slug}_call"
-        )
-        self.faint_call = (
-            results.sounds.faint_call
-            if results.sounds
-            else f"sound_{self.types.primary.slug}_faint"
-        )
+        self.combat_call = template.combat_call
+        self.faint_call = template.faint_call
 
     def load_sprites(self, scale: float = prepare.SCALE) -> None:
         """
@@ -525,7 +737,7 @@ class Monster:
         save_data["acquisition"] = self.acquisition
         save_data["plague"] = self.plague.encode_plagues()
 
-        body = self.body.get_state()
+        body = self._body.get_state() if self._body is not None else None
         if body:
             save_data["body"] = body
 
@@ -571,8 +783,6 @@ class Monster:
             elif key == "modifiers" and value:
                 self.modifiers.from_dict(value)
 
-        self.load_sprites()
-
     def end_combat(self, session: Session) -> None:
         """
         Ends combat, recharges all moves and heals statuses.
@@ -592,6 +802,8 @@ class Monster:
 
 
 class SpriteLoader:
+    __slots__ = ("sprite_cache", "animated_sprite_cache")
+
     def __init__(self) -> None:
         self.sprite_cache: dict[str, Surface] = {}
         self.animated_sprite_cache: dict[str, Sprite] = {}
@@ -667,6 +879,16 @@ class FlairApplier:
 class MonsterSpriteHandler:
     """Manages the loading, caching, and retrieval of monster sprites."""
 
+    __slots__ = (
+        "loader",
+        "slug",
+        "front_path",
+        "back_path",
+        "menu1_path",
+        "menu2_path",
+        "flairs",
+    )
+
     def __init__(
         self,
         slug: str = "",
@@ -738,6 +960,8 @@ class MonsterSpriteHandler:
 
 
 class MonsterStatusHandler:
+    __slots__ = ("status",)
+
     def __init__(self, status: Optional[list[Status]] = None):
         self.status = status if status is not None else []
 
@@ -831,6 +1055,8 @@ class MonsterStatusHandler:
 
 
 class MonsterItemHandler:
+    __slots__ = ("item",)
+
     def __init__(self, item: Optional[Item] = None):
         self.item = item
 
@@ -859,6 +1085,8 @@ class MonsterItemHandler:
 
 
 class MonsterMovesHandler:
+    __slots__ = ("moves", "moveset")
+
     def __init__(
         self,
         moves: Optional[list[Technique]] = None,
@@ -995,6 +1223,8 @@ class MonsterPlagueHandler:
     Manages the various plagues affecting a monster.
     """
 
+    __slots__ = ("_plagues",)
+
     def __init__(
         self, plagues: Optional[dict[str, PlagueType]] = None
     ) -> None:
@@ -3,16 +3,13 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import MutableMapping, Sequence
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, MutableMapping, Sequence
+from heapq import heappop, heappush
+from itertools import count
 from typing import TYPE_CHECKING, Optional
 
-from tuxemon.map import (
-    dirs2,
-    get_adjacent_position,
-    get_coords_ext,
-    get_explicit_tile_exits,
-    pairs,
-)
+from tuxemon.map import get_coords_ext, get_explicit_tile_exits, pairs
 from tuxemon.prepare import CONFIG
 
 if TYPE_CHECKING:
@@ -27,6 +24,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of computed paths kept by the pathfinder
+PATH_CACHE_SIZE = 64
+
+PathCacheKey = tuple[tuple[int, int], tuple[int, int], "Direction", Hashable]
+
 
 class PathfindNode:
     """Used in path finding search."""
@@ -140,6 +142,11 @@ class Pathfinder:
         self.map_manager = map_manager
         self.collision_manager = collision_manager
         self.boundary = boundary
+        self._path_cache: OrderedDict[
+            PathCacheKey, tuple[tuple[int, int], ...]
+        ] = OrderedDict()
+        self._min_step_cost = 1.0
+        self._min_step_cost_version: Optional[Hashable] = None
 
     def pathfind(
         self, start: tuple[int, int], dest: tuple[int, int], facing: Direction
@@ -157,6 +164,18 @@ class Pathfinder:
             A sequence of positions representing the path if found, or None if no path
                 exists.
         """
+        # NPCs block the tiles they stand on, so paths depend on them too
+        version = (
+            self.collision_manager.version,
+            self.npc_manager.positions_version,
+        )
+        key = (start, dest, facing, version)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Path from {start} to {dest} served from cache.")
+            self._path_cache.move_to_end(key)
+            return list(cached)
+
         pathnode = self.pathfind_r(
             dest=dest,
             queue=[PathfindNode(start)],
@@ -166,6 +185,7 @@ class Pathfinder:
         logger.info(f"Pathfinding from {start} to {dest}.")
         if pathnode:
             path = pathnode.reconstruct_path()
+            self._cache_path(key, path)
             return path
         else:
             character = self.npc_manager.get_entity_pos(start)
@@ -186,12 +206,16 @@ class Pathfinder:
         facing: Direction,
     ) -> Optional[PathfindNode]:
         """
-        A recursive helper method that explores possible paths to the destination.
+        Explores possible paths to the destination using A* search.
+
+        Nodes are expanded by lowest estimated total cost, where the cost
+        of stepping onto a tile is weighted by its surface moverate and the
+        estimate is the Manhattan distance to the destination.
 
         Parameters:
             dest: The destination position as a tuple of (x, y) coordinates.
-            queue: A deque of PathfindNode objects representing the current nodes to
-                explore.
+            queue: A list of PathfindNode objects representing the nodes the
+                search starts from.
             known_nodes: A set of positions that have already been explored.
             facing: The direction the character is currently facing, which guides path
                 exploration.
@@ -202,29 +226,105 @@ class Pathfinder:
         if not queue:
             return None
         collision_map = self.collision_manager.get_collision_map()
-        while queue:
-            node = queue.pop(0)
-            logger.debug(f"Checking node {node.get_value()}.")
-            if node.get_value() == dest:
+        tiebreak = count()
+        open_set: list[tuple[float, int, float, PathfindNode]] = []
+        best_costs: dict[tuple[int, int], float] = {}
+        for node in queue:
+            best_costs[node.get_value()] = 0.0
+            heappush(open_set, (0.0, next(tiebreak), 0.0, node))
+
+        while open_set:
+            _, _, cost, node = heappop(open_set)
+            position = node.get_value()
+            logger.debug(f"Checking node {position}.")
+            if position == dest:
                 logger.info(f"Destination {dest} reached.")
                 return node
+            if position in known_nodes:
+                continue
+            known_nodes.add(position)
             for adj_pos in self.get_exits(
-                position=node.get_value(),
+                position=position,
                 facing=facing,
                 collision_map=collision_map,
                 skip_nodes=known_nodes,
             ):
-                if adj_pos not in known_nodes:
-                    known_nodes.add(adj_pos)
-                    new_node = PathfindNode(adj_pos)
-                    new_node.set_parent(node)
-                    queue.append(new_node)
-                    logger.debug(
-                        f"Added adjacent position {adj_pos} to the queue."
-                    )
+                new_cost = cost + self.get_step_cost(adj_pos)
+                if new_cost >= best_costs.get(adj_pos, float("inf")):
+                    continue
+                best_costs[adj_pos] = new_cost
+                new_node = PathfindNode(adj_pos)
+                new_node.set_parent(node)
+                estimate = new_cost + self.estimate_cost(adj_pos, dest)
+                heappush(
+                    open_set, (estimate, next(tiebreak), new_cost, new_node)
+                )
+                logger.debug(
+                    f"Added adjacent position {adj_pos} to the queue."
+                )
         logger.warning(f"No path found to destination {dest}.")
         return None
 
+    def get_step_cost(self, position: tuple[int, int]) -> float:
+        """
+        Returns the cost of stepping onto the given tile.
+
+        The cost is the inverse of the tile's surface moverate, so that
+        slow terrain is avoided when a faster route of similar length exists.
+
+        Parameters:
+            position: The tile being entered.
+
+        Returns:
+            The movement cost of the tile.
+        """
+        return get_tile_cost(self.map_manager.surface_map, position)
+
+    def estimate_cost(
+        self, position: tuple[int, int], dest: tuple[int, int]
+    ) -> float:
+        """
+        Returns the Manhattan distance heuristic used by the A* search.
+
+        The distance is scaled by the cheapest step cost on the map so the
+        estimate never exceeds the real cost, even on fast surfaces.
+
+        Parameters:
+            position: The tile to estimate from.
+            dest: The destination tile.
+
+        Returns:
+            The estimated cost of reaching the destination.
+        """
+        distance = abs(position[0] - dest[0]) + abs(position[1] - dest[1])
+        if not distance:
+            return 0.0
+        return distance * self._get_min_step_cost()
+
+    def _get_min_step_cost(self) -> float:
+        version = self.collision_manager.version
+        if version != self._min_step_cost_version:
+            rates = [
+                float(rate)
+                for surface in self.map_manager.surface_map.values()
+                for rate in surface.values()
+            ]
+            self._min_step_cost = 1.0 / max([1.0, *rates])
+            self._min_step_cost_version = version
+        return self._min_step_cost
+
+    def _cache_path(
+        self, key: PathCacheKey, path: Sequence[tuple[int, int]]
+    ) -> None:
+        self._path_cache[key] = tuple(path)
+        self._path_cache.move_to_end(key)
+        while len(self._path_cache) > PATH_CACHE_SIZE:
+            self._path_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Discards all the cached paths."""
+        self._path_cache.clear()
+
     def is_valid_position(
         self, position: tuple[int, int], skip_nodes: set[tuple[int, int]]
     ) -> bool:
@@ -267,9 +367,8 @@ class Pathfinder:
             A sequence of adjacent and traversable tile positions.
         """
         # get tile-level and npc/entity blockers
-        collision_map = (
-            collision_map or self.collision_manager.get_collision_map()
-        )
+        if collision_map is None:
+            collision_map = self.collision_manager.get_collision_map()
         skip_nodes = skip_nodes or set()
         logger.debug(f"Getting exits for position {position}.")
 
@@ -288,12 +387,12 @@ class Pathfinder:
             )
 
         adjacent_tiles = set()
-        # Loop through all directions dynamically using dirs2
-        for direction, vector in dirs2.items():
-            neighbor = get_adjacent_position(position, direction)
+        # Walls and map edges are already encoded in the walkability grid
+        for direction, neighbor in self.map_manager.walkability.get_neighbors(
+            position
+        ):
             # If we have specific exits defined, make sure the neighbor is one of them
             # Also, skip this neighbor if it's in the list of nodes we want to avoid
-            # We only need to check the edges since we can't go out of bounds
             if (exits and neighbor not in exits) or not self.is_valid_position(
                 neighbor, skip_nodes
             ):
@@ -302,15 +401,6 @@ class Pathfinder:
                 )
                 continue
 
-            if (
-                position,
-                direction,
-            ) in self.map_manager.collision_lines_map:
-                logger.debug(
-                    f"Wall detected between {position} and {neighbor}."
-                )
-                continue
-
             # test if this tile has special movement handling
             # NOTE: Do not refact. into a dict.get(xxxxx, None) style check
             # NOTE: None has special meaning in this check
@@ -358,14 +448,33 @@ class Pathfinder:
         return True
 
 
+def get_tile_rate(
+    surface_map: Mapping[tuple[int, int], dict[str, float]],
+    destination: tuple[int, int],
+) -> float:
+    """Gets the surface speed modifier of the given tile."""
+    tile_properties = surface_map.get(destination, {})
+    rate = next(iter(tile_properties.values()), 1.0)
+    # Convert rate to a numeric type if necessary
+    return float(rate)
+
+
 def get_tile_moverate(
     surface_map: MutableMapping[tuple[int, int], dict[str, float]],
     npc: NPC,
     destination: tuple[int, int],
 ) -> float:
     """Gets the movement speed modifier for the given tile."""
-    tile_properties = surface_map.get(destination, {})
-    rate = next(iter(tile_properties.values()), 1.0)
-    # Convert rate to a numeric type if necessary
-    _moverate = npc.moverate * float(rate)
+    _moverate = npc.moverate * get_tile_rate(surface_map, destination)
     return _moverate
+
+
+def get_tile_cost(
+    surface_map: Mapping[tuple[int, int], dict[str, float]],
+    destination: tuple[int, int],
+) -> float:
+    """Gets the pathfinding cost of entering the given tile."""
+    rate = get_tile_rate(surface_map, destination)
+    if rate <= 0:
+        return float("inf")
+    return 1.0 / rate
@@ -146,13 +146,20 @@ class NPC(Entity[NPCState]):
         # the destination due to speed issues or framerate jitters.
         self.path_origin: Optional[tuple[int, int]] = None
 
-        self.sprite_controller = SpriteController(self)
+        self._sprite_controller: Optional[SpriteController] = None
 
     @property
     def monsters(self) -> list[Monster]:
         """Returns the list of monsters in the party."""
         return self.party.monsters
 
+    @property
+    def sprite_controller(self) -> SpriteController:
+        """The map sprites of the NPC, loaded when first used."""
+        if self._sprite_controller is None:
+            self._sprite_controller = SpriteController(self)
+        return self._sprite_controller
+
     def get_state(self, session: Session) -> NPCState:
         """
         Prepares a dictionary of the npc to be saved to a file.
@@ -10,20 +10,46 @@ from tuxemon import networking
 
 if TYPE_CHECKING:
     from tuxemon.client import LocalPygameClient
+    from tuxemon.entity import Entity
     from tuxemon.monster import Monster
     from tuxemon.npc import NPC
 
 
 class NPCManager:
+    """
+    Keeps track of the NPCs on and off the current map.
+
+    NPCs on the map are indexed by tile and by instance id, so that
+    position and identity lookups do not need to scan every NPC. The tile
+    index is kept in sync by the NPCs themselves, which report every change
+    of their tile position through ``update_npc_position``.
+    """
+
     def __init__(self) -> None:
         self.npcs: dict[str, NPC] = {}
         self.npcs_off_map: dict[str, NPC] = {}
+        self._tile_index: dict[tuple[int, int], dict[str, NPC]] = {}
+        self._indexed_tiles: dict[str, tuple[int, int]] = {}
+        self._iid_index: dict[uuid.UUID, NPC] = {}
+        self._monster_index: dict[uuid.UUID, tuple[NPC, Monster]] = {}
+        self._positions_version = 0
+
+    @property
+    def positions_version(self) -> int:
+        """
+        Counter incremented every time an NPC enters, leaves or moves to
+        another tile of the current map.
+        """
+        return self._positions_version
 
     def npc_exists(self, slug: str) -> bool:
         return slug in self.npcs
 
     def add_npc(self, npc: NPC) -> None:
+        self._unindex_npc(npc.slug)
         self.npcs[npc.slug] = npc
+        self._index_npc(npc)
+        self._positions_version += 1
 
     def add_npc_off_map(self, npc: NPC) -> None:
         self.npcs_off_map[npc.slug] = npc
@@ -31,7 +57,9 @@ class NPCManager:
     def remove_npc(self, slug: str) -> None:
         if slug in self.npcs:
             self.npcs[slug].remove_collision()
+            self._unindex_npc(slug)
             del self.npcs[slug]
+            self._positions_version += 1
 
     def remove_npc_off_map(self, slug: str) -> None:
         """Removes an NPC off-map, ensuring cleanup."""
@@ -46,9 +74,16 @@ class NPCManager:
         return self.npcs_off_map.get(slug)
 
     def get_npc_by_iid(self, iid: uuid.UUID) -> Optional[NPC]:
-        return next(
+        npc = self._iid_index.get(iid)
+        if npc is not None and npc.instance_id == iid:
+            return npc
+        # the instance id may have been replaced, e.g. when loading a save
+        npc = next(
             (npc for npc in self.npcs.values() if npc.instance_id == iid), None
         )
+        if npc is not None:
+            self._iid_index[iid] = npc
+        return npc
 
     def get_npc_off_map_by_iid(self, iid: uuid.UUID) -> Optional[NPC]:
         return next(
@@ -61,9 +96,49 @@ class NPCManager:
         )
 
     def get_entity_pos(self, pos: tuple[int, int]) -> Optional[NPC]:
-        return next(
-            (npc for npc in self.npcs.values() if npc.tile_pos == pos), None
-        )
+        npcs = self._tile_index.get(pos)
+        if npcs:
+            return next(iter(npcs.values()))
+        return None
+
+    def update_npc_position(self, npc: Entity[Any]) -> None:
+        """
+        Moves the NPC to its current tile in the position index.
+
+        Entities that are not NPCs on the current map are ignored.
+
+        Parameters:
+            npc: The entity whose tile position changed.
+        """
+        registered = self.npcs.get(npc.slug)
+        if registered is None or registered is not npc:
+            return
+        self._unindex_tile(registered.slug)
+        self._indexed_tiles[registered.slug] = registered.tile_pos
+        tile_npcs = self._tile_index.setdefault(registered.tile_pos, {})
+        tile_npcs[registered.slug] = registered
+        self._positions_version += 1
+
+    def _index_npc(self, npc: NPC) -> None:
+        self._iid_index[npc.instance_id] = npc
+        self._indexed_tiles[npc.slug] = npc.tile_pos
+        self._tile_index.setdefault(npc.tile_pos, {})[npc.slug] = npc
+
+    def _unindex_npc(self, slug: str) -> None:
+        npc = self.npcs.get(slug)
+        if npc is not None:
+            self._iid_index.pop(npc.instance_id, None)
+        self._unindex_tile(slug)
+
+    def _unindex_tile(self, slug: str) -> None:
+        tile = self._indexed_tiles.pop(slug, None)
+        if tile is None:
+            return
+        npcs = self._tile_index.get(tile)
+        if npcs is not None:
+            npcs.pop(slug, None)
+            if not npcs:
+                del self._tile_index[tile]
 
     def update_npcs_off_map(
         self, time_delta: float, client: LocalPygameClient
@@ -90,6 +165,11 @@ class NPCManager:
     def clear_npcs(self) -> None:
         self.npcs.clear()
         self.npcs_off_map.clear()
+        self._tile_index.clear()
+        self._indexed_tiles.clear()
+        self._iid_index.clear()
+        self._monster_index.clear()
+        self._positions_version += 1
 
     def get_all_entities(self) -> Sequence[NPC]:
         return list(self.npcs.values())
@@ -100,15 +180,30 @@ class NPCManager:
         ]
 
     def get_monster_by_iid(self, iid: uuid.UUID) -> Optional[Monster]:
-        return next(
-            (
-                monster
-                for npc in self.npcs.values()
-                for monster in npc.monsters
-                if monster.instance_id == iid
-            ),
-            None,
-        )
+        entry = self._monster_index.get(iid)
+        if entry is None:
+            # misses are common (wild monsters, old iids): scan, don't rebuild
+            for npc in self.npcs.values():
+                for monster in npc.monsters:
+                    if monster.instance_id == iid:
+                        self._monster_index[iid] = (npc, monster)
+                        return monster
+            return None
+        npc, monster = entry
+        if (
+            self.npcs.get(npc.slug) is npc
+            and monster.instance_id == iid
+            and monster in npc.monsters
+        ):
+            return monster
+        # parties change freely, so rebuild the index on a stale entry
+        self._monster_index = {
+            monster.instance_id: (npc, monster)
+            for npc in self.npcs.values()
+            for monster in npc.monsters
+        }
+        entry = self._monster_index.get(iid)
+        return entry[1] if entry is not None else None
 
     def add_clients_to_map(
         self, registry: Mapping[str, Any], current_map: str
@@ -127,9 +222,10 @@ class NPCManager:
                 client_map = client["map_name"]
 
                 if client_map == current_map:
-                    self.npcs[sprite.slug] = sprite
+                    self.add_npc(sprite)
                     self.npcs_off_map.pop(sprite.slug, None)
 
                 elif client_map != current_map:
                     self.npcs_off_map[sprite.slug] = sprite
+                    self._unindex_npc(sprite.slug)
                     self.npcs.pop(sprite.slug, None)
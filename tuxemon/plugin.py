@@ -2,16 +2,26 @@
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
 import inspect
+import json
 import logging
+import os
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 from pathlib import Path
 from types import ModuleType
 from typing import (
+    Any,
     ClassVar,
     Generic,
     Optional,
@@ -22,7 +32,7 @@ from typing import (
     runtime_checkable,
 )
 
-from tuxemon.constants.paths import PLUGIN_INCLUDE_PATTERNS
+from tuxemon.constants.paths import CACHE_DIR, PLUGIN_INCLUDE_PATTERNS
 
 logger = logging.getLogger(__name__)
 log_hdlr = logging.StreamHandler(sys.stdout)
@@ -298,20 +308,220 @@ def get_available_classes(
     ]
 
 
+class PluginManifest:
+    """
+    On-disk cache of the module of each plugin of a folder.
+
+    Finding the plugins means importing every module of the folder, so
+    the result is kept, with the name, size and modification time of
+    each file of the folder. It is used while none of them changed.
+
+    Parameters:
+        cache_dir: Directory where the manifests are written.
+    """
+
+    version = 1
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    def get_path(self, folder: Path, interface: type[Any]) -> Path:
+        """
+        Returns the path of the manifest of a folder.
+
+        Parameters:
+            folder: The folder of the plugins.
+            interface: Superclass or protocol of the plugins.
+
+        Returns:
+            The path of the manifest.
+        """
+        key = f"{folder.resolve().as_posix()}:{_get_interface_name(interface)}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{folder.name}_{digest}.json"
+
+    def fingerprint(self, folder: Path, interface: type[Any]) -> str:
+        """
+        Computes the fingerprint of the files of a folder.
+
+        Parameters:
+            folder: The folder of the plugins.
+            interface: Superclass or protocol of the plugins.
+
+        Returns:
+            A digest of the names, sizes and modification times.
+        """
+        digest = hashlib.sha1(str(self.version).encode())
+        digest.update(_get_interface_name(interface).encode())
+        for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+            stat = entry.stat()
+            digest.update(
+                f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+            )
+        return digest.hexdigest()
+
+    def load(
+        self, folder: Path, interface: type[Any]
+    ) -> Optional[dict[str, str]]:
+        """
+        Loads the manifest of a folder, if it is up to date.
+
+        Parameters:
+            folder: The folder of the plugins.
+            interface: Superclass or protocol of the plugins.
+
+        Returns:
+            The module of each plugin, by plugin name, or ``None``.
+        """
+        path = self.get_path(folder, interface)
+        if not path.exists():
+            return None
+        try:
+            with path.open() as fp:
+                data = json.load(fp)
+            if data["fingerprint"] != self.fingerprint(folder, interface):
+                logger.debug(f"Plugin manifest '{path}' is out of date.")
+                return None
+            return dict(data["plugins"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                f"Ignoring unreadable plugin manifest '{path}': {e}"
+            )
+            return None
+
+    def save(
+        self, folder: Path, interface: type[Any], plugins: dict[str, str]
+    ) -> None:
+        """
+        Writes the manifest of a folder.
+
+        Parameters:
+            folder: The folder of the plugins.
+            interface: Superclass or protocol of the plugins.
+            plugins: The module of each plugin, by plugin name.
+        """
+        path = self.get_path(folder, interface)
+        data = {
+            "fingerprint": self.fingerprint(folder, interface),
+            "plugins": plugins,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(data, indent=1, sort_keys=True))
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write plugin manifest '{path}': {e}")
+
+
+def _get_interface_name(interface: type[Any]) -> str:
+    return f"{interface.__module__}.{interface.__qualname__}"
+
+
+class LazyPlugins(MutableMapping[str, type[InterfaceValue]]):
+    """
+    Plugin classes by name, imported when they are first used.
+
+    The names of the plugins are known from the manifest, so listing them
+    does not import anything. Getting a plugin imports its module.
+
+    Parameters:
+        manifest: The module of each plugin, by plugin name.
+        manager: Plugin manager used to import the modules.
+        interface: Superclass or protocol of the plugins.
+        category: Optional string for debugging info.
+    """
+
+    def __init__(
+        self,
+        manifest: Mapping[str, str],
+        manager: PluginManager,
+        interface: type[InterfaceValue],
+        category: str = "plugins",
+    ) -> None:
+        self._manifest = dict(manifest)
+        self._classes: dict[str, type[InterfaceValue]] = {}
+        self._manager = manager
+        self._interface = interface
+        self._category = category
+
+    def __getitem__(self, name: str) -> type[InterfaceValue]:
+        try:
+            return self._classes[name]
+        except KeyError:
+            pass
+        module_name = self._manifest[name]
+        self._import(module_name)
+        try:
+            return self._classes[name]
+        except KeyError:
+            logger.error(f"{self._category} {name} is not in {module_name}")
+            raise
+
+    def _import(self, module_name: str) -> None:
+        try:
+            module = self._manager.loader.load_plugin(module_name)
+        except ImportError as e:
+            logger.error(
+                f"Skipping module {module_name} due to import error: {e}"
+            )
+            return
+        for plugin in self._manager._get_plugins_from_module(
+            module, module_name, self._interface
+        ):
+            cls = plugin.plugin_object
+            name = getattr(cls, "name", None)
+            if name is not None and self._manifest.get(name) == module_name:
+                self._classes[name] = cls
+                logger.info(f"loaded {self._category}: {name}")
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._classes or name in self._manifest
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._manifest
+        yield from (
+            name for name in self._classes if name not in self._manifest
+        )
+
+    def __len__(self) -> int:
+        return len(self._manifest.keys() | self._classes.keys())
+
+    def __setitem__(self, name: str, cls: type[InterfaceValue]) -> None:
+        self._classes[name] = cls
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._classes.pop(name, None)
+        self._manifest.pop(name, None)
+
+
+# shared by the managers of actions, conditions and effects
+PLUGIN_MANIFEST = PluginManifest(CACHE_DIR / "plugins")
+
+
 # Overloads until https://github.com/python/mypy/issues/3737 is fixed
 
 
 @overload
 def load_plugins(
-    path: Path, category: str = "plugins"
-) -> Mapping[str, type[PluginObject]]:
+    path: Path,
+    category: str = "plugins",
+    *,
+    manifest: Optional[PluginManifest] = None,
+) -> MutableMapping[str, type[PluginObject]]:
     pass
 
 
 @overload
 def load_plugins(
-    path: Path, category: str = "plugins", *, interface: type[InterfaceValue]
-) -> Mapping[str, type[InterfaceValue]]:
+    path: Path,
+    category: str = "plugins",
+    *,
+    interface: type[InterfaceValue],
+    manifest: Optional[PluginManifest] = None,
+) -> MutableMapping[str, type[InterfaceValue]]:
     pass
 
 
@@ -320,24 +530,38 @@ def load_plugins(
     category: str = "plugins",
     *,
     interface: Union[type[InterfaceValue], type[PluginObject]] = PluginObject,
-) -> Mapping[str, Union[type[InterfaceValue], type[PluginObject]]]:
+    manifest: Optional[PluginManifest] = None,
+) -> MutableMapping[str, Union[type[InterfaceValue], type[PluginObject]]]:
     """
     Load plugins from a directory and return them by name.
 
+    With a manifest, the plugins are not all imported: the module of each
+    plugin is read from the manifest, and only imported when the plugin
+    is first used. The manifest is written the first time, and again when
+    the files of the directory change.
+
     Parameters:
         path: Location of the modules to load.
         category: Optional string for debugging info.
         interface: Superclass or protocol of the returned classes. If no
             class is given, they are only required to have a `name` attribute.
+        manifest: Optional cache of the module of each plugin.
 
     Returns:
         A dictionary mapping the `name` attribute of each class to the class
         itself.
     """
-    classes: dict[str, Union[type[InterfaceValue], type[PluginObject]]] = {}
     plugins = load_directory(path)
+    if manifest is not None and path.is_dir():
+        cached = manifest.load(path, interface)
+        if cached is not None:
+            logger.debug(f"{len(cached)} {category} in the plugin manifest")
+            return LazyPlugins(cached, plugins, interface, category)
 
-    for cls in get_available_classes(plugins, interface=interface):
+    classes: dict[str, Union[type[InterfaceValue], type[PluginObject]]] = {}
+    modules: dict[str, str] = {}
+    for plugin in plugins.get_all_plugins(interface=interface):
+        cls = plugin.plugin_object
         try:
             name = cls.name
         except AttributeError:
@@ -346,6 +570,14 @@ def load_plugins(
             )
             continue
         classes[name] = cls
+        module_name = plugin.name.rsplit(".", 1)[0]
+        if name not in modules or cls.__module__ == module_name:
+            modules[name] = module_name
         logger.info(f"loaded {category}: {cls.name}")
 
-    return classes
+    if manifest is None or not path.is_dir():
+        return classes
+    manifest.save(path, interface, modules)
+    lazy_plugins = LazyPlugins(modules, plugins, interface, category)
+    lazy_plugins.update(classes)
+    return lazy_plugins
@@ -314,7 +314,7 @@ def pygame_init() -> None:
     T.initialize_translations(recompile=CONFIG.recompile_translations)
     from tuxemon.db import db
 
-    db.load()
+    db.load(lazy=CONFIG.lazy_db)
 
     logger.debug("pygame init")
     pg.init()
@@ -360,7 +360,7 @@ def headless_init() -> None:
     T.initialize_translations(recompile=CONFIG.recompile_translations)
     from tuxemon.db import db
 
-    db.load()
+    db.load(lazy=CONFIG.lazy_db)
     logger.debug("headless init")
 
 
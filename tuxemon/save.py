@@ -6,21 +6,28 @@ import importlib
 import json
 import logging
 import os
-from base64 import b64encode
+from base64 import b64decode, b64encode
 from collections.abc import Callable, Mapping
+from concurrent.futures import Future
+from copy import deepcopy
 from datetime import datetime
 from enum import Enum
+from io import BytesIO
 from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional, TypedDict, TypeVar
 
+from pygame.image import frombuffer
+from pygame.image import save as save_image
 from pygame.image import tobytes
 from pygame.surface import Surface
+from pygame.transform import smoothscale
 
 from tuxemon import prepare
 from tuxemon.client import LocalPygameClient
 from tuxemon.npc import NPCState
 from tuxemon.save_upgrader import SAVE_VERSION, upgrade_save
+from tuxemon.save_worker import SaveCallback, saver
 from tuxemon.session import Session
 from tuxemon.states.world.worldstate import WorldSave, WorldState
 
@@ -37,6 +44,8 @@ logger = logging.getLogger(__name__)
 
 slot_number: Optional[int] = None
 TIME_FORMAT = "%Y-%m-%d %H:%M"
+# width of the screenshot thumbnails kept in the save headers
+THUMBNAIL_WIDTH = 240
 config = prepare.CONFIG
 
 
@@ -63,6 +72,15 @@ class SaveData(TypedDict, total=False):
     world_state: WorldSave
 
 
+class SaveHeader(TypedDict, total=False):
+    time: str
+    version: int
+    player_name: str
+    current_map: str
+    party: list[dict[str, Any]]
+    thumbnail: str
+
+
 def capture_screenshot(client: LocalPygameClient) -> Surface:
     """
     Capture a screenshot.
@@ -114,6 +132,114 @@ def get_save_path(slot: int) -> Path:
     return prepare.SAVE_PATH.parent / f"slot{slot}.{extension}"
 
 
+def get_header_path(slot: int) -> Path:
+    save_path = get_save_path(slot)
+    return save_path.with_name(f"{save_path.name}.header")
+
+
+def encode_thumbnail(save_data: SaveData) -> Optional[str]:
+    """
+    Shrinks the screenshot of a save into a PNG thumbnail.
+
+    Parameters:
+        save_data: The save holding the screenshot.
+
+    Returns:
+        The base64 encoded PNG, or ``None`` if the save has no screenshot.
+    """
+    if "screenshot" not in save_data:
+        return None
+    size = (save_data["screenshot_width"], save_data["screenshot_height"])
+    screenshot = frombuffer(b64decode(save_data["screenshot"]), size, "RGB")
+    height = max(1, size[1] * THUMBNAIL_WIDTH // max(1, size[0]))
+    thumbnail = smoothscale(screenshot, (THUMBNAIL_WIDTH, height))
+    buffer = BytesIO()
+    save_image(thumbnail, buffer, "png")
+    return b64encode(buffer.getvalue()).decode()
+
+
+def get_save_header(save_data: SaveData) -> SaveHeader:
+    """
+    Gets the summary of a save shown when listing the save slots.
+
+    Parameters:
+        save_data: The full save.
+
+    Returns:
+        The header of the save.
+    """
+    npc_state = save_data.get("npc_state", {})
+    header: SaveHeader = {
+        "time": save_data["time"],
+        "version": save_data.get("version", 0),
+        "player_name": npc_state.get("player_name", ""),
+        "current_map": npc_state.get("current_map", ""),
+        "party": [
+            {"slug": monster.get("slug"), "level": monster.get("level")}
+            for monster in npc_state.get("monsters", [])
+        ],
+    }
+    thumbnail = encode_thumbnail(save_data)
+    if thumbnail is not None:
+        header["thumbnail"] = thumbnail
+    return header
+
+
+def save_header(header: SaveHeader, slot: int) -> None:
+    """
+    Writes the header file of a save slot.
+
+    Parameters:
+        header: The header to write.
+        slot: The save slot of the header.
+    """
+    header_path = get_header_path(slot)
+    header_path_tmp = header_path.with_suffix(header_path.suffix + ".tmp")
+    with header_path_tmp.open("w", encoding="utf-8") as file:
+        json.dump(header, file)
+    os.replace(header_path_tmp.as_posix(), header_path.as_posix())
+
+
+def load_header(slot: int) -> Optional[SaveHeader]:
+    """
+    Loads the summary of a save slot, without reading the full save.
+
+    The header is rebuilt from the full save when it is missing or older
+    than the save, e.g. for saves written by older versions.
+
+    Parameters:
+        slot: The save slot.
+
+    Returns:
+        The header of the save, or ``None`` if the slot is empty.
+    """
+    saver.wait(slot)
+    save_path = get_save_path(slot)
+    header_path = get_header_path(slot)
+    try:
+        save_mtime = save_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    try:
+        if header_path.stat().st_mtime_ns >= save_mtime:
+            with header_path.open(encoding="utf-8") as file:
+                header: SaveHeader = json.load(file)
+            return header
+    except (OSError, ValueError):
+        logger.debug(f"Rebuilding save header: {header_path}")
+
+    save_data = load(slot)
+    if save_data is None:
+        return None
+    header = get_save_header(save_data)
+    try:
+        save_header(header, slot)
+    except OSError as e:
+        logger.warning(f"Cannot write save header {header_path}: {e}")
+    return header
+
+
 def save_action(
     path: Path,
     mode: str,
@@ -271,6 +397,36 @@ def save(save_data: SaveData, slot: int) -> None:
     # We use a temporal file plus atomic replacement instead
     os.replace(save_path_tmp.as_posix(), save_path.as_posix())
 
+    # written last, so it is never newer than the save it describes
+    try:
+        save_header(get_save_header(save_data), slot)
+    except OSError as e:
+        logger.warning(f"Cannot write save header for slot {slot}: {e}")
+
+
+def save_in_background(
+    save_data: SaveData,
+    slot: int,
+    callback: Optional[SaveCallback] = None,
+) -> Future[None]:
+    """
+    Saves the game state to a file without blocking the game.
+
+    The data is copied right away, so the game can keep changing while it
+    is serialized, compressed and written by the save worker.
+
+    Parameters:
+        save_data: The data to save.
+        slot: The save slot to save the data to.
+        callback: Function called on the game thread once the save is
+            written, with the error that occurred if any.
+
+    Returns:
+        The future of the write.
+    """
+    snapshot = deepcopy(save_data)
+    return saver.submit(slot, lambda: save(snapshot, slot), callback)
+
 
 def load(slot: int) -> Optional[SaveData]:
     """
@@ -282,6 +438,7 @@ def load(slot: int) -> Optional[SaveData]:
     Returns:
         Dictionary containing game data to load.
     """
+    saver.wait(slot)
     save_path = get_save_path(slot)
     save_data = open_save_file(save_path)
 
@@ -294,11 +451,10 @@ def load(slot: int) -> Optional[SaveData]:
 def get_index_of_latest_save() -> Optional[int]:
     times = []
     for slot_index in range(3):
-        save_path = get_save_path(slot_index + 1)
-        save_data = open_save_file(save_path)
-        if save_data is not None:
+        header = load_header(slot_index + 1)
+        if header is not None:
             time_of_save = datetime.strptime(
-                save_data["time"],
+                header["time"],
                 TIME_FORMAT,
             )
             times.append((slot_index, time_of_save))
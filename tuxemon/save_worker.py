@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SaveCallback = Callable[[Optional[BaseException]], None]
+
+
+class SaveStatus(Enum):
+    IDLE = "idle"
+    SAVING = "saving"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class SaveWorker:
+    """
+    Writes save files on a background thread.
+
+    Saves are written one at a time, in the order they were submitted, so
+    the last save submitted for a slot is always the one left on disk.
+    Completion callbacks are not called from the worker thread: ``update``
+    calls them on the game thread, once per frame.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: dict[int, Future[None]] = {}
+        self._callbacks: list[tuple[Future[None], SaveCallback]] = []
+
+    def submit(
+        self,
+        slot: int,
+        write: Callable[[], None],
+        callback: Optional[SaveCallback] = None,
+    ) -> Future[None]:
+        """
+        Queues the writing of a save.
+
+        Parameters:
+            slot: The save slot being written.
+            write: Function writing the save. Its data must not be shared
+                with the game anymore.
+            callback: Function called on the game thread once the save is
+                written, with the error raised by ``write`` if any.
+
+        Returns:
+            The future of the write.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="save"
+            )
+        future = self._executor.submit(write)
+        self._jobs[slot] = future
+        if callback is not None:
+            self._callbacks.append((future, callback))
+        return future
+
+    def get_status(self, slot: int) -> SaveStatus:
+        """
+        Returns the status of the last save submitted for a slot.
+
+        Parameters:
+            slot: The save slot.
+
+        Returns:
+            The status of the save.
+        """
+        future = self._jobs.get(slot)
+        if future is None:
+            return SaveStatus.IDLE
+        if not future.done():
+            return SaveStatus.SAVING
+        if future.exception() is not None:
+            return SaveStatus.FAILED
+        return SaveStatus.DONE
+
+    def is_saving(self, slot: Optional[int] = None) -> bool:
+        """
+        Checks whether a save is being written.
+
+        Parameters:
+            slot: The save slot, or ``None`` for any slot.
+
+        Returns:
+            Whether a save is pending.
+        """
+        slots = self._jobs if slot is None else [slot]
+        return any(
+            self.get_status(slot) == SaveStatus.SAVING for slot in slots
+        )
+
+    def wait(self, slot: Optional[int] = None) -> None:
+        """
+        Blocks until the pending saves are written.
+
+        Parameters:
+            slot: The save slot to wait for, or ``None`` for all the slots.
+        """
+        if slot is None:
+            wait(list(self._jobs.values()))
+        elif slot in self._jobs:
+            wait([self._jobs[slot]])
+
+    def update(self) -> None:
+        """Calls the callbacks of the saves written since the last call."""
+        if not self._callbacks:
+            return
+        pending = []
+        for future, callback in self._callbacks:
+            if future.done():
+                callback(future.exception())
+            else:
+                pending.append((future, callback))
+        self._callbacks = pending
+
+    def shutdown(self) -> None:
+        """Waits for the pending saves and stops the worker thread."""
+        if self._executor is not None:
+            logger.debug("Waiting for pending saves...")
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.update()
+
+
+# Global worker writing the saves
+saver = SaveWorker()
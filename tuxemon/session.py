@@ -58,6 +58,9 @@ class Session:
     def has_player(self) -> bool:
         return self._player is not None
 
+    def has_client(self) -> bool:
+        return self._client is not None
+
     def reset(
         self,
         reset_client: bool = True,
@@ -90,6 +90,8 @@ class ShapeHandler:
     Handles the shape-related attributes and calculations.
     """
 
+    __slots__ = ("_shape",)
+
     def __init__(self, shape_slug: Optional[str] = None):
         self._shape = Shape(shape_slug)
 
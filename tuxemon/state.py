@@ -35,6 +35,9 @@ logger = logging.getLogger(__name__)
 
 StateType = TypeVar("StateType", bound="State")
 
+# module of a state package listing where each of its states is defined
+MANIFEST_MODULE = "manifest"
+
 
 class State(ABC):
     """This is a prototype class for States.
@@ -53,6 +56,7 @@ class State(ABC):
     rect = Rect((0, 0), prepare.SCREEN_SIZE)
     transparent = False  # ignore all background/borders
     force_draw = False  # draw even if completely under another state
+    cache_backdrop = False  # draw only when changed under other states
 
     def __init__(self) -> None:
         """
@@ -78,6 +82,9 @@ class State(ABC):
 
         self._scheduled_task: Optional[Task] = None
 
+        # changed to draw the state again while cached as a backdrop
+        self.backdrop_revision = 0
+
     @property
     def name(self) -> str:
         return self.__class__.__name__
@@ -258,6 +265,40 @@ class State(ABC):
         """
         self.trigger_hook("state_draw", surface)
 
+    def get_dirty_rects(self) -> Optional[list[Rect]]:
+        """
+        Returns the areas of the screen changed since the state was drawn.
+
+        Only used when drawing with dirty rectangles. The default reports the
+        whole state as changed every frame; states that can tell when their
+        image changes should override it.
+
+        Returns:
+            The changed areas, or ``None`` if the whole state must be drawn.
+        """
+        return None
+
+    def get_backdrop_key(self) -> Optional[Any]:
+        """
+        Returns what the image of the state depends on.
+
+        Only used for states with ``cache_backdrop`` set. Such a state is
+        drawn once into a backdrop when other states are pushed over it, and
+        the backdrop is reused as long as the key does not change. Covered
+        states are still updated, so the key must change with anything
+        drawn by the state, e.g. the position of its sprites.
+
+        Returns:
+            The key, or ``None`` if the state must be drawn every frame.
+        """
+        if self.animations:
+            return None
+        return self.backdrop_revision
+
+    def invalidate_backdrop(self) -> None:
+        """Draws the state again if it is cached as a backdrop."""
+        self.backdrop_revision += 1
+
     def resume(self) -> None:
         """
         Called before update when state is newly in focus.
@@ -390,6 +431,9 @@ class StateManager:
         self._state_queue: list[tuple[str, Mapping[str, Any]]] = []
         self._state_stack: list[State] = []
         self._resume_set: set[State] = set()
+        self._manifest: Optional[dict[str, str]] = None
+        self._discovered = False
+        self._warm_up: Optional[list[str]] = None
         if on_state_change:
             self.register_global_hook("on_state_change", on_state_change)
         self.register_global_hook("pre_state_update", lambda time_delta: None)
@@ -413,28 +457,141 @@ class StateManager:
     def is_hook_registered(self, hook_name: str) -> bool:
         return self.hook_manager.is_hook_registered(hook_name)
 
-    def auto_state_discovery(self) -> None:
+    def auto_state_discovery(self, lazy: bool = False) -> None:
         """
         Scan a folder, load states found in it, and register them.
 
+        When ``lazy`` is set and the package has a manifest, the states are
+        not loaded here: each state is imported from the module named in
+        the manifest when it is first used.
+
         TODO: this functionality duplicates the plugin code.
+
+        Parameters:
+            lazy: Whether to import the states when they are first used.
         """
+        if lazy:
+            self._manifest = self.load_manifest()
+            if self._manifest is not None:
+                logger.debug(
+                    f"Found {len(self._manifest)} game states in the manifest"
+                )
+                return
+
+        self._discovered = True
+        for folder in self._get_state_folders():
+            for state in self.collect_states_from_path(folder):
+                self.register_state(state)
+
+    def _get_state_folders(self) -> list[Path]:
         state_folder = paths.LIBDIR / Path(*self.package.split(".")[1:])
         exclude_endings = {".py", ".pyc", ".pyo"}
         exclude_names = {"__pycache__"}
 
         logger.debug(f"Loading game states from {state_folder}")
 
-        for folder in state_folder.iterdir():
-            if (
-                folder.is_dir()
-                and not any(
-                    folder.name.endswith(end) for end in exclude_endings
-                )
-                and folder.name not in exclude_names
-            ):
-                for state in self.collect_states_from_path(folder):
-                    self.register_state(state)
+        return sorted(
+            folder
+            for folder in state_folder.iterdir()
+            if folder.is_dir()
+            and not any(folder.name.endswith(end) for end in exclude_endings)
+            and folder.name not in exclude_names
+        )
+
+    def load_manifest(self) -> Optional[dict[str, str]]:
+        """
+        Loads the manifest of the states of the package.
+
+        Returns:
+            The module of each state, by state name, or ``None`` if the
+            package has no manifest.
+        """
+        try:
+            module = import_module(f"{self.package}.{MANIFEST_MODULE}")
+        except ImportError:
+            return None
+        return dict(module.STATES)
+
+    def build_manifest(self) -> dict[str, str]:
+        """
+        Imports all the states of the package and returns where they are.
+
+        Returns:
+            The module of each state, by state name.
+
+        Raises:
+            ValueError: If two different states have the same name.
+        """
+        states: dict[str, type[State]] = {}
+        for folder in self._get_state_folders():
+            for state in self.collect_states_from_path(folder):
+                found = states.setdefault(state.__name__, state)
+                if found is not state:
+                    raise ValueError(
+                        f"States {found.__module__}.{found.__name__} and "
+                        f"{state.__module__}.{state.__name__} have the "
+                        "same name."
+                    )
+        return {name: states[name].__module__ for name in sorted(states)}
+
+    def warm_up(self) -> None:
+        """
+        Starts importing the states of the manifest ahead of their use.
+
+        The modules are imported by ``warm_up_step``, on the main thread:
+        the states import each other, and importing them on two threads at
+        once can hand one of them a partly initialised module. The states
+        are still registered when they are first used, but their modules
+        are already imported by then.
+        """
+        if not self._manifest or self._warm_up is not None:
+            return
+        self._warm_up = sorted(set(self._manifest.values()) - set(sys.modules))
+
+    def warm_up_step(self, time_left: Callable[[], float]) -> None:
+        """
+        Imports states to warm up while the frame has time left.
+
+        At least one module is imported when there is time left, so that
+        the warm up ends even if the imports take longer than a frame.
+
+        Parameters:
+            time_left: Returns the time left before the next frame.
+        """
+        while self._warm_up and time_left() > 0:
+            module_name = self._warm_up.pop(0)
+            try:
+                import_module(module_name)
+            except Exception as e:
+                logger.warning(f"Could not import {module_name}: {e}")
+
+    def _get_state_class(self, state_name: str) -> type[State]:
+        """
+        Returns a state class, importing it if it is not registered yet.
+
+        A state missing from the manifest makes all the states be loaded,
+        as the manifest may be out of date.
+        """
+        if not self.state_repository.has_state(state_name):
+            state = self._import_state(state_name)
+            if state is not None:
+                self.register_state(state)
+            elif self._manifest is not None and not self._discovered:
+                logger.debug(f"Cannot find {state_name}, loading all states")
+                self.auto_state_discovery()
+        return self.state_repository.get_state(state_name)
+
+    def _import_state(self, state_name: str) -> Optional[type[State]]:
+        module_name = (
+            self._manifest.get(state_name) if self._manifest else None
+        )
+        if module_name is None:
+            return None
+        state = getattr(import_module(module_name), state_name, None)
+        if inspect.isclass(state) and issubclass(state, State):
+            return state
+        logger.warning(f"The state manifest is out of date for {state_name}")
+        return None
 
     def register_state(self, state: type[State]) -> None:
         """Add a state class."""
@@ -445,7 +602,7 @@ class StateManager:
     def _instance(self, state_name: str, **kwargs: Any) -> State:
         """Create new instance of State."""
         try:
-            state_cls = self.state_repository.get_state(state_name)
+            state_cls = self._get_state_class(state_name)
         except KeyError:
             raise RuntimeError(f"Cannot find state: {state_name}")
 
@@ -866,6 +1023,10 @@ class StateRepository:
                 )
         self._state_dict[name] = state
 
+    def has_state(self, name: str) -> bool:
+        """Whether a state is registered."""
+        return name in self._state_dict
+
     def get_state(self, name: str) -> type[State]:
         """Retrieve a state by its name."""
         try:
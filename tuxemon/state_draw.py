@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional
 
 import pygame
 from pygame.font import Font, get_default_font
+from pygame.rect import Rect
 from pygame.surface import Surface
 
 from tuxemon import prepare
@@ -16,6 +17,7 @@ from tuxemon.ui.draw import TextRenderer
 if TYPE_CHECKING:
     from tuxemon.config import TuxemonConfig
     from tuxemon.event import MapCondition
+    from tuxemon.frame_scheduler import FrameTimings
     from tuxemon.state import State, StateManager
 
 
@@ -45,6 +47,8 @@ class Renderer:
         self.vsync = config.vsync
         self.frames = 0
         self.fps_timer = 0.0
+        self.update_timer = 0.0
+        self.draw_timer = 0.0
 
     def draw(
         self,
@@ -53,7 +57,7 @@ class Renderer:
         collision_map: bool,
         debug_drawer: EventDebugDrawer,
         partial_events: list[Sequence[tuple[bool, MapCondition]]],
-    ) -> None:
+    ) -> Optional[list[Rect]]:
         """
         Renders the current frame and handles optional debug overlays and
         frame saving.
@@ -70,20 +74,31 @@ class Renderer:
             debug_drawer: Handles rendering debug overlays.
             partial_events: A collection of partial events used for debugging
                 purposes.
+
+        Returns:
+            The areas of the screen that changed, or ``None`` if the whole
+            screen was drawn.
         """
         # Draw the current game state
-        self.state_drawer.draw()
+        dirty = self.state_drawer.draw()
 
         # Optional: Draw debug information if enabled
         if collision_map:
             debug_drawer.draw_event_debug(partial_events)
+            # the overlay is drawn over the whole screen
+            self.state_drawer.invalidate()
+            dirty = None
 
         # Optional: Save to disk if enabled
         if save_to_disk:
             filename = f"snapshot{frame_number:05d}.tga"
             pygame.image.save(self.screen, filename)
 
-    def update_fps(self, clock_tick: float) -> None:
+        return dirty
+
+    def update_fps(
+        self, clock_tick: float, timings: Optional[FrameTimings] = None
+    ) -> None:
         """
         Updates and displays the frames per second (FPS) on the window caption.
 
@@ -92,16 +107,29 @@ class Renderer:
 
         Parameters:
             clock_tick: The time elapsed (in seconds) since the last update.
+            timings: The timings of the last frame, to also display the
+                average time spent updating and drawing.
         """
         self.fps_timer += clock_tick
         self.frames += 1
+        if timings is not None:
+            self.update_timer += timings.update
+            self.draw_timer += timings.draw
         if self.fps_timer >= 1.0:
             fps = self.frames / self.fps_timer
             vsync_status = "VSync ON" if self.vsync else "VSync OFF"
             with_fps = f"{self.caption} - {fps:.2f} FPS - {vsync_status}"
+            if timings is not None:
+                update_ms = self.update_timer / self.frames * 1000
+                draw_ms = self.draw_timer / self.frames * 1000
+                with_fps += (
+                    f" - update {update_ms:.1f} ms - draw {draw_ms:.1f} ms"
+                )
             pygame.display.set_caption(with_fps)
             self.fps_timer = 0.0
             self.frames = 0
+            self.update_timer = 0.0
+            self.draw_timer = 0.0
 
 
 class StateDrawer:
@@ -128,9 +156,37 @@ class StateDrawer:
         self.surface = surface
         self.state_manager = state_manager
         self.config = config
+        self.dirty_rects = config.dirty_rects
+        # states drawn on the last frame, from top to bottom
+        self._drawn_states: Optional[list[State]] = None
+        # image of the covered states under the states drawn each frame
+        self._backdrop: Optional[Surface] = None
+        self._backdrop_key: Optional[Any] = None
+        # key of the covered states on the last frame, and whether it had
+        # changed since the frame before
+        self._last_backdrop_key: Optional[Any] = None
+        self._backdrop_unstable = False
+
+    def invalidate(self) -> None:
+        """Draws the whole surface again on the next frame."""
+        self._drawn_states = None
+        self._backdrop_key = None
+
+    def draw(self) -> Optional[list[Rect]]:
+        """
+        Draw all active states to the surface.
+
+        Covered states which allow it are drawn into a backdrop, which is
+        reused while they look the same and the states over them are drawn
+        each frame.
+
+        In dirty rectangle mode, only the area changed since the last frame
+        is drawn again, by asking each state what changed.
 
-    def draw(self) -> None:
-        """Draw all active states to the surface."""
+        Returns:
+            The areas of the surface that changed, or ``None`` if the whole
+            surface was drawn.
+        """
         to_draw: list[State] = []
         full_screen = self.surface.get_rect()
 
@@ -145,9 +201,92 @@ class StateDrawer:
             ):
                 break
 
+        index, key = self._find_backdrop(to_draw)
+        unstable = key != self._last_backdrop_key
+        if (
+            index is not None
+            and key != self._backdrop_key
+            and unstable
+            and self._backdrop_unstable
+        ):
+            # the covered states change every frame (e.g. an NPC walks),
+            # drawing them into a backdrop would only add a copy
+            index = None
+        self._last_backdrop_key = key
+        self._backdrop_unstable = unstable
+        if index is None:
+            self._backdrop = None
+            self._backdrop_key = None
+        elif key != self._backdrop_key:
+            self._backdrop = None
+            self._draw_states(to_draw[index:])
+            self._backdrop = self.surface.copy()
+            self._backdrop_key = key
+            self._draw_states(to_draw[:index])
+            self._drawn_states = to_draw
+            return None
+
+        # the backdrop does not change, only the states over it do
+        to_update = to_draw if index is None else to_draw[:index]
+        if self.dirty_rects and to_draw == self._drawn_states:
+            dirty = self._collect_dirty_rects(to_update)
+            if dirty is not None:
+                if dirty:
+                    area = dirty[0].unionall(dirty[1:]).clip(full_screen)
+                    self._draw_states(to_update, area)
+                    return [area]
+                return []
+
+        self._draw_states(to_update)
+        self._drawn_states = to_draw
+        return None
+
+    def _find_backdrop(
+        self, states: list[State]
+    ) -> tuple[Optional[int], Optional[Any]]:
+        """
+        Finds the covered states which can be drawn into a backdrop.
+
+        Parameters:
+            states: The states to draw, from top to bottom.
+
+        Returns:
+            The index of the first state of the backdrop and what the
+            backdrop depends on, or ``None`` if there is no backdrop.
+        """
+        # the top state gets the input, the states under it are covered
+        for index, state in enumerate(states[1:], 1):
+            if state.cache_backdrop:
+                covered = states[index:]
+                keys = [state.get_backdrop_key() for state in covered]
+                if any(key is None for key in keys):
+                    return None, None
+                return index, tuple(zip(covered, keys))
+        return None, None
+
+    def _collect_dirty_rects(
+        self, states: list[State]
+    ) -> Optional[list[Rect]]:
+        dirty: list[Rect] = []
+        for state in states:
+            rects = state.get_dirty_rects()
+            if rects is None:
+                return None
+            dirty.extend(rects)
+        return dirty
+
+    def _draw_states(
+        self, states: list[State], area: Optional[Rect] = None
+    ) -> None:
         # Draw states from bottom to top for proper layering.
-        for state in reversed(to_draw):
-            state.draw(self.surface)
+        self.surface.set_clip(area)
+        try:
+            if self._backdrop is not None:
+                self.surface.blit(self._backdrop, (0, 0))
+            for state in reversed(states):
+                state.draw(self.surface)
+        finally:
+            self.surface.set_clip(None)
 
 
 class EventDebugDrawer:
@@ -0,0 +1,450 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Headless battle engine.
+
+The engine plays a whole battle with the rules of the combat state, but
+without states, sprites, menus or timers: every player is controlled by
+the AI and every action is resolved as soon as it leaves the queue.
+Effects which need a map or a client (e.g. money, photogenesis) can't
+be used in it.
+
+It is meant to simulate many battles, e.g. to balance monsters and
+techniques, see tuxemon.battle_simulator.
+"""
+from __future__ import annotations
+
+import logging
+import random
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+
+from tuxemon.ai import AIManager
+from tuxemon.combat import get_awake_monsters
+from tuxemon.db import EffectPhase
+from tuxemon.item.item import Item
+from tuxemon.monster import Monster
+from tuxemon.npc import NPC
+from tuxemon.sprite import Sprite
+from tuxemon.status.status import Status
+from tuxemon.technique.technique import Technique
+from tuxemon.tools import assert_never
+from tuxemon.ui.combat_monsters import FieldMonsters, MonsterSpriteMap
+from tuxemon.ui.combat_swap import SwapTracker
+
+from .combat_classes import ActionQueue, DamageTracker, MenuVisibility
+from .combat_rules import CombatPhase, CombatRules
+from .reward_system import RewardSystem
+
+if TYPE_CHECKING:
+    from tuxemon.session import Session
+
+logger = logging.getLogger(__name__)
+
+
+class BattleOutcome(Enum):
+    WON = "won"
+    DRAW = "draw"
+    RAN_AWAY = "ran_away"
+    TURN_LIMIT = "turn_limit"
+
+
+@dataclass
+class BattleResult:
+    outcome: BattleOutcome
+    winner: Optional[int]
+    turns: int
+    survivors: list[int] = field(default_factory=list)
+
+
+class BattleEngine(CombatRules):
+    """
+    Plays a battle between two AI controlled teams to its end.
+
+    The phases are the same as in the combat state and follow each other
+    without waiting for animations. Nothing is drawn; the monsters in play
+    get an empty sprite, so that effects which hide a monster (e.g.
+    disappear) still work.
+
+    All the random draws go through the random module, seed it to replay
+    a battle.
+
+    Parameters:
+        session: Session of the battle, it needs neither client nor world.
+        teams: The two characters fighting.
+        combat_type: Whether it's a trainer battle or a wild encounter.
+        battle_mode: Whether one or two monsters per side are in play.
+        riddles: Whether the monsters answer riddles, as in the game, or
+            choose one of their techniques.
+        max_turns: Turns after which the battle is stopped.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        teams: Sequence[NPC],
+        combat_type: Literal["monster", "trainer"] = "trainer",
+        battle_mode: Literal["single", "double"] = "single",
+        riddles: bool = True,
+        max_turns: int = 100,
+    ) -> None:
+        if len(teams) != 2:
+            raise ValueError(
+                f"A battle needs two teams, {len(teams)} were given."
+            )
+        self.session = session
+        self.players = list(teams)
+        self.is_trainer_battle = combat_type == "trainer"
+        self.is_double = battle_mode == "double"
+        self.riddles = riddles
+        self.max_turns = max_turns
+        self.phase: Optional[CombatPhase] = None
+        self.field_monsters = FieldMonsters()
+        self.sprite_map = MonsterSpriteMap()
+        self.swap_tracker = SwapTracker()
+        self._action_queue = ActionQueue()
+        self._damage_map = DamageTracker()
+        self._menu_visibility = MenuVisibility()
+        self._turn: int = 0
+        self._prize: int = 0
+        self._run: bool = False
+        self._captured_mon: Optional[Monster] = None
+        self._new_tuxepedia: bool = False
+        self._random_tech_hit: dict[Monster, float] = {}
+        self._combat_variables: dict[str, Any] = {}
+        self._result: Optional[BattleResult] = None
+        self.ai_manager = AIManager(self.session, self)
+
+    def run(self) -> BattleResult:
+        """
+        Play the battle to its end.
+
+        Returns:
+            The result of the battle.
+        """
+        self.phase = CombatPhase.READY
+        while self.phase is not None:
+            self.step()
+        assert self._result
+        return self._result
+
+    def step(self) -> None:
+        """Move the battle on, as one update of the combat state does."""
+        new_phase = self.determine_phase(self.phase)
+        if new_phase:
+            self.phase = new_phase
+            self.transition_phase(new_phase)
+        elif self.phase in (CombatPhase.HOUSEKEEPING, CombatPhase.DECISION):
+            # nothing is waited for, so these phases can't last
+            raise RuntimeError(f"Battle stuck in phase {self.phase.value}")
+        self.update_phase()
+
+    def determine_phase(
+        self, phase: Optional[CombatPhase]
+    ) -> Optional[CombatPhase]:
+        """
+        Determine the next phase, stopping the battle after the last turn.
+
+        Parameters:
+            phase: Current phase of the battle.
+
+        Returns:
+            Next phase of the battle.
+        """
+        if (
+            phase == CombatPhase.RESOLVE_MATCH
+            and len(self.remaining_players) > 1
+            and self._turn >= self.max_turns
+        ):
+            return CombatPhase.DRAW_MATCH
+        return super().determine_phase(phase)
+
+    def transition_phase(self, phase: CombatPhase) -> None:
+        """
+        Change from one phase to another.
+
+        Parameters:
+            phase: Phase to transition to.
+        """
+        if (
+            phase == CombatPhase.BEGIN
+            or phase == CombatPhase.READY
+            or phase == CombatPhase.PRE_ACTION
+            or phase == CombatPhase.RESOLVE_MATCH
+        ):
+            pass
+
+        elif phase == CombatPhase.HOUSEKEEPING:
+            self._turn += 1
+            self.fill_battlefield_positions()
+
+        elif phase == CombatPhase.DECISION:
+            self.initialize_hit_chances()
+            self.process_player_decisions()
+
+        elif phase == CombatPhase.ACTION:
+            self._action_queue.sort()
+
+        elif phase == CombatPhase.POST_ACTION:
+            if self._action_queue.pending:
+                self._action_queue.autoclean_pending()
+                self._action_queue.from_pending_to_action(self._turn)
+            self.apply_statuses()
+
+        elif phase == CombatPhase.RAN_AWAY:
+            self.set_result(BattleOutcome.RAN_AWAY)
+
+        elif phase == CombatPhase.DRAW_MATCH:
+            if self.remaining_players:
+                self.set_result(BattleOutcome.TURN_LIMIT)
+            else:
+                self.set_result(BattleOutcome.DRAW)
+
+        elif phase == CombatPhase.HAS_WINNER:
+            self.set_result(BattleOutcome.WON)
+
+        elif phase == CombatPhase.END_COMBAT:
+            self.end_combat()
+
+        else:
+            assert_never(phase)
+
+    def update_phase(self) -> None:
+        """Resolve the next queued action, if the phase resolves actions."""
+        if self.phase in (CombatPhase.ACTION, CombatPhase.POST_ACTION):
+            self.handle_action_queue()
+
+    def set_result(self, outcome: BattleOutcome) -> None:
+        """
+        Record the result of the battle.
+
+        Parameters:
+            outcome: How the battle ended.
+        """
+        winner = None
+        if outcome == BattleOutcome.WON:
+            winner = self.players.index(self.remaining_players[0])
+        self._result = BattleResult(
+            outcome=outcome,
+            winner=winner,
+            turns=self._turn,
+            survivors=[
+                len([m for m in player.monsters if not m.is_fainted])
+                for player in self.players
+            ],
+        )
+
+    def handle_action_queue(self) -> None:
+        """Take one action from the queue and do it."""
+        if not self._action_queue.is_empty():
+            action = self._action_queue.pop()
+            self.perform_action(action.user, action.method, action.target)
+            self.check_party_hp()
+            self.remove_fainted_monsters()
+
+    def fill_battlefield_positions(self) -> None:
+        """Send out monsters until the battlefield positions are filled."""
+        for player in self.active_players:
+            positions_available = self.get_available_positions(player)
+            if positions_available:
+                monsters = self.field_monsters.get_monsters(player)
+                available = get_awake_monsters(player, monsters, self._turn)
+                for _ in range(positions_available):
+                    self.add_monster_into_play(player, next(available))
+
+    def add_monster_into_play(
+        self,
+        player: NPC,
+        monster: Monster,
+        removed: Optional[Monster] = None,
+    ) -> None:
+        """
+        Add a monster to the battleground.
+
+        Parameters:
+            player: Player who adds the monster.
+            monster: Added monster.
+            removed: Monster that was previously in play, if any.
+        """
+        self.field_monsters.add_monster(player, monster)
+        self.sprite_map.add_sprite(monster, Sprite())
+
+        # Remove "bond" status from all active monsters
+        for mon in self.active_monsters:
+            mon.status.remove_bonded_statuses()
+
+        # Handle new entry and removed monster's status effects
+        phase = EffectPhase.SWAP_MONSTER
+        status = monster.status.get_current_status()
+        if status:
+            status.execute_status_action(self.session, self, monster, phase)
+        if removed is not None:
+            r_status = removed.status.get_current_status()
+            if r_status:
+                r_status.execute_status_action(
+                    self.session, self, removed, phase
+                )
+
+    def process_player_decisions(self) -> None:
+        """Let the AI choose an action for every monster in play."""
+        for player in list(self.active_players):
+            for monster in self.field_monsters.get_monsters(player):
+                monster.moves.recharge_moves()
+                self.ai_manager.process_ai_turn(monster, player, self.riddles)
+
+    def perform_action(
+        self,
+        user: Union[Monster, NPC, None],
+        method: Union[Technique, Item, Status, None],
+        target: Monster,
+    ) -> None:
+        """
+        Perform the action.
+
+        Parameters:
+            user: Monster or NPC that does the action.
+            method: Technique or item or status used.
+            target: Monster that receives the action.
+        """
+        if isinstance(method, Technique) and isinstance(user, Monster):
+            self._handle_monster_technique(user, method, target)
+        if isinstance(method, Item) and isinstance(user, NPC):
+            self._handle_npc_item(user, method, target)
+        if isinstance(method, Status):
+            self._handle_status(method, target)
+
+    def _handle_monster_technique(
+        self, user: Monster, method: Technique, target: Monster
+    ) -> None:
+        method.advance_round()
+        result_tech = method.execute_tech_action(
+            self.session, self, user, target
+        )
+        status = user.status.get_current_status()
+        if status:
+            result_status = status.execute_status_action(
+                self.session, self, user, EffectPhase.PERFORM_TECH
+            )
+            if result_status.statuses:
+                status = random.choice(result_status.statuses)
+                user.status.apply_status(self.session, status)
+        if result_tech.should_tackle:
+            self.enqueue_damage(user, target, result_tech.damage)
+
+    def _handle_npc_item(self, user: NPC, item: Item, target: Monster) -> None:
+        result_item = item.execute_item_action(
+            self.session, self, user, target
+        )
+        status = target.status.get_current_status()
+        if result_item.success and status:
+            status.execute_status_action(
+                self.session, self, target, EffectPhase.PERFORM_ITEM
+            )
+
+    def _handle_status(self, status: Status, target: Monster) -> None:
+        status.execute_status_action(
+            self.session, self, target, EffectPhase.PERFORM_STATUS
+        )
+        status.advance_round()
+
+    def check_party_hp(self) -> None:
+        """Apply status effects, then faint the monsters without HP."""
+        for monster_party in self.field_monsters.get_all_monsters().values():
+            for monster in monster_party:
+                status = monster.status.get_current_status()
+                if status:
+                    status.execute_status_action(
+                        self.session, self, monster, EffectPhase.CHECK_PARTY_HP
+                    )
+                if monster.is_fainted:
+                    self.handle_monster_defeat(monster)
+
+    def handle_monster_defeat(self, monster: Monster) -> None:
+        """
+        Faint the monster, dropping its actions and rewarding the winners.
+
+        Parameters:
+            monster: Monster that was defeated.
+        """
+        self.remove_monster_actions_from_queue(monster)
+        monster.current_hp = 0
+        reward_system = RewardSystem(self._damage_map, self.is_trainer_battle)
+        self._prize += reward_system.award_rewards(monster).prize
+        self._damage_map.remove_monster(monster)
+
+    def remove_fainted_monsters(self) -> None:
+        """Take the fainted monsters off the battlefield."""
+        for monster in list(self.active_monsters):
+            if monster.is_fainted:
+                self.leave_field(monster)
+
+    def remove_monster_from_play(self, monster: Monster) -> None:
+        """
+        Remove monster from play without fainting it.
+
+        Parameters:
+            monster: Monster to remove.
+        """
+        self.swap_tracker.clear()
+        self.remove_monster_actions_from_queue(monster)
+        self.leave_field(monster)
+
+    def remove_monster_actions_from_queue(self, monster: Monster) -> None:
+        """
+        Remove all queued actions for a particular monster.
+
+        Parameters:
+            monster: Monster whose actions will be removed.
+        """
+        action_queue = self._action_queue.queue
+        action_queue[:] = [
+            action
+            for action in action_queue
+            if action.user is not monster and action.target is not monster
+        ]
+        self.ai_manager.remove_ai(monster)
+
+    def leave_field(self, monster: Monster) -> None:
+        """
+        Take the monster and its sprite off the battlefield.
+
+        Parameters:
+            monster: Monster leaving the battlefield.
+        """
+        self.sprite_map.remove_sprite(monster)
+        for monsters in self.field_monsters.get_all_monsters().values():
+            if monster in monsters:
+                monsters.remove(monster)
+
+    def task(self, task: Callable[[], Any], **kwargs: Any) -> None:
+        """Run at once what the combat state would run later."""
+        task()
+
+    def update_icons_for_monsters(self) -> None:
+        """There are no status icons to update."""
+
+    def animate_update_party_hud(self) -> None:
+        """There is no party HUD to update."""
+
+    def clean_combat(self) -> None:
+        """Reset the monsters and the battle queues."""
+        for player in self.players:
+            for mon in player.monsters:
+                mon.set_stats()
+                mon.end_combat(self.session)
+                mon.types.reset_to_default()
+                mon.moves.set_stats()
+
+        self._action_queue.clear_queue()
+        self._action_queue.clear_history()
+        self._action_queue.clear_pending()
+        self._damage_map.clear_damage()
+        self._combat_variables = {}
+        self.ai_manager.clear_ai()
+
+    def end_combat(self) -> None:
+        """End the battle."""
+        self.clean_combat()
+        self.phase = None
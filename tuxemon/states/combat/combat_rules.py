@@ -0,0 +1,363 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Rules of the combat shared by the combat state and the battle engine.
+
+Nothing in here draws, animates or waits: the methods only look at and
+change the battlefield, so that the same rules can drive the combat
+state on screen and the headless battle engine.
+"""
+from __future__ import annotations
+
+import logging
+import random
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Optional, Union
+
+from tuxemon.combat import alive_party, defeated
+from tuxemon.db import TargetType
+from tuxemon.item.item import Item
+from tuxemon.monster import Monster
+from tuxemon.npc import NPC
+from tuxemon.status.status import Status
+from tuxemon.technique.technique import Technique
+from tuxemon.tools import assert_never
+
+from .combat_classes import ActionQueue, DamageTracker, EnqueuedAction
+
+if TYPE_CHECKING:
+    from tuxemon.session import Session
+    from tuxemon.ui.combat_monsters import FieldMonsters
+
+logger = logging.getLogger(__name__)
+
+
+class CombatPhase(Enum):
+    BEGIN = "begin"
+    READY = "ready"
+    HOUSEKEEPING = "housekeeping"
+    DECISION = "decision"
+    PRE_ACTION = "pre_action"
+    ACTION = "action"
+    POST_ACTION = "post_action"
+    RESOLVE_MATCH = "resolve_match"
+    RAN_AWAY = "ran_away"
+    DRAW_MATCH = "draw_match"
+    HAS_WINNER = "has_winner"
+    END_COMBAT = "end_combat"
+
+
+class CombatRules:
+    """
+    Mixin with the rules of the combat.
+
+    The class using it provides the battlefield: the players, the monsters
+    in play, the action queue and the damage map.
+    """
+
+    session: Session
+    players: list[NPC]
+    is_double: bool
+    is_trainer_battle: bool
+    field_monsters: FieldMonsters
+    _action_queue: ActionQueue
+    _damage_map: DamageTracker
+    _turn: int
+    _run: bool
+    _random_tech_hit: dict[Monster, float]
+
+    def determine_phase(
+        self, phase: Optional[CombatPhase]
+    ) -> Optional[CombatPhase]:
+        """
+        Determine the next phase and set it.
+
+        Part of state machine
+        Only test and set new phase.
+        * Do not update phase actions
+        * Try not to modify any values
+        * Return a phase name and phase will change
+        * Return None and phase will not change
+
+        Parameters:
+            phase: Current phase of the combat. Could be ``None`` if called
+                before the combat had time to start.
+
+        Returns:
+            Next phase of the combat.
+        """
+        if phase is None or phase == CombatPhase.BEGIN:
+            return None
+
+        elif phase == CombatPhase.READY:
+            return CombatPhase.HOUSEKEEPING
+
+        elif phase == CombatPhase.HOUSEKEEPING:
+            # this will wait for players to fill battleground positions
+            for player in self.active_players:
+                positions_available = self.get_available_positions(player)
+                if positions_available:
+                    return None
+            return CombatPhase.DECISION
+
+        elif phase == CombatPhase.DECISION:
+            # TODO: only works for single player and if player runs
+            if len(self.remaining_players) == 1:
+                return CombatPhase.RAN_AWAY
+
+            # assume each monster executes one action
+            # if number of actions == monsters, then all monsters are ready
+            elif len(self._action_queue.queue) == len(self.active_monsters):
+                return CombatPhase.PRE_ACTION
+
+            return None
+
+        elif phase == CombatPhase.PRE_ACTION:
+            return CombatPhase.ACTION
+
+        elif phase == CombatPhase.ACTION:
+            if self._action_queue.is_empty():
+                return CombatPhase.POST_ACTION
+
+            return None
+
+        elif phase == CombatPhase.POST_ACTION:
+            if self._action_queue.is_empty():
+                return CombatPhase.RESOLVE_MATCH
+
+            return None
+
+        elif phase == CombatPhase.RESOLVE_MATCH:
+            remaining = len(self.remaining_players)
+
+            if remaining == 0:
+                return CombatPhase.DRAW_MATCH
+            elif remaining == 1:
+                if self._run:
+                    return CombatPhase.RAN_AWAY
+                else:
+                    return CombatPhase.HAS_WINNER
+            else:
+                return CombatPhase.HOUSEKEEPING
+
+        elif phase == CombatPhase.RAN_AWAY:
+            return CombatPhase.END_COMBAT
+
+        elif phase == CombatPhase.DRAW_MATCH:
+            return CombatPhase.END_COMBAT
+
+        elif phase == CombatPhase.HAS_WINNER:
+            return CombatPhase.END_COMBAT
+
+        elif phase == CombatPhase.END_COMBAT:
+            return None
+
+        else:
+            assert_never(phase)
+
+    def get_max_positions(self, player: NPC) -> int:
+        """
+        Calculates the maximum number of positions for a player based on
+        their party size and battle mode.
+        """
+        if len(alive_party(player)) == 1:
+            return 1
+        return 2 if self.is_double else 1
+
+    def get_available_positions(self, player: NPC) -> int:
+        """
+        Returns the number of available positions for a player on the battlefield.
+        """
+        max_positions = self.get_max_positions(player)
+        on_the_field = len(self.field_monsters.get_monsters(player))
+        return max_positions - on_the_field
+
+    def apply_statuses(self) -> None:
+        """
+        Applies and updates status effects for all active monsters.
+        """
+        for monster in self.active_monsters:
+            for status in monster.status.get_statuses():
+                if len(self.remaining_players) > 1:
+                    if status.validate_monster(self.session, monster):
+                        status.set_combat_state(self)
+                        status.nr_turn += 1
+                        self.enqueue_action(None, status, monster)
+            # avoid multiple effect status
+            monster.set_stats()
+
+    def enqueue_damage(
+        self, attacker: Monster, defender: Monster, damage: int
+    ) -> None:
+        """
+        Add damages to damage map.
+
+        Parameters:
+            attacker: Monster.
+            defender: Monster.
+            damage: Quantity of damage.
+        """
+        self._damage_map.log_damage(attacker, defender, damage, self._turn)
+
+    def enqueue_action(
+        self,
+        user: Union[NPC, Monster, None],
+        technique: Union[Item, Technique, Status, None],
+        target: Monster,
+    ) -> None:
+        """
+        Add some technique or status to the action queue.
+
+        Parameters:
+            user: The user of the technique.
+            technique: The technique used.
+            target: The target of the action.
+        """
+        action = EnqueuedAction(user, technique, target)
+        self._action_queue.enqueue(action, self._turn)
+
+    def initialize_hit_chances(self) -> None:
+        """Initializes random hit chance values for all active monsters."""
+        for monster in self.active_monsters:
+            self.set_tech_hit(monster)
+
+    def set_tech_hit(
+        self, monster: Monster, value: Optional[float] = None
+    ) -> None:
+        """Assigns a random hit chance to the given monster."""
+        if value is None:
+            value = random.random()
+        self._random_tech_hit[monster] = value
+
+    def get_tech_hit(self, monster: Monster) -> float:
+        """Retrieves the stored hit chance, defaulting to 0.0 if not found."""
+        return self._random_tech_hit.get(monster, 0.0)
+
+    @property
+    def active_players(self) -> Iterable[NPC]:
+        """All trainers still active in the battle."""
+        for player in self.players:
+            if not defeated(player):
+                yield player
+
+    @property
+    def human_players(self) -> Iterable[NPC]:
+        """Players controlled by humans."""
+        for player in self.players:
+            if player.isplayer:
+                yield player
+
+    @property
+    def ai_players(self) -> Iterable[NPC]:
+        """Players controlled by AI."""
+        yield from set(self.active_players) - set(self.human_players)
+
+    @property
+    def active_monsters(self) -> Sequence[Monster]:
+        """All non-fainted monsters currently in play."""
+        return self.field_monsters.active_monsters
+
+    @property
+    def monsters_in_play_right(self) -> Sequence[Monster]:
+        """Active monsters on the right side of the battlefield."""
+        return self.field_monsters.get_monsters(self.players[0])
+
+    @property
+    def monsters_in_play_left(self) -> Sequence[Monster]:
+        """Active monsters on the left side of the battlefield."""
+        return self.field_monsters.get_monsters(self.players[1])
+
+    @property
+    def all_monsters_right(self) -> Sequence[Monster]:
+        """All non-fainted monsters belonging to the right-side player."""
+        return [m for m in self.players[0].monsters if not m.is_fainted]
+
+    @property
+    def all_monsters_left(self) -> Sequence[Monster]:
+        """All non-fainted monsters belonging to the left-side player."""
+        return [m for m in self.players[1].monsters if not m.is_fainted]
+
+    @property
+    def defeated_players(self) -> Sequence[NPC]:
+        """All trainers who have lost (party fully fainted)."""
+        return [p for p in self.players if defeated(p)]
+
+    @property
+    def remaining_players(self) -> Sequence[NPC]:
+        """Alias for non-defeated players. WIP: subject to future team logic."""
+        return [p for p in self.players if not defeated(p)]
+
+    def get_bench(self, player: NPC) -> Sequence[Monster]:
+        """Returns non-fainted, off-field monsters for the given player."""
+        monsters_in_play = self.field_monsters.get_monsters(player)
+        all_monsters = [m for m in player.monsters if not m.is_fainted]
+        return [m for m in all_monsters if m not in monsters_in_play]
+
+    def get_opponent_monsters(self, monster: Monster) -> Sequence[Monster]:
+        """Returns all active enemy monsters on the opponent's field."""
+        if monster in self.monsters_in_play_right:
+            return self.monsters_in_play_left
+        return self.monsters_in_play_right
+
+    def get_own_monsters(self, monster: Monster) -> Sequence[Monster]:
+        """Returns active allies on the same team."""
+        if monster in self.monsters_in_play_right:
+            return self.monsters_in_play_right
+        return self.monsters_in_play_left
+
+    def get_party(self, monster: Monster) -> Sequence[Monster]:
+        """Returns all non-fainted monsters in the party that owns this monster."""
+        if monster in self.monsters_in_play_right:
+            return self.all_monsters_right
+        return self.all_monsters_left
+
+    def get_targets_from_map(
+        self, target_type: str, user: Monster, target: Monster
+    ) -> list[Monster]:
+        """
+        Get the targets from the target map.
+
+        Parameters:
+            target_type: The type of target (e.g. "own_monster", etc.)
+            user: The Monster object that used the technique.
+            target: The Monster object being targeted by the technique.
+        Returns:
+            A list of Monster objects.
+        """
+        target_map = {
+            "enemy_monster": [target],
+            "enemy_team": self.get_own_monsters(target),
+            "enemy_trainer": self.get_party(target),
+            "own_monster": [user],
+            "own_team": self.get_own_monsters(user),
+            "own_trainer": self.get_party(user),
+        }
+
+        return list(target_map.get(target_type, []))
+
+    def get_targets(
+        self, tech: Technique, user: Monster, target: Monster
+    ) -> list[Monster]:
+        """
+        Get the targets.
+
+        Parameters:
+            tech: The Technique object that is being applied.
+            user: The Monster object that used the technique.
+            target: The Monster object being targeted by the technique.
+
+        Returns:
+            A list of Monster objects.
+        """
+        targets: set[Monster] = set()
+        for target_type in list(TargetType):
+            if tech.target[target_type]:
+                targets.update(
+                    self.get_targets_from_map(target_type, user, target)
+                )
+
+        if not targets:
+            logger.error(f"{tech.name} has all its targets set to False")
+
+        return list(targets)
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Module of each game state, by state name.
+
+Generated by scripts/generate_state_manifest.py, do not edit.
+"""
+from __future__ import annotations
+
+STATES: dict[str, str] = {
+    "BackgroundState": "tuxemon.states.start",
+    "CharacterState": "tuxemon.states.character",
+    "ChoiceItem": "tuxemon.states.choice.choice_item",
+    "ChoiceMonster": "tuxemon.states.choice.choice_monster",
+    "ChoiceNpc": "tuxemon.states.choice.choice_npc",
+    "ChoiceState": "tuxemon.states.choice.choice_state",
+    "ColorState": "tuxemon.states.idle.color_state",
+    "CombatAnimations": "tuxemon.states.combat.combat_animations",
+    "CombatState": "tuxemon.states.combat.combat",
+    "CombatTargetMenuState": "tuxemon.states.combat.combat_menus",
+    "ControlState": "tuxemon.states.control.control_state",
+    "CraftMenuState": "tuxemon.states.items.craft_menu",
+    "DialogState": "tuxemon.states.dialog",
+    "EvolutionTransition": "tuxemon.states.evolution",
+    "FadeInTransition": "tuxemon.states.transition.fade",
+    "FadeOutTransition": "tuxemon.states.transition.fade",
+    "FlashTransition": "tuxemon.states.transition.flash",
+    "HeadlessServerState": "tuxemon.states.headless",
+    "ImageState": "tuxemon.states.idle.image_state",
+    "InputMenu": "tuxemon.menu.input",
+    "ItemBoxState": "tuxemon.states.pc_locker",
+    "ItemDropOff": "tuxemon.states.pc_locker",
+    "ItemDropOffState": "tuxemon.states.pc_locker",
+    "ItemMenuState": "tuxemon.states.items.item_menu",
+    "ItemStorageState": "tuxemon.states.pc_locker",
+    "ItemTakeState": "tuxemon.states.pc_locker",
+    "JournalChoice": "tuxemon.states.journal.journal_choice",
+    "JournalInfoState": "tuxemon.states.journal.journal_info",
+    "JournalState": "tuxemon.states.journal.journal",
+    "LoadMenuState": "tuxemon.states.persistance.load_menu",
+    "MainCombatMenuState": "tuxemon.states.combat.combat_menus",
+    "MainParkMenuState": "tuxemon.states.combat.combat_menus_park",
+    "Menu": "tuxemon.menu.menu",
+    "MinigameState": "tuxemon.states.minigame",
+    "MissionState": "tuxemon.states.mission",
+    "ModsChoice": "tuxemon.states.start",
+    "MonsterBoxState": "tuxemon.states.pc_kennel",
+    "MonsterDropOff": "tuxemon.states.pc_kennel",
+    "MonsterDropOffState": "tuxemon.states.pc_kennel",
+    "MonsterInfoState": "tuxemon.states.monster_info",
+    "MonsterItemState": "tuxemon.states.monster_item",
+    "MonsterMenuState": "tuxemon.states.monster",
+    "MonsterMovesState": "tuxemon.states.monster_moves",
+    "MonsterStorageState": "tuxemon.states.pc_kennel",
+    "MonsterTakeState": "tuxemon.states.pc_kennel",
+    "MosaicTransition": "tuxemon.states.transition.mosaic",
+    "MultiplayerMenu": "tuxemon.states.multiplayer",
+    "MultiplayerSelect": "tuxemon.states.multiplayer",
+    "NegativeTransition": "tuxemon.states.transition.negative",
+    "NuPhone": "tuxemon.states.phone.phone",
+    "NuPhoneBanking": "tuxemon.states.phone.phone_banking",
+    "NuPhoneContacts": "tuxemon.states.phone.phone_contacts",
+    "NuPhoneMap": "tuxemon.states.phone.phone_map",
+    "PCState": "tuxemon.states.pc",
+    "ParkState": "tuxemon.states.park",
+    "PartyState": "tuxemon.states.party",
+    "PixelationTransition": "tuxemon.states.transition.pixelation",
+    "PopUpMenu": "tuxemon.menu.menu",
+    "PygameMenuState": "tuxemon.menu.menu",
+    "QuantityMenu": "tuxemon.menu.quantity",
+    "SaveMenuState": "tuxemon.states.persistance.save_menu",
+    "SetKeyState": "tuxemon.states.control.set_key_state",
+    "SetLanguage": "tuxemon.states.control.set_language",
+    "ShopBuyMenuState": "tuxemon.states.items.shop_menu",
+    "ShopMenuState": "tuxemon.states.items.shop_menu",
+    "ShopSellMenuState": "tuxemon.states.items.shop_menu",
+    "SingleMissionState": "tuxemon.states.mission",
+    "SinkState": "tuxemon.states.sink",
+    "SplashState": "tuxemon.states.splash",
+    "StartState": "tuxemon.states.start",
+    "State": "tuxemon.state",
+    "StaticTransition": "tuxemon.states.transition.static",
+    "SwirlTransition": "tuxemon.states.transition.swirl",
+    "TechniqueMenuState": "tuxemon.states.techniques",
+    "TeleporterState": "tuxemon.states.operations.teleporter",
+    "WaitForInputState": "tuxemon.states.combat.combat",
+    "WipeTransition": "tuxemon.states.transition.wipe",
+    "WorldMenuState": "tuxemon.states.world.world_menus",
+    "WorldState": "tuxemon.states.world.worldstate",
+    "ZoomInTransition": "tuxemon.states.transition.zoom",
+    "ZoomOutTransition": "tuxemon.states.transition.zoom",
+}
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import logging
 from base64 import b64decode
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from pygame import SRCALPHA
-from pygame.image import frombuffer
+from pygame.image import load as load_image
 from pygame.rect import Rect
 from pygame.surface import Surface
 from pygame.transform import smoothscale
@@ -17,13 +18,14 @@ from tuxemon import prepare, save
 from tuxemon.locale import T
 from tuxemon.menu.interface import MenuItem
 from tuxemon.menu.menu import PopUpMenu
-from tuxemon.save import get_save_path
+from tuxemon.save import get_header_path, get_save_path
+from tuxemon.save_worker import saver
 from tuxemon.tools import open_choice_dialog
 from tuxemon.ui.menu_options import ChoiceOption, MenuOptions
 from tuxemon.ui.text import draw_text
 
 if TYPE_CHECKING:
-    from tuxemon.save import SaveData
+    from tuxemon.save import SaveHeader
 
 logger = logging.getLogger(__name__)
 
@@ -40,14 +42,35 @@ class SaveMenuState(PopUpMenu[None]):
     def __init__(self, selected_index: Optional[int] = None) -> None:
         if selected_index is None:
             selected_index = save.slot_number or 0
+        # whether a slot is shown as being saved in the background
+        self.saving = False
         super().__init__(selected_index=selected_index)
 
+    def update(self, time_delta: float) -> None:
+        super().update(time_delta)
+        if self.saving and not saver.is_saving():
+            self.saving = False
+            self.menu_items.clear()
+            self.reload_items()
+
     def create_menu_item(
         self, slot_rect: Rect, slot_index: int, selectable: bool = True
     ) -> MenuItem[None]:
         save_path = Path(get_save_path(slot_index))
 
-        if save_path.exists():
+        if saver.is_saving(slot_index):
+            self.saving = True
+            saving_image = self.render_empty_slot(
+                slot_rect, T.translate("save_in_progress")
+            )
+            return MenuItem(
+                saving_image,
+                T.translate("save_in_progress"),
+                None,
+                None,
+                False,
+            )
+        elif save_path.exists():
             image = self.render_slot(slot_rect, slot_index)
             return MenuItem(image, T.translate("menu_save"), None, None, True)
         else:
@@ -68,12 +91,14 @@ class SaveMenuState(PopUpMenu[None]):
             item = self.create_menu_item(slot_rect, i + 1)
             self.add(item)
 
-    def render_empty_slot(self, rect: Rect) -> Surface:
+    def render_empty_slot(
+        self, rect: Rect, text: Optional[str] = None
+    ) -> Surface:
         slot_image = Surface(rect.size, SRCALPHA)
         rect = rect.move(0, rect.height // 2 - 10)
         draw_text(
             slot_image,
-            T.translate("empty_slot"),
+            T.translate("empty_slot") if text is None else text,
             rect,
             font=self.font,
         )
@@ -82,32 +107,28 @@ class SaveMenuState(PopUpMenu[None]):
     def render_slot(self, rect: Rect, slot_num: int) -> Surface:
         slot_image = Surface(rect.size, SRCALPHA)
 
-        # Load the save data
-        save_data = save.load(slot_num)
-        if not save_data:
+        # Load the save header, the full save is not needed here
+        header = save.load_header(slot_num)
+        if not header:
             logger.critical(f"Save data not found for slot {slot_num}.")
             raise RuntimeError(
                 f"Critical error: Save data missing for slot {slot_num}"
             )
 
         # Draw the thumbnail
-        thumb_image = self._get_thumbnail(save_data, rect)
+        thumb_image = self._get_thumbnail(header, rect)
         slot_image.blit(thumb_image, (rect.width * 0.20, 0))
 
         # Draw the slot text
         rect = rect.move(0, rect.height // 2 - 10)
-        self._draw_slot_text(slot_image, rect, slot_num, save_data)
+        self._draw_slot_text(slot_image, rect, slot_num, header)
 
         return slot_image
 
-    def _get_thumbnail(self, save_data: SaveData, rect: Rect) -> Surface:
-        if "screenshot" in save_data:
-            screenshot = b64decode(save_data["screenshot"])
-            size = (
-                save_data["screenshot_width"],
-                save_data["screenshot_height"],
-            )
-            thumb_image = frombuffer(screenshot, size, "RGB").convert()
+    def _get_thumbnail(self, header: SaveHeader, rect: Rect) -> Surface:
+        if "thumbnail" in header:
+            thumbnail = BytesIO(b64decode(header["thumbnail"]))
+            thumb_image = load_image(thumbnail, "png").convert()
             thumb_rect = thumb_image.get_rect().fit(rect)
             return smoothscale(thumb_image, thumb_rect.size)
         else:
@@ -123,7 +144,7 @@ class SaveMenuState(PopUpMenu[None]):
         slot_image: Surface,
         rect: Rect,
         slot_num: int,
-        save_data: SaveData,
+        header: SaveHeader,
     ) -> None:
         draw_text(
             slot_image,
@@ -135,13 +156,13 @@ class SaveMenuState(PopUpMenu[None]):
         x = int(rect.width * 0.5)
         draw_text(
             slot_image,
-            save_data["npc_state"]["player_name"],
+            header["player_name"],
             (x, 0, 500, 500),
             font=self.font,
         )
         draw_text(
             slot_image,
-            save_data["time"],
+            header["time"],
             (x, 50, 500, 500),
             font=self.font,
         )
@@ -193,8 +214,8 @@ class SaveMenuState(PopUpMenu[None]):
             menu = MenuOptions(options)
             open_choice_dialog(self.client, menu, escape_key_exits=True)
 
-        save_data = save.load(self.selected_index + 1)
-        if save_data:
+        header = save.load_header(self.selected_index + 1)
+        if header:
             ask_confirmation()
         else:
             self.client.remove_state_by_name("SaveMenuState")
@@ -211,11 +232,13 @@ def delete_save_slot(slot_num: int) -> bool:
     Returns:
         bool: True if the save file was deleted successfully, False otherwise.
     """
+    saver.wait(slot_num)
     save_path = Path(get_save_path(slot_num))
 
     if save_path.exists():
         try:
             save_path.unlink()
+            get_header_path(slot_num).unlink(missing_ok=True)
             logger.info(
                 f"Save slot {slot_num} deleted successfully at path {save_path}."
             )
@@ -12,6 +12,7 @@ from typing import (
     no_type_check,
 )
 
+from pygame.rect import Rect
 from pygame.surface import Surface
 
 from tuxemon import networking, prepare
@@ -49,6 +50,8 @@ class WorldSave(TypedDict, total=False):
 class WorldState(State):
     """The state responsible for the world game play"""
 
+    cache_backdrop = True
+
     def __init__(self, session: Session, map_name: str) -> None:
         super().__init__()
         self.session = session
@@ -64,6 +67,8 @@ class WorldState(State):
         self.camera = Camera(self.player, self.client.boundary)
         self.client.camera_manager.add_camera(self.camera)
         self.map_renderer = MapRenderer(self.client)
+        # what the last drawn frame depends on, with dirty rectangles
+        self._drawn_signature: Optional[Any] = None
 
         if map_name:
             self.client.map_transition.change_map(map_name)
@@ -137,6 +142,34 @@ class WorldState(State):
             raise ValueError("Unable to draw the game world.")
         self.map_renderer.draw(surface, self.client.map_manager.current_map)
         self.transition_manager.draw(surface)
+        if prepare.CONFIG.dirty_rects:
+            self._drawn_signature = self._get_draw_signature()
+
+    def _get_draw_signature(self) -> Optional[Any]:
+        current_map = self.client.map_manager.current_map
+        if (
+            current_map is None
+            or self.animations
+            or self.transition_manager.in_transition
+        ):
+            return None
+        return self.map_renderer.get_signature(current_map)
+
+    def get_backdrop_key(self) -> Optional[Any]:
+        # the world keeps updating under other states: NPCs walk, the
+        # camera follows them and tiles may be animated
+        key = super().get_backdrop_key()
+        signature = self._get_draw_signature()
+        if key is None or signature is None:
+            return None
+        return key, signature
+
+    def get_dirty_rects(self) -> Optional[list[Rect]]:
+        if self._drawn_signature is None:
+            return None
+        if self._get_draw_signature() != self._drawn_signature:
+            return None
+        return []
 
     def process_event(self, event: PlayerInput) -> Optional[PlayerInput]:
         """
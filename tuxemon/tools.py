@@ -13,6 +13,7 @@ import logging
 import typing
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import fields
+from functools import cache
 from operator import add, eq, floordiv, ge, gt, le, lt, mul, ne, sub
 from typing import (
     TYPE_CHECKING,
@@ -334,21 +335,59 @@ def get_types_tuple(
         return (param_type,)
 
 
+@cache
+def get_dataclass_constructors(
+    cls: type[Any],
+) -> Sequence[tuple[str, Sequence[ValidParameterSingleType]]]:
+    """
+    Returns the type constructors of the __init__ fields of a dataclass.
+
+    Resolving the type hints is slow, so it is only done once per class.
+
+    Parameters:
+        cls: The dataclass.
+
+    Returns:
+        Pairs of field name and type constructors, e.g.
+        ``("map_name", (str, NoneType))``.
+    """
+    type_hints = typing.get_type_hints(cls)
+    return tuple(
+        (field.name, get_types_tuple(type_hints[field.name]))
+        for field in fields(cls)
+        if field.init
+    )
+
+
 def cast_dataclass_parameters(self: Any) -> None:
     """
     Takes a dataclass object and casts its __init__ values to the correct type
     """
-    type_hints = typing.get_type_hints(self.__class__)
-    for field in fields(self):
-        if field.init:
-            field_name = field.name  # e.g "map_name"
-            type_hint = type_hints[field_name]  # e.g. Optional[str]
-            constructors = get_types_tuple(
-                type_hint
-            )  # e.g. (<class 'str'>, <class 'NoneType'>)
-            old_value = getattr(self, field_name)
-            new_value = cast_value(((constructors, field_name), old_value))
-            setattr(self, field_name, new_value)
+    for field_name, constructors in get_dataclass_constructors(self.__class__):
+        old_value = getattr(self, field_name)
+        new_value = cast_value(((constructors, field_name), old_value))
+        setattr(self, field_name, new_value)
+
+
+def add_slots(cls: type[TVar]) -> type[TVar]:
+    """
+    Returns a copy of a dataclass that keeps its fields in ``__slots__``.
+
+    The instances have no ``__dict__``, so they use less memory. This is
+    what ``dataclass(slots=True)`` does, which needs Python 3.10.
+
+    Parameters:
+        cls: The dataclass.
+
+    Returns:
+        The slotted dataclass.
+    """
+    names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = names
+    for name in (*names, "__dict__", "__weakref__"):
+        cls_dict.pop(name, None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
 
 
 def show_result_as_dialog(
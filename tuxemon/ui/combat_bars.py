@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import MutableMapping
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pygame.rect import Rect
 
@@ -100,6 +100,17 @@ class CombatBars:
         self.draw_hp_bars(hud)
         self.draw_exp_bars(hud)
 
+    def get_signature(self) -> Any:
+        """Returns the values of the bars, which are drawn on the huds."""
+        return (
+            tuple(
+                (monster, bar.value) for monster, bar in self._hp_bars.items()
+            ),
+            tuple(
+                (monster, bar.value) for monster, bar in self._exp_bars.items()
+            ),
+        )
+
     def get_hp_bar(self, monster: Monster) -> HpBar:
         """Returns the HP bar for a given monster."""
         return self._hp_bars.setdefault(monster, HpBar(0))
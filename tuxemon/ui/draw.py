@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import logging
 import math
+from collections import OrderedDict
 from collections.abc import Callable, Generator, Iterable, Sequence
 from itertools import product
-from typing import Optional
+from typing import Optional, Union
+from weakref import WeakKeyDictionary
 
 from pygame import SRCALPHA
+from pygame.color import Color
 from pygame.font import Font
 from pygame.rect import Rect
 from pygame.surface import Surface
@@ -267,6 +270,8 @@ def iter_render_text(
             font=font,
         )
 
+    atlas = text_renderer.get_atlas(fg=fg, bg=bg)
+
     for line_index, line in enumerate(lines):
         # Adjust `top` based on the vertical alignment
         top = rect.top + line_index * line_height + vertical_offset
@@ -279,15 +284,14 @@ def iter_render_text(
         else:
             offset = 0
 
-        for scrap in build_line(line):
-            if scrap[-1] == " ":
+        for char, position in zip(line, atlas.positions(line)):
+            if char == " ":
                 # No need to blit a white sprite onto a white background
                 continue
-            dirty_length = font.size(scrap[:-1])[0]
-            surface = text_renderer.shadow_text(scrap[-1], bg=bg, fg=fg)
+            surface = atlas.glyph(char)
             update_rect = surface.get_rect(
                 top=top,
-                left=rect.left + dirty_length + offset,
+                left=rect.left + position + offset,
             )
             yield update_rect, surface
 
@@ -371,6 +375,127 @@ def layout_func(scale: float) -> Callable[[Sequence[float]], Sequence[float]]:
 layout = layout_func(prepare.SCALE)
 
 
+# most shadowed strings and glyph atlases kept, shared by all the renderers
+TEXT_CACHE_SIZE = 512
+ATLAS_CACHE_SIZE = 32
+
+ColorKey = tuple[int, int, int, int]
+# the default fonts are told apart by file and size, the others by identity
+FontKey = Union[Font, tuple[Optional[str], int]]
+AtlasKey = tuple[FontKey, ColorKey, ColorKey, tuple[float, float]]
+ShadowKey = tuple[FontKey, str, ColorKey, ColorKey, tuple[float, float]]
+
+_shadow_cache: OrderedDict[ShadowKey, Surface] = OrderedDict()
+_atlases: OrderedDict[AtlasKey, GlyphAtlas] = OrderedDict()
+_default_font_keys: WeakKeyDictionary[Font, tuple[Optional[str], int]] = (
+    WeakKeyDictionary()
+)
+
+
+def _color_key(color: ColorLike) -> ColorKey:
+    r, g, b, a = Color(color)
+    return r, g, b, a
+
+
+def clear_text_cache() -> None:
+    """Drops all the rendered text and glyph atlases."""
+    _shadow_cache.clear()
+    _atlases.clear()
+
+
+class GlyphAtlas:
+    """
+    Shadowed glyphs of a font for a pair of colors.
+
+    Each glyph is rendered once and shared, so the surfaces returned by
+    ``glyph`` must not be modified. The advance of each pair of characters,
+    which includes the kerning, is also kept to lay out lines in linear time.
+
+    Parameters:
+        text_renderer: The text renderer used to render the glyphs.
+        fg: The foreground color of the glyphs.
+        bg: The shadow color of the glyphs.
+        offset: The shadow offset of the glyphs.
+    """
+
+    def __init__(
+        self,
+        text_renderer: TextRenderer,
+        fg: ColorLike,
+        bg: ColorLike,
+        offset: tuple[float, float] = (0.5, 0.5),
+    ) -> None:
+        self.text_renderer = text_renderer
+        self.font = text_renderer.font
+        self.fg = fg
+        self.bg = bg
+        self.offset = offset
+        self._glyphs: dict[str, Surface] = {}
+        self._widths: dict[str, int] = {}
+        self._advances: dict[tuple[str, str], int] = {}
+
+    def glyph(self, char: str) -> Surface:
+        """
+        Returns the shadowed surface of a character.
+
+        Parameters:
+            char: The character.
+
+        Returns:
+            The shared surface of the glyph.
+        """
+        surface = self._glyphs.get(char)
+        if surface is None:
+            surface = self.text_renderer.render_shadow_text(
+                char, self.bg, self.fg, self.offset
+            )
+            self._glyphs[char] = surface
+        return surface
+
+    def width(self, char: str) -> int:
+        width = self._widths.get(char)
+        if width is None:
+            width = self.font.size(char)[0]
+            self._widths[char] = width
+        return width
+
+    def advance(self, char: str, next_char: str) -> int:
+        """
+        Returns how far the next character is drawn from a character.
+
+        Parameters:
+            char: The character.
+            next_char: The character drawn after it.
+
+        Returns:
+            The advance of the character, kerning included.
+        """
+        pair = (char, next_char)
+        advance = self._advances.get(pair)
+        if advance is None:
+            advance = self.font.size(char + next_char)[0]
+            advance -= self.width(next_char)
+            self._advances[pair] = advance
+        return advance
+
+    def positions(self, line: str) -> list[int]:
+        """
+        Returns the horizontal position of each character of a line.
+
+        Parameters:
+            line: The line of text.
+
+        Returns:
+            The position of each character, relative to the start of the line.
+        """
+        positions = [0] * len(line)
+        x = 0
+        for index in range(1, len(line)):
+            x += self.advance(line[index - 1], line[index])
+            positions[index] = x
+        return positions
+
+
 class TextRenderer:
     def __init__(
         self,
@@ -383,7 +508,12 @@ class TextRenderer:
         if font_shadow_color is None:
             font_shadow_color = prepare.FONT_SHADOW_COLOR
         self.font_shadow_color = font_shadow_color
-        self.font = font or Font(font_filename, tools.scale(5))
+        if font is None:
+            size = tools.scale(5)
+            font = Font(font_filename, size)
+            _default_font_keys[font] = (font_filename, size)
+        self.font = font
+        self.font_key: FontKey = _default_font_keys.get(font, font)
 
     def shadow_text(
         self,
@@ -395,6 +525,30 @@ class TextRenderer:
         """
         Render shadowed text using the current font and shadow color settings.
 
+        Parameters:
+            text: The text string to render.
+            bg: Shadow color. If None, uses the default font shadow color.
+            fg: Foreground font color. If None, uses the default font color.
+            offset: Tuple representing the x and y shadow offset in pixels.
+
+        Returns:
+            A Surface containing the rendered text with its shadow applied.
+        """
+        return self.cached_shadow_text(text, bg, fg, offset).copy()
+
+    def cached_shadow_text(
+        self,
+        text: str,
+        bg: Optional[ColorLike] = None,
+        fg: Optional[ColorLike] = None,
+        offset: tuple[float, float] = (0.5, 0.5),
+    ) -> Surface:
+        """
+        Render shadowed text, reusing the surfaces rendered recently.
+
+        The returned surface is shared with the other callers rendering the
+        same text, so it must not be modified.
+
         Parameters:
             text: The text string to render.
             bg: Shadow color. If None, uses the default font shadow color.
@@ -408,6 +562,31 @@ class TextRenderer:
             fg = self.font_color
         if not bg:
             bg = self.font_shadow_color
+        key = (
+            self.font_key,
+            text,
+            _color_key(fg),
+            _color_key(bg),
+            (offset[0], offset[1]),
+        )
+        image = _shadow_cache.get(key)
+        if image is not None:
+            _shadow_cache.move_to_end(key)
+            return image
+
+        image = self.render_shadow_text(text, bg, fg, offset)
+        _shadow_cache[key] = image
+        if len(_shadow_cache) > TEXT_CACHE_SIZE:
+            _shadow_cache.popitem(last=False)
+        return image
+
+    def render_shadow_text(
+        self,
+        text: str,
+        bg: ColorLike,
+        fg: ColorLike,
+        offset: tuple[float, float],
+    ) -> Surface:
         font_color = self.font.render(text, True, fg)
         shadow_color = self.font.render(text, True, bg)
         _offset = layout(offset)
@@ -420,6 +599,44 @@ class TextRenderer:
         image.blit(font_color, (0, 0))
         return image
 
+    def get_atlas(
+        self,
+        bg: Optional[ColorLike] = None,
+        fg: Optional[ColorLike] = None,
+        offset: tuple[float, float] = (0.5, 0.5),
+    ) -> GlyphAtlas:
+        """
+        Returns the glyph atlas of the font for a pair of colors.
+
+        Parameters:
+            bg: Shadow color. If None, uses the default font shadow color.
+            fg: Foreground font color. If None, uses the default font color.
+            offset: Tuple representing the x and y shadow offset in pixels.
+
+        Returns:
+            The glyph atlas, shared by the renderers using the same font.
+        """
+        if not fg:
+            fg = self.font_color
+        if not bg:
+            bg = self.font_shadow_color
+        key = (
+            self.font_key,
+            _color_key(fg),
+            _color_key(bg),
+            (offset[0], offset[1]),
+        )
+        atlas = _atlases.get(key)
+        if atlas is not None:
+            _atlases.move_to_end(key)
+            return atlas
+
+        atlas = GlyphAtlas(self, fg, bg, offset)
+        _atlases[key] = atlas
+        if len(_atlases) > ATLAS_CACHE_SIZE:
+            _atlases.popitem(last=False)
+        return atlas
+
 
 class MultilineTextRenderer:
     def __init__(
@@ -453,7 +670,7 @@ class MultilineTextRenderer:
                     lines_to_render.append(
                         (
                             " ".join(current_line_words),
-                            self.text_renderer.shadow_text(
+                            self.text_renderer.cached_shadow_text(
                                 " ".join(current_line_words)
                             ).get_height(),
                         )
@@ -466,7 +683,7 @@ class MultilineTextRenderer:
                 lines_to_render.append(
                     (
                         " ".join(current_line_words),
-                        self.text_renderer.shadow_text(
+                        self.text_renderer.cached_shadow_text(
                             " ".join(current_line_words)
                         ).get_height(),
                     )
@@ -479,7 +696,7 @@ class MultilineTextRenderer:
         rendered_surfaces = []
         for i, (line_text, height) in enumerate(lines_to_render):
             if line_text == "":
-                empty_line_surface = self.text_renderer.shadow_text(
+                empty_line_surface = self.text_renderer.cached_shadow_text(
                     " ",
                     fg=self.text_renderer.font_color,
                     bg=self.text_renderer.font_shadow_color,
@@ -489,7 +706,7 @@ class MultilineTextRenderer:
                 )
             else:
                 rendered_surfaces.append(
-                    (self.text_renderer.shadow_text(line_text), height)
+                    (self.text_renderer.cached_shadow_text(line_text), height)
                 )
 
             # Add extra space between lines
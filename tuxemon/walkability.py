@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from tuxemon.db import Direction
+
+# bit used for each direction in a tile exit mask
+DIRECTION_BITS: dict[Direction, int] = {
+    Direction.up: 1,
+    Direction.down: 2,
+    Direction.left: 4,
+    Direction.right: 8,
+}
+ALL_DIRECTIONS = 0b1111
+
+_OFFSETS: dict[Direction, tuple[int, int]] = {
+    Direction.up: (0, -1),
+    Direction.down: (0, 1),
+    Direction.left: (-1, 0),
+    Direction.right: (1, 0),
+}
+
+# mask => directions (and their offsets) allowed by the mask
+_EXITS_BY_MASK: tuple[tuple[tuple[Direction, tuple[int, int]], ...], ...] = (
+    tuple(
+        tuple(
+            (direction, _OFFSETS[direction])
+            for direction, bit in DIRECTION_BITS.items()
+            if mask & bit
+        )
+        for mask in range(ALL_DIRECTIONS + 1)
+    )
+)
+
+
+class WalkabilityGrid:
+    """
+    Precomputed exit directions of every tile of a map.
+
+    Each tile holds a bitmask of the directions in which it can be left,
+    taking into account the edges of the map and the collision lines
+    (walls) between tiles. The masks are stored one byte per tile, so
+    the neighbour query used by the pathfinder is a single index lookup
+    instead of a series of set and boundary checks.
+
+    Collision regions are not part of the grid because they change while
+    the map is played; they are handled by the collision manager.
+
+    Parameters:
+        map_size: The size of the map (width, height).
+        collision_lines_map: The walls of the map, as tile and direction
+            pairs that cannot be crossed.
+    """
+
+    def __init__(
+        self,
+        map_size: tuple[int, int],
+        collision_lines_map: Iterable[tuple[tuple[int, int], Direction]] = (),
+    ) -> None:
+        self.width, self.height = map_size
+        self._masks = bytearray(self.width * self.height)
+        self._build(collision_lines_map)
+
+    def _build(
+        self, collision_lines_map: Iterable[tuple[tuple[int, int], Direction]]
+    ) -> None:
+        width, height = self.width, self.height
+        masks = self._masks
+        for y in range(height):
+            row_mask = ALL_DIRECTIONS
+            if y == 0:
+                row_mask &= ~DIRECTION_BITS[Direction.up]
+            if y == height - 1:
+                row_mask &= ~DIRECTION_BITS[Direction.down]
+            offset = y * width
+            masks[offset : offset + width] = bytes([row_mask]) * width
+            if width:
+                masks[offset] &= ~DIRECTION_BITS[Direction.left]
+                masks[offset + width - 1] &= ~DIRECTION_BITS[Direction.right]
+
+        for (x, y), direction in collision_lines_map:
+            if 0 <= x < width and 0 <= y < height:
+                masks[y * width + x] &= ~DIRECTION_BITS[direction]
+
+    def get_exit_mask(self, position: tuple[int, int]) -> int:
+        """
+        Returns the exit bitmask of a tile.
+
+        Parameters:
+            position: The tile coordinates (x, y).
+
+        Returns:
+            The bitmask of the directions the tile can be left in, 0 for
+            tiles outside of the map.
+        """
+        x, y = position
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._masks[y * self.width + x]
+        return 0
+
+    def can_exit(
+        self, position: tuple[int, int], direction: Direction
+    ) -> bool:
+        """
+        Checks whether a tile can be left in the given direction.
+
+        Parameters:
+            position: The tile coordinates (x, y).
+            direction: The direction of the move.
+
+        Returns:
+            True if no wall or map edge blocks the move.
+        """
+        return bool(self.get_exit_mask(position) & DIRECTION_BITS[direction])
+
+    def get_neighbors(
+        self, position: tuple[int, int]
+    ) -> Sequence[tuple[Direction, tuple[int, int]]]:
+        """
+        Returns the neighbours that can be reached from a tile.
+
+        Parameters:
+            position: The tile coordinates (x, y).
+
+        Returns:
+            Pairs of direction and neighbouring tile that are not blocked by
+            a wall or the edge of the map.
+        """
+        x, y = position
+        return [
+            (direction, (x + dx, y + dy))
+            for direction, (dx, dy) in _EXITS_BY_MASK[
+                self.get_exit_mask(position)
+            ]
+        ]
+
+    def __repr__(self) -> str:
+        return f"WalkabilityGrid(width={self.width}, height={self.height})"